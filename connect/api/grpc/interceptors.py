@@ -0,0 +1,65 @@
+import grpc
+from django.db import close_old_connections
+
+
+def _wrap_unary_response(behavior):
+    def wrapper(request_or_iterator, context):
+        close_old_connections()
+        try:
+            return behavior(request_or_iterator, context)
+        finally:
+            close_old_connections()
+
+    return wrapper
+
+
+def _wrap_stream_response(behavior):
+    def wrapper(request_or_iterator, context):
+        close_old_connections()
+        try:
+            yield from behavior(request_or_iterator, context)
+        finally:
+            close_old_connections()
+
+    return wrapper
+
+
+class DatabaseConnectionInterceptor(grpc.ServerInterceptor):
+    """Applies Django's request connection lifecycle to every RPC.
+
+    The gRPC server runs handlers on a thread pool, outside of Django's
+    request/response cycle, so nothing closes connections that are broken or
+    older than ``CONN_MAX_AGE``. Each RPC now starts and ends with
+    ``close_old_connections``, the same hooks Django runs around HTTP
+    requests. Streaming handlers are wrapped until the stream is consumed,
+    since their queries run while the response is iterated.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                _wrap_unary_response(handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                _wrap_unary_response(handler.stream_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                _wrap_stream_response(handler.unary_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return grpc.stream_stream_rpc_method_handler(
+            _wrap_stream_response(handler.stream_stream),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
@@ -1,21 +1,28 @@
-from connect.common.models import Organization
+import grpc
 from weni.protobuf.connect.organization_pb2 import OrganizationResponse
 from django_grpc_framework import generics
 
+from connect.usecases.project.exceptions import ProjectNotFoundError
+from connect.usecases.project.resolve_flow_organizations import (
+    ResolveFlowOrganizationsUseCase,
+)
+
 
 class OrganizationService(generics.GenericService):
     def Retrieve(self, request, context):
 
         flow_organization_uuid = request.uuid
-        organization = Organization.objects.get(
-            project__flow_organization=flow_organization_uuid
-        )
+        try:
+            mapping = ResolveFlowOrganizationsUseCase().execute(flow_organization_uuid)
+        except ProjectNotFoundError:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Organization not found")
 
+        organization = mapping["organization"]
         return OrganizationResponse(
-            uuid=str(organization.uuid),
-            name=organization.name,
-            description=organization.description,
-            inteligence_organization=organization.inteligence_organization,
-            extra_integration=organization.extra_integration,
-            is_suspended=organization.is_suspended,
+            uuid=organization["uuid"],
+            name=organization["name"],
+            description=organization["description"],
+            inteligence_organization=organization["inteligence_organization"],
+            extra_integration=organization["extra_integration"],
+            is_suspended=organization["is_suspended"],
         )
@@ -2,7 +2,10 @@ from django_grpc_framework.proto_serializers import ProtoSerializer
 from rest_framework import serializers
 from google.protobuf import empty_pb2
 
-from connect.common.models import Project
+from connect.usecases.project.exceptions import ProjectNotFoundError
+from connect.usecases.project.resolve_flow_organizations import (
+    ResolveFlowOrganizationsUseCase,
+)
 from weni.protobuf.connect import project_pb2
 
 
@@ -11,8 +14,8 @@ class ClassifierRequestSerializer(ProtoSerializer):
 
     def validate_project_uuid(self, value):
         try:
-            Project.objects.get(uuid=value)
-        except Project.DoesNotExist:
+            ResolveFlowOrganizationsUseCase().execute_for_project(value)
+        except ProjectNotFoundError:
             raise serializers.ValidationError("This project does not exist")
         return value
 
@@ -13,6 +13,10 @@ from connect.api.grpc.project.serializers import (
     CreateWACChannelRequestSerializer,
 )
 from connect.common.models import Project
+from connect.usecases.project.exceptions import ProjectNotFoundError
+from connect.usecases.project.resolve_flow_organizations import (
+    ResolveFlowOrganizationsUseCase,
+)
 from weni.protobuf.connect.project_pb2 import (
     ClassifierResponse,
     ChannelListResponse,
@@ -23,17 +27,23 @@ from weni.protobuf.connect.project_pb2 import (
 class ProjectService(
     generics.GenericService,
 ):
+    def get_flow_mapping(self, project_uuid):
+        try:
+            return ResolveFlowOrganizationsUseCase().execute_for_project(project_uuid)
+        except ProjectNotFoundError:
+            self.context.abort(grpc.StatusCode.NOT_FOUND, "Project not found")
+
     def Classifier(self, request, context):
         serializer = ClassifierRequestSerializer(message=request)
 
         if serializer.is_valid(raise_exception=True):
             project_uuid = serializer.validated_data.get("project_uuid")
 
-            project = Project.objects.get(uuid=project_uuid)
+            mapping = self.get_flow_mapping(project_uuid)
 
             grpc_instance = utils.get_grpc_types().get("flow")
             response = grpc_instance.get_classifiers(
-                project_uuid=str(project.flow_organization),
+                project_uuid=str(mapping["flow_organization"]),
                 classifier_type="bothub",
                 is_active=True,
             )
@@ -53,11 +63,11 @@ class ProjectService(
         if serializer.is_valid(raise_exception=True):
             project_uuid = serializer.validated_data.get("project_uuid")
 
-            project = Project.objects.get(uuid=project_uuid)
+            mapping = self.get_flow_mapping(project_uuid)
 
             grpc_instance = utils.get_grpc_types().get("flow")
             response = grpc_instance.create_classifier(
-                project_uuid=str(project.flow_organization),
+                project_uuid=str(mapping["flow_organization"]),
                 user_email=serializer.validated_data.get("user"),
                 classifier_type="bothub",
                 classifier_name=serializer.validated_data.get("name"),
@@ -112,14 +122,14 @@ class ProjectService(
         if serializer.is_valid(raise_exception=True):
             project_uuid = serializer.validated_data.get("project_uuid")
 
-            project = Project.objects.get(uuid=project_uuid)
+            mapping = self.get_flow_mapping(project_uuid)
 
             grpc_instance = utils.get_grpc_types().get("flow")
 
             try:
                 response = grpc_instance.create_channel(
                     user=serializer.validated_data.get("user"),
-                    project_uuid=str(project.uuid),
+                    project_uuid=mapping["project_uuid"],
                     data=serializer.validated_data.get("data"),
                     channeltype_code=serializer.validated_data.get("channeltype_code"),
                 )
@@ -142,14 +152,14 @@ class ProjectService(
         if serializer.is_valid(raise_exception=True):
             project_uuid = serializer.validated_data.get("project_uuid")
 
-            project = Project.objects.get(uuid=project_uuid)
+            mapping = self.get_flow_mapping(project_uuid)
 
             grpc_instance = utils.get_grpc_types().get("flow")
 
             try:
                 response = grpc_instance.create_wac_channel(
                     user=serializer.validated_data.get("user"),
-                    flow_organization=str(project.flow_organization),
+                    flow_organization=str(mapping["flow_organization"]),
                     config=serializer.validated_data.get("config"),
                     phone_number_id=serializer.validated_data.get("phone_number_id"),
                 )
@@ -182,9 +192,12 @@ class ProjectService(
         grpc_instance = utils.get_grpc_types().get("flow")
         channel_type = getattr(request, "channel_type")
 
-        for project in Project.objects.all():
+        # Only two columns are needed; load them up front so no cursor stays
+        # open while the Flows calls stream.
+        projects = list(Project.objects.values_list("uuid", "flow_organization"))
+        for project_uuid, flow_organization in projects:
             response = grpc_instance.list_channel(
-                project_uuid=str(project.flow_organization),
+                project_uuid=str(flow_organization),
                 channel_type=channel_type,
             )
 
@@ -194,5 +207,5 @@ class ProjectService(
                     name=channel.name,
                     config=channel.config,
                     address=channel.address,
-                    project_uuid=str(project.uuid),
+                    project_uuid=str(project_uuid),
                 )
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+import grpc
+from django.test import SimpleTestCase
+
+from connect.api.grpc.interceptors import DatabaseConnectionInterceptor
+
+
+@patch("connect.api.grpc.interceptors.close_old_connections")
+class DatabaseConnectionInterceptorTestCase(SimpleTestCase):
+    def intercept(self, handler):
+        return DatabaseConnectionInterceptor().intercept_service(
+            lambda details: handler, MagicMock()
+        )
+
+    def test_unary_handler_closes_connections_around_call(self, mock_close):
+        handler = grpc.unary_unary_rpc_method_handler(
+            lambda request, context: mock_close.call_count
+        )
+
+        response = self.intercept(handler).unary_unary("request", MagicMock())
+
+        self.assertEqual(response, 1)
+        self.assertEqual(mock_close.call_count, 2)
+
+    def test_stream_handler_closes_connections_after_stream(self, mock_close):
+        def stream(request, context):
+            yield "first"
+            yield "second"
+
+        handler = grpc.unary_stream_rpc_method_handler(stream)
+        responses = self.intercept(handler).unary_stream("request", MagicMock())
+
+        self.assertEqual(next(responses), "first")
+        self.assertEqual(mock_close.call_count, 1)
+        self.assertEqual(list(responses), ["second"])
+        self.assertEqual(mock_close.call_count, 2)
+
+    def test_unknown_method_is_passed_through(self, mock_close):
+        self.assertIsNone(self.intercept(None))
@@ -0,0 +1,106 @@
+from connect.common.models import (
+    Organization,
+    OrganizationAuthorization,
+    Project,
+    ProjectAuthorization,
+)
+
+
+class AuthorizationResolver:
+    """Request-scoped lookup of the user's organization and project authorizations.
+
+    Permission classes and serializers ask for the same authorization several
+    times per object (and once per object on list endpoints). The resolver
+    loads all of the user's ``OrganizationAuthorization`` rows in one query,
+    and all of their ``ProjectAuthorization`` rows in another, the first time
+    each kind is needed, then answers from memory.
+
+    Lookups mirror ``Organization.get_user_authorization`` and
+    ``Project.get_user_authorization``, including the exceptions they raise.
+    A miss falls back to a direct query, so rows created later in the same
+    request (e.g. by ``create``) are still found.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._organization_authorizations = None
+        self._project_authorizations = None
+
+    def invalidate(self) -> None:
+        self._organization_authorizations = None
+        self._project_authorizations = None
+
+    def _load_organization_authorizations(self) -> dict:
+        if self._organization_authorizations is None:
+            self._organization_authorizations = {
+                authorization.organization_id: authorization
+                for authorization in OrganizationAuthorization.objects.filter(
+                    user=self.user
+                )
+            }
+        return self._organization_authorizations
+
+    def _load_project_authorizations(self) -> dict:
+        if self._project_authorizations is None:
+            self._project_authorizations = {
+                authorization.project_id: authorization
+                for authorization in ProjectAuthorization.objects.filter(
+                    user=self.user
+                ).select_related("rocket_authorization", "chats_authorization")
+            }
+        return self._project_authorizations
+
+    def get_organization_authorization(
+        self, organization: Organization
+    ) -> OrganizationAuthorization:
+        if self.user.is_anonymous:
+            return organization.get_user_authorization(self.user)
+
+        authorizations = self._load_organization_authorizations()
+        authorization = authorizations.get(organization.pk)
+        if authorization is None:
+            authorization = organization.get_user_authorization(self.user)
+            authorizations[organization.pk] = authorization
+
+        # Serializers read ``authorization.user``; reuse the request user.
+        authorization.user = self.user
+        return authorization
+
+    def get_project_authorization(self, project: Project) -> ProjectAuthorization:
+        if self.user.is_anonymous:
+            return project.get_user_authorization(self.user)
+
+        organization_authorization = self._load_organization_authorizations().get(
+            project.organization_id
+        )
+        authorizations = self._load_project_authorizations()
+        authorization = authorizations.get(project.pk)
+
+        if (
+            authorization is None
+            or organization_authorization is None
+            or authorization.organization_authorization_id
+            != organization_authorization.pk
+        ):
+            # Raises the same exception as the model when it is really missing.
+            authorization = project.get_user_authorization(self.user)
+            authorizations[project.pk] = authorization
+
+        authorization.user = self.user
+        return authorization
+
+
+def get_authorization_resolver(request) -> AuthorizationResolver:
+    """Return the resolver memoized on ``request`` for its current user.
+
+    The resolver is stored on the underlying ``HttpRequest`` so permission
+    classes and serializers share it whether they hold the DRF ``Request``
+    or the Django one.
+    """
+    underlying = getattr(request, "_request", request)
+    user = request.user
+    resolver = getattr(underlying, "_authorization_resolver", None)
+    if resolver is None or resolver.user is not user:
+        resolver = AuthorizationResolver(user)
+        underlying._authorization_resolver = resolver
+    return resolver
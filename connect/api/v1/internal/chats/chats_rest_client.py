@@ -1,7 +1,6 @@
 from django.conf import settings
 
-import requests
-
+from connect.api.v1.internal.http_client import internal_http_client
 from connect.api.v1.internal.internal_authentication import InternalAuthentication
 from connect.common.models import ProjectAuthorization, ProjectRole
 
@@ -42,7 +41,7 @@ class ChatsRESTClient:
             raise Exception("User role not found")
 
         body = dict(role=chats_role, user=user_email, project=project_uuid)
-        requests.put(
+        internal_http_client.put(
             url=f"{self.base_url}/v1/internal/permission/project/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -51,7 +50,7 @@ class ChatsRESTClient:
 
     def update_user_language(self, user_email: str, language: str):
         body = dict(language=language)
-        requests.put(
+        internal_http_client.put(
             url=f"{self.base_url}/v1/internal/user/language/?email={user_email}",
             headers=self.authentication_instance.headers,
             json=body,
@@ -76,7 +75,7 @@ class ChatsRESTClient:
         if photo_url:
             body.update(dict(photo_url=photo_url))
 
-        requests.post(
+        internal_http_client.post(
             url=f"{self.base_url}/v1/internal/user/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -99,7 +98,7 @@ class ChatsRESTClient:
             is_template=is_template,
             user_email=user_email,
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/v1/internal/project/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -107,7 +106,7 @@ class ChatsRESTClient:
         return response
 
     def delete_chat(self, project_uuid: str):
-        requests.delete(
+        internal_http_client.delete(
             url=f"{self.base_url}/v1/internal/project/{project_uuid}/",
             headers=self.authentication_instance.headers,
         )
@@ -128,7 +127,7 @@ class ChatsRESTClient:
             user=user_email,
             project=str(project_uuid),
         )
-        requests.post(
+        internal_http_client.post(
             url=f"{self.base_url}/v1/internal/permission/project/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -145,7 +144,7 @@ class ChatsRESTClient:
             timezone=str(project.timezone),
             date_format=project.date_format,
         )
-        requests.patch(
+        internal_http_client.patch(
             url=f"{self.base_url}/v1/internal/project/{project_uuid}/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -160,7 +159,7 @@ class ChatsRESTClient:
             project=str(project_uuid),
             role=self.permission_mapper.get(permission, 0),
         )
-        requests.delete(
+        internal_http_client.delete(
             url=f"{self.base_url}/v1/internal/permission/project/",
             headers=self.authentication_instance.headers,
             json=body,
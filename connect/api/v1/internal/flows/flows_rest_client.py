@@ -1,11 +1,14 @@
 from django.conf import settings
 
+import logging
 import os
-import requests
 
+from connect.api.v1.internal.http_client import internal_http_client
 from connect.api.v1.internal.internal_authentication import InternalAuthentication
 from connect.api.v1.internal.flows.helpers import add_classifier_to_flow
 
+logger = logging.getLogger(__name__)
+
 
 class FlowsRESTClient:
     def __init__(self):
@@ -30,7 +33,7 @@ class FlowsRESTClient:
             user_email=user_email,
             uuid=project_uuid,
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/template-orgs/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -56,7 +59,7 @@ class FlowsRESTClient:
             sample_flow=sample_flow,
             classifier_uuid=classifier_uuid,
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/flows/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -77,7 +80,7 @@ class FlowsRESTClient:
             uuid=project_uuid,
         )
 
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/orgs/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -88,7 +91,7 @@ class FlowsRESTClient:
     def delete_project(self, project_uuid: int, user_email: str):
         body = dict(user_email=user_email)
 
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}/api/v2/internals/orgs/{project_uuid}/",
             headers=self.authentication_instance.headers,
             params=body,
@@ -112,7 +115,7 @@ class FlowsRESTClient:
             user_email=user_email,
             permission=permissions.get(permission),
         )
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}/api/v2/internals/user-permission/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -128,7 +131,7 @@ class FlowsRESTClient:
             is_active=is_active,
         )
 
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/classifier/",
             headers=self.authentication_instance.headers,
             params=params,
@@ -151,7 +154,7 @@ class FlowsRESTClient:
             name=classifier_name,
             access_token=access_token,
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/classifier/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -163,7 +166,7 @@ class FlowsRESTClient:
         params = dict(
             user_email=user_email,
         )
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}/api/v2/internals/classifier/{classifier_uuid}/",
             headers=self.authentication_instance.headers,
             params=params,
@@ -172,7 +175,7 @@ class FlowsRESTClient:
 
     def get_user_api_token(self, project_uuid: str, user_email: str):
         params = dict(project=project_uuid, user=user_email)
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/users/api-token",
             params=params,
             headers=self.authentication_instance.headers,
@@ -184,7 +187,7 @@ class FlowsRESTClient:
             org=project_uuid, ticketer_type=ticketer_type, name=name, config=config
         )
 
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/ticketers/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -195,7 +198,7 @@ class FlowsRESTClient:
     def update_language(self, user_email: str, language: str):
         body = dict(language=language)
         params = dict(email=user_email)
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}/api/v2/internals/flows-users/",
             headers=self.authentication_instance.headers,
             params=params,
@@ -203,17 +206,19 @@ class FlowsRESTClient:
         )
         return response.status_code
 
-    def get_project_flows(self, project_uuid, flow_name):
+    def get_project_flows(self, project_uuid, flow_name, timeout=None):
         params = dict(flow_name=flow_name, project=project_uuid)
-        response = requests.get(
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/project-flows/",
             headers=self.authentication_instance.headers,
             params=params,
+            **kwargs,
         )
         return response.json()
 
     def get_project_info(self, project_uuid: str):
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/orgs/{project_uuid}/",
             headers=self.authentication_instance.headers,
         )
@@ -221,7 +226,7 @@ class FlowsRESTClient:
 
     def get_project_statistic(self, project_uuid: str):
         try:
-            response = requests.get(
+            response = internal_http_client.get(
                 url=f"{self.base_url}/api/v2/internals/statistic/{project_uuid}/",
                 headers=self.authentication_instance.headers,
                 timeout=180,
@@ -232,7 +237,7 @@ class FlowsRESTClient:
 
     def get_billing_total_statistics(self, project_uuid: str, before: str, after: str):
         body = dict(org=project_uuid, before=before, after=after)
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -241,20 +246,42 @@ class FlowsRESTClient:
 
     def suspend_or_unsuspend_project(self, project_uuid: str, is_suspended: bool):
         body = dict(uuid=project_uuid, is_suspended=is_suspended)
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}/api/v2/internals/orgs/{project_uuid}/",
             headers=self.authentication_instance.headers,
             json=body,
         )
         return response.json()
 
+    def suspend_or_unsuspend_projects(
+        self, project_uuids: list, is_suspended: bool
+    ) -> list:
+        """(Un)suspends several projects, returning the UUIDs that failed.
+
+        Flows has no bulk endpoint yet, so this walks the per-project one over
+        the pooled session; callers only depend on this method.
+        """
+        failed = []
+        for project_uuid in project_uuids:
+            try:
+                response = internal_http_client.patch(
+                    url=f"{self.base_url}/api/v2/internals/orgs/{project_uuid}/",
+                    headers=self.authentication_instance.headers,
+                    json=dict(uuid=project_uuid, is_suspended=is_suspended),
+                )
+                response.raise_for_status()
+            except Exception as error:
+                logger.error(f"Failed to suspend project {project_uuid}: {error}")
+                failed.append(project_uuid)
+        return failed
+
     def create_channel(
         self, user: str, project_uuid: str, data: dict, channeltype_code: str
     ):
         body = dict(
             user=user, org=project_uuid, data=data, channeltype_code=channeltype_code
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/channel/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -270,7 +297,7 @@ class FlowsRESTClient:
             config=config,
             phone_number_id=phone_number_id,
         )
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/channel/create_wac/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -278,7 +305,7 @@ class FlowsRESTClient:
         return response.json()
 
     def release_channel(self, user: str, channel_uuid: str):
-        requests.delete(
+        internal_http_client.delete(
             url=f"{self.base_url}/api/v2/internals/channel/{channel_uuid}/",
             headers=self.authentication_instance.headers,
             json={"user": user},
@@ -298,7 +325,7 @@ class FlowsRESTClient:
         )
         if project_uuid:
             params["org"] = project_uuid
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/channel/",
             headers=self.authentication_instance.headers,
             params=params,
@@ -306,7 +333,7 @@ class FlowsRESTClient:
         return response.json()
 
     def delete_channel(self, channel_uuid: str):
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}/api/v2/internals/channel/{channel_uuid}/",
             headers=self.authentication_instance.headers,
         )
@@ -314,7 +341,7 @@ class FlowsRESTClient:
 
     def get_active_contacts(self, project_uuid, before, after):
         body = dict(org=project_uuid, before=before, after=after)
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/api/v2/internals/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -336,7 +363,7 @@ class FlowsRESTClient:
             user_email=user_email,
             permission=permissions.get(permission),
         )
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}/api/v2/internals/user-permission/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -347,7 +374,7 @@ class FlowsRESTClient:
         body = dict(
             org_uuid=org_uuid, contact_uuid=contact_uuid, before=before, after=after
         )
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -376,7 +403,7 @@ class FlowsRESTClient:
         else:
             request_url = f"{self.base_url}/api/v2/internals/channels"
 
-        response = requests.get(
+        response = internal_http_client.get(
             url=request_url, headers=self.authentication_instance.headers, timeout=60
         )
         return response
@@ -391,7 +418,7 @@ class FlowsRESTClient:
             type_code=type_code,
         )
 
-        return requests.post(
+        return internal_http_client.post(
             self._get_url("/api/v2/internals/externals"),
             headers=self.authentication_instance.headers,
             json=body,
@@ -399,7 +426,7 @@ class FlowsRESTClient:
 
     def create_globals(self, omie_body: list):
 
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v2/internals/globals/",
             headers=self.authentication_instance.headers,
             json=omie_body,
@@ -417,7 +444,7 @@ class FlowsRESTClient:
             kwargs["name"] = kwargs.pop("organization_name")
         kwargs.update({"timezone": str(project.timezone)})
         try:
-            response = requests.patch(
+            response = internal_http_client.patch(
                 url=f"{self.base_url}/api/v2/internals/orgs/{project_uuid}/",
                 headers=self.authentication_instance.headers,
                 json=kwargs,
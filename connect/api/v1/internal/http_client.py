@@ -0,0 +1,125 @@
+import os
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from connect.api.v1.internal.internal_authentication import service_token_manager
+
+
+class InternalHTTPClient:
+    """Pooled, keep-alive HTTP client shared by the internal REST clients.
+
+    Each process owns one ``requests.Session`` with per-host connection pools,
+    so consecutive calls to the same module reuse TCP/TLS connections. The
+    session is built lazily and rebuilt after ``fork`` (Celery prefork,
+    gunicorn), since pooled sockets must not be shared across processes.
+
+    Every call gets a default ``(connect, read)`` timeout unless the caller
+    passes one. Idempotent verbs are retried with exponential backoff on
+    connection errors and gateway failures; ``POST``/``PATCH`` are never
+    retried. A ``401`` drops the cached service token the call was made with.
+    """
+
+    RETRY_STATUS_FORCELIST = (502, 503, 504)
+    RETRY_METHODS = frozenset(["HEAD", "GET", "OPTIONS", "PUT", "DELETE"])
+
+    def __init__(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        max_retries: int = None,
+        backoff_factor: float = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+    ):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _setting(self, value, name: str, default):
+        if value is not None:
+            return value
+        return getattr(settings, name, default)
+
+    @property
+    def timeout(self) -> tuple:
+        return (
+            self._setting(self._connect_timeout, "INTERNAL_HTTP_CONNECT_TIMEOUT", 5),
+            self._setting(self._read_timeout, "INTERNAL_HTTP_READ_TIMEOUT", 120),
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    self._session = self._build_session()
+                    self._pid = pid
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self._setting(self._max_retries, "INTERNAL_HTTP_MAX_RETRIES", 3),
+            backoff_factor=self._setting(
+                self._backoff_factor, "INTERNAL_HTTP_BACKOFF_FACTOR", 0.5
+            ),
+            status_forcelist=self.RETRY_STATUS_FORCELIST,
+            allowed_methods=self.RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self._setting(
+                self._pool_connections, "INTERNAL_HTTP_POOL_CONNECTIONS", 10
+            ),
+            pool_maxsize=self._setting(
+                self._pool_maxsize, "INTERNAL_HTTP_POOL_MAXSIZE", 20
+            ),
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 401:
+            self._invalidate_service_token(kwargs.get("headers"))
+        return response
+
+    @staticmethod
+    def _invalidate_service_token(headers) -> None:
+        # A service token revoked before its expiry would otherwise keep
+        # being served from the cache; the next call fetches a new one.
+        authorization = (headers or {}).get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            service_token_manager.invalidate(authorization[len("Bearer ") :])
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+internal_http_client = InternalHTTPClient()
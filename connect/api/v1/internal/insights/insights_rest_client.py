@@ -1,9 +1,8 @@
 from typing import Optional
 
-import requests
-
 from django.conf import settings
 
+from connect.api.v1.internal.http_client import internal_http_client
 from connect.api.v1.internal.internal_authentication import InternalAuthentication
 
 
@@ -22,7 +21,7 @@ class InsightsRESTClient:
         """
         body = dict(email=user_email, language=language)
 
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/v1/internal/users/change-language/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -35,7 +34,7 @@ class InsightsRESTClient:
         self, project_uuid: str, vtex_account: Optional[str]
     ) -> dict:
         """Sync the project VTEX account to Insights after a Connect migration."""
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}/v1/internal/projects/{project_uuid}/vtex-account",
             headers=self.authentication_instance.headers,
             json={"vtex_account": vtex_account},
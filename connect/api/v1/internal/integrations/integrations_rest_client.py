@@ -1,7 +1,7 @@
 from django.conf import settings
 
-import requests
 import json
+from connect.api.v1.internal.http_client import internal_http_client
 from connect.api.v1.internal.internal_authentication import InternalAuthentication
 
 
@@ -12,7 +12,7 @@ class IntegrationsRESTClient:
 
     def update_user_permission_project(self, project_uuid, user_email, role):
         body = {"project_uuid": project_uuid, "user": user_email, "role": role}
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}/api/v1/internal/user-permission/{project_uuid}/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -33,7 +33,7 @@ class IntegrationsRESTClient:
         if last_name:
             body["last_name"] = last_name
 
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}/api/v1/internal/user/",
             headers=self.authentication_instance.headers,
             json=body,
@@ -50,7 +50,7 @@ class IntegrationsRESTClient:
         headers["Project-Uuid"] = project_uuid
 
         data = {"project_uuid": project_uuid}
-        response = requests.post(url, data=json.dumps(data), headers=headers)
+        response = internal_http_client.post(url, data=json.dumps(data), headers=headers)
 
         if response.status_code != 201:
             raise Exception(response.text)
@@ -1,8 +1,8 @@
 import logging
-import requests
 import json
 from django.conf import settings
 
+from connect.api.v1.internal.http_client import internal_http_client
 from connect.api.v1.internal.internal_authentication import InternalAuthentication
 
 
@@ -15,7 +15,7 @@ class IntelligenceRESTClient:
         self.authentication_instance = InternalAuthentication()
 
     def list_organizations(self, user_email):
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}v2/internal/organization/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email},
@@ -24,7 +24,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def get_user_organization_permission_role(self, user_email, organization_id):
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}v2/internal/user/permission/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email, "org_id": organization_id},
@@ -32,7 +32,7 @@ class IntelligenceRESTClient:
         return response.json().get("role")
 
     def create_organization(self, user_email, organization_name):
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}v2/internal/organization/",
             headers=self.authentication_instance.headers,
             json={"user_email": user_email, "organization_name": organization_name},
@@ -41,7 +41,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def delete_organization(self, organization_id, user_email):
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}v2/internal/organization/{organization_id}/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email},
@@ -49,7 +49,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def update_organization(self, organization_id, organization_name, user_email):
-        response = requests.put(
+        response = internal_http_client.put(
             url=f"{self.base_url}v2/internal/organization/{organization_id}/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email},
@@ -59,7 +59,7 @@ class IntelligenceRESTClient:
 
     def delete_user_permission(self, organization_id, user_email):
         params = dict(user_email=user_email, org_id=organization_id)
-        requests.delete(
+        internal_http_client.delete(
             url=f"{self.base_url}v2/internal/user/permissions",
             headers=self.authentication_instance.headers,
             params=params,
@@ -68,7 +68,7 @@ class IntelligenceRESTClient:
     def update_user_permission_organization(
         self, organization_id, user_email, permission
     ):
-        response = requests.put(
+        response = internal_http_client.put(
             url=f"{self.base_url}v2/internal/user/permission/",
             headers=self.authentication_instance.headers,
             params={"org_id": organization_id, "user_email": user_email},
@@ -76,18 +76,21 @@ class IntelligenceRESTClient:
         )
         return response.json()
 
-    def get_organization_intelligences(self, intelligence_name, organization_id):
-
-        response = requests.get(
+    def get_organization_intelligences(
+        self, intelligence_name, organization_id, timeout=None
+    ):
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        response = internal_http_client.get(
             url=f"{self.base_url}v2/internal/repository/",
             headers=self.authentication_instance.headers,
             params={"name": intelligence_name, "org_id": organization_id},
+            **kwargs,
         )
 
         return response.json()
 
     def update_language(self, user_email, language):
-        response = requests.put(
+        response = internal_http_client.put(
             url=f"{self.base_url}v2/internal/user/language/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email},
@@ -96,7 +99,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def get_organization_statistics(self, organization_id, user_email):
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}v2/internal/organization/{organization_id}/",
             headers=self.authentication_instance.headers,
             params={"user_email": user_email},
@@ -106,7 +109,7 @@ class IntelligenceRESTClient:
     def get_count_intelligences_project(self, classifiers):
         auth_list = set()
         for classifier in classifiers:
-            response = requests.get(
+            response = internal_http_client.get(
                 url=f"{self.base_url}v2/internal/repository/retrieve_authorization/",
                 headers=self.authentication_instance.headers,
                 params={"repository_authorization": classifier.get("access_token")},
@@ -119,7 +122,7 @@ class IntelligenceRESTClient:
 
     def get_access_token(self, user_email: str, repository_uuid: str):
         body = {"user_email": user_email, "repository_uuid": repository_uuid}
-        response = requests.get(
+        response = internal_http_client.get(
             url=f"{self.base_url}v2/repository/authorization-by-user",
             headers=self.authentication_instance.headers,
             params=body,
@@ -142,7 +145,7 @@ class IntelligenceRESTClient:
             if project.created_by
             else "crm@weni.ai",
         }
-        response = requests.post(
+        response = internal_http_client.post(
             url=f"{self.base_url}v2/project",
             headers=self.authentication_instance.headers,
             json=body,
@@ -151,7 +154,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def update_project(self, project_data):
-        response = requests.patch(
+        response = internal_http_client.patch(
             url=f"{self.base_url}v2/project",
             headers=self.authentication_instance.headers,
             json=project_data,
@@ -159,7 +162,7 @@ class IntelligenceRESTClient:
         return response.json()
 
     def delete_project(self, project_uuid):
-        response = requests.delete(
+        response = internal_http_client.delete(
             url=f"{self.base_url}v2/project",
             headers=self.authentication_instance.headers,
             json={"project_uuid": project_uuid},
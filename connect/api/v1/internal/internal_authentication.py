@@ -1,20 +1,169 @@
+import logging
+import threading
+import time
+from typing import Optional
+
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from prometheus_client import Counter
 
+logger = logging.getLogger(__name__)
 
-class InternalAuthentication:
-    # TODO: make this method private
-    def get_module_token(self):
-        request = requests.post(
+SERVICE_TOKEN_EVENTS = Counter(
+    "connect_service_token_events_total",
+    "Service token lookups by outcome (hit, shared_hit, miss, refresh, error).",
+    ["event"],
+)
+
+
+class ServiceTokenManager:
+    """Process-wide cache for the ``client_credentials`` service token.
+
+    The token is kept in memory until ``INTERNAL_TOKEN_EXPIRY_MARGIN`` seconds
+    before ``expires_in`` and refreshed under a lock, so concurrent threads
+    issue a single request to Keycloak (single-flight). When
+    ``INTERNAL_TOKEN_SHARED_CACHE`` is enabled the token is also stored in the
+    Django cache, letting every worker reuse the one fetched by any of them.
+    Cache errors are logged and ignored: the shared layer is best-effort.
+    """
+
+    CACHE_KEY = "internal:service-token"
+
+    def __init__(
+        self,
+        cache_backend=None,
+        expiry_margin: Optional[int] = None,
+        use_shared_cache: Optional[bool] = None,
+    ):
+        self._cache = cache_backend or cache
+        self._expiry_margin = expiry_margin
+        self._use_shared_cache = use_shared_cache
+        self._lock = threading.Lock()
+        self._token = None
+        self._expires_at = 0.0
+
+    @property
+    def expiry_margin(self) -> int:
+        if self._expiry_margin is not None:
+            return self._expiry_margin
+        return getattr(settings, "INTERNAL_TOKEN_EXPIRY_MARGIN", 30)
+
+    @property
+    def use_shared_cache(self) -> bool:
+        if self._use_shared_cache is not None:
+            return self._use_shared_cache
+        return getattr(settings, "INTERNAL_TOKEN_SHARED_CACHE", True)
+
+    def get_token(self) -> Optional[str]:
+        token = self._get_local_token()
+        if token is not None:
+            SERVICE_TOKEN_EVENTS.labels(event="hit").inc()
+            return token
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock.
+            token = self._get_local_token()
+            if token is not None:
+                SERVICE_TOKEN_EVENTS.labels(event="hit").inc()
+                return token
+
+            token = self._get_shared_token()
+            if token is not None:
+                SERVICE_TOKEN_EVENTS.labels(event="shared_hit").inc()
+                return token
+
+            SERVICE_TOKEN_EVENTS.labels(event="miss").inc()
+            return self._refresh()
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """Forget the current token, e.g. after a module answered ``401``.
+
+        With ``token``, nothing happens unless it is still the current one,
+        so a stale rejection does not drop a token refreshed in the meantime.
+        """
+        with self._lock:
+            if token is not None and token != self._token:
+                return
+            self._token = None
+            self._expires_at = 0.0
+            if self.use_shared_cache:
+                try:
+                    self._cache.delete(self.CACHE_KEY)
+                except Exception as error:
+                    logger.warning(f"Failed to drop shared service token: {error}")
+
+    def _get_local_token(self) -> Optional[str]:
+        if self._token is not None and time.time() < self._expires_at:
+            return self._token
+        return None
+
+    def _get_shared_token(self) -> Optional[str]:
+        if not self.use_shared_cache:
+            return None
+
+        try:
+            cached = self._cache.get(self.CACHE_KEY)
+        except Exception as error:
+            logger.warning(f"Failed to read shared service token: {error}")
+            return None
+
+        if not cached or time.time() >= cached.get("expires_at", 0):
+            return None
+
+        self._token = cached["access_token"]
+        self._expires_at = cached["expires_at"]
+        return self._token
+
+    def _refresh(self) -> Optional[str]:
+        SERVICE_TOKEN_EVENTS.labels(event="refresh").inc()
+        response = requests.post(
             url=settings.OIDC_OP_TOKEN_ENDPOINT,
             data={
                 "client_id": settings.OIDC_RP_CLIENT_ID,
                 "client_secret": settings.OIDC_RP_CLIENT_SECRET,
                 "grant_type": "client_credentials",
             },
+            timeout=30,
         )
-        # TODO: exception token None
-        token = request.json().get("access_token")
+        data = response.json()
+        token = data.get("access_token")
+
+        if token is None:
+            SERVICE_TOKEN_EVENTS.labels(event="error").inc()
+            logger.error(
+                f"Service token request failed with status {response.status_code}"
+            )
+            return None
+
+        ttl = int(data.get("expires_in", 0)) - self.expiry_margin
+        if ttl <= 0:
+            # Too short-lived to be worth caching; hand it out once.
+            return token
+
+        self._token = token
+        self._expires_at = time.time() + ttl
+
+        if self.use_shared_cache:
+            try:
+                self._cache.set(
+                    self.CACHE_KEY,
+                    {"access_token": token, "expires_at": self._expires_at},
+                    ttl,
+                )
+            except Exception as error:
+                logger.warning(f"Failed to store shared service token: {error}")
+
+        return token
+
+
+service_token_manager = ServiceTokenManager()
+
+
+class InternalAuthentication:
+    # TODO: make this method private
+    def get_module_token(self):
+        token = service_token_manager.get_token()
         return f"Bearer {token}"
 
     @property
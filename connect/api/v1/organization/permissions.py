@@ -2,16 +2,19 @@ from django.shortcuts import get_object_or_404
 from rest_framework import permissions
 
 from connect.api.v1 import READ_METHODS, WRITE_METHODS
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.common.models import Organization, OrganizationAuthorization, Project
 from connect.usecases.organizations.sso_access import (
-    EvaluateOrganizationSSOAccessUseCase,
+    get_request_sso_access_usecase,
 )
 from django.conf import settings
 
 
 class OrganizationHasPermission(permissions.BasePermission):  # pragma: no cover
     def has_object_permission(self, request, view, obj):
-        authorization = obj.get_user_authorization(request.user)
+        authorization = get_authorization_resolver(
+            request
+        ).get_organization_authorization(obj)
         if request.method in READ_METHODS and not request.user.is_authenticated:
             return authorization.can_read
 
@@ -28,7 +31,9 @@ class OrganizationAdminManagerAuthorization(
     permissions.BasePermission
 ):  # pragma: no cover
     def has_object_permission(self, request, view, obj):
-        authorization = obj.organization.get_user_authorization(request.user)
+        authorization = get_authorization_resolver(
+            request
+        ).get_organization_authorization(obj.organization)
         return authorization.is_admin
 
 
@@ -42,7 +47,9 @@ class OrganizationHasPermissionBilling(permissions.BasePermission):
         return True
 
     def has_object_permission(self, request, view, obj):
-        authorization = obj.get_user_authorization(request.user)
+        authorization = get_authorization_resolver(
+            request
+        ).get_organization_authorization(obj)
         return authorization.can_contribute_billing
 
 
@@ -53,7 +60,9 @@ class Has2FA(permissions.BasePermission):
             organization = get_object_or_404(Organization, uuid=uuid)
 
             if organization.enforce_2fa:
-                auth = organization.get_user_authorization(request._user)
+                auth = get_authorization_resolver(
+                    request
+                ).get_organization_authorization(organization)
                 return auth.has_2fa
             else:
                 # return true to pass this permisson check and verify others
@@ -67,7 +76,9 @@ class Has2FA(permissions.BasePermission):
             org = obj.organization
 
         if org.enforce_2fa:
-            auth = org.get_user_authorization(request.user)
+            auth = get_authorization_resolver(request).get_organization_authorization(
+                org
+            )
             return auth.has_2fa
         else:
             return True
@@ -81,6 +92,7 @@ class HasSSOAccess(permissions.BasePermission):
     SSO_ENFORCED_ORG_READ_ACTIONS = frozenset(
         {
             "get_contact_active",
+            "get_contact_active_job",
             "get_contacts_active_per_project",
         }
     )
@@ -181,7 +193,7 @@ class HasSSOAccess(permissions.BasePermission):
 
     def _is_compliant(self, request, organization):
         session_identity_provider = getattr(request, "session_identity_provider", None)
-        return EvaluateOrganizationSSOAccessUseCase().execute(
+        return get_request_sso_access_usecase(request).execute(
             organization=organization,
             user=request.user,
             session_identity_provider=session_identity_provider,
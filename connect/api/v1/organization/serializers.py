@@ -11,6 +11,7 @@ from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework import status
 
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.api.v1.fields import TextField
 from connect.api.v1.project.validators import CanContributeInOrganizationValidator
 from connect.common.models import (
@@ -313,9 +314,9 @@ class OrganizationSeralizer(serializers.HyperlinkedModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
 
-        data = OrganizationAuthorizationSerializer(
-            obj.get_user_authorization(request.user)
-        ).data
+        resolver = get_authorization_resolver(request)
+        authorization = resolver.get_organization_authorization(obj)
+        data = OrganizationAuthorizationSerializer(authorization).data
         return data
 
     def get_show_chat_help(self, obj):
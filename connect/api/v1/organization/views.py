@@ -37,7 +37,6 @@ from connect.api.v1.organization.serializers import (
 from ..project.serializers import ProjectSerializer, TemplateProjectSerializer
 
 from connect.authentication.models import User
-from connect.celery import app as celery_app
 from connect.common.exceptions import OrganizationAuthorizationException
 from connect.common.models import (
     Organization,
@@ -53,7 +52,6 @@ from connect.common.models import (
 )
 from connect import billing
 from connect.billing.gateways.stripe_gateway import StripeGateway
-from connect.utils import count_contacts
 from connect.api.v1.internal.intelligence.intelligence_rest_client import (
     IntelligenceRESTClient,
 )
@@ -69,6 +67,9 @@ from connect.usecases.authorizations.dto import (
     UpdateAuthorizationDTO,
 )
 from connect.usecases.authorizations.delete import DeleteAuthorizationUseCase
+from connect.usecases.organizations.active_contacts_report import (
+    ActiveContactsReportUseCase,
+)
 from connect.usecases.organizations.exceptions import SSOConfigLockoutError
 from connect.usecases.organizations.sso_access import (
     enrich_serializer_context_with_sso_access,
@@ -112,7 +113,8 @@ class OrganizationViewSet(
             .filter(user=self.request.user)
             .values("organization")
         )
-        queryset = self.queryset.filter(pk__in=auth)
+        # sso_config is read by every serialized organization.
+        queryset = self.queryset.filter(pk__in=auth).select_related("sso_config")
         return queryset
 
     def get_serializer_context(self):
@@ -364,9 +366,7 @@ class OrganizationViewSet(
         url_name="get-contact-active",
         url_path="grpc/contact-active/(?P<organization_uuid>[^/.]+)",
     )
-    def get_contact_active(
-        self, request, organization_uuid, **kwargs
-    ):  # pragma: no cover
+    def get_contact_active(self, request, organization_uuid, **kwargs):
         organization = get_object_or_404(Organization, uuid=organization_uuid)
 
         before = request.query_params.get("before")
@@ -380,22 +380,31 @@ class OrganizationViewSet(
         before = pendulum.parse(before, strict=False).end_of("day")
         after = pendulum.parse(after, strict=False).start_of("day")
 
-        result = {"projects": []}
-
-        for project in organization.project.all():
-            result["projects"].append(
-                {
-                    "uuid": project.uuid,
-                    "name": project.name,
-                    "flow_organization": project.flow_organization,
-                    "active_contacts": count_contacts(
-                        project=project, before=str(before), after=str(after)
-                    ),
-                }
+        report = ActiveContactsReportUseCase()
+        if request.query_params.get("async") in ("true", "1"):
+            job_id = report.start_job(organization, before=before, after=after)
+            return JsonResponse(
+                data={"job_id": job_id}, status=status.HTTP_202_ACCEPTED
             )
 
+        result = report.execute(organization, before=before, after=after)
         return JsonResponse(data=result, status=status.HTTP_200_OK)
 
+    @action(
+        detail=True,
+        methods=["GET"],
+        url_name="get-contact-active-job",
+        url_path="grpc/contact-active-job/(?P<organization_uuid>[^/.]+)/(?P<job_id>[^/.]+)",
+    )
+    def get_contact_active_job(self, request, organization_uuid, job_id, **kwargs):
+        organization = get_object_or_404(Organization, uuid=organization_uuid)
+        job = ActiveContactsReportUseCase().get_job(job_id, organization.uuid)
+        if job is None:
+            return JsonResponse(
+                data={"detail": _("Job not found")}, status=status.HTTP_404_NOT_FOUND
+            )
+        return JsonResponse(data=job, status=status.HTTP_200_OK)
+
     @action(
         detail=True,
         methods=["GET"],
@@ -465,11 +474,7 @@ class OrganizationViewSet(
         org_billing.is_active = False
         org_billing.save()
         # suspends the organization's projects
-        for project in organization.project.all():
-            celery_app.send_task(
-                "update_suspend_project",
-                args=[str(project.uuid), True],
-            )
+        organization.suspend_projects(True)
         user_name = (
             org_billing.organization.name
             if request.user is None
@@ -502,11 +507,7 @@ class OrganizationViewSet(
         org_billing.contract_on = timezone.now().date()
         org_billing.save()
 
-        for project in organization.project.all():
-            celery_app.send_task(
-                "update_suspend_project",
-                args=[str(project.uuid), False],
-            )
+        organization.suspend_projects(False)
 
         result = {
             "plan": org_billing.plan,
@@ -3,6 +3,7 @@ from rest_framework import permissions
 from weni_commons.auth import get_project_uuid, get_user_email
 
 from connect.api.v1 import READ_METHODS, WRITE_METHODS
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.common.exceptions import OrganizationAuthorizationException
 from connect.common.models import Project, ProjectRole
 
@@ -12,7 +13,9 @@ User = get_user_model()
 class ProjectHasPermission(permissions.BasePermission):  # pragma: no cover
     def has_object_permission(self, request, view, obj):
         try:
-            authorization = obj.organization.get_user_authorization(request.user)
+            authorization = get_authorization_resolver(
+                request
+            ).get_organization_authorization(obj.organization)
         except OrganizationAuthorizationException:
             return False
         if request.method in READ_METHODS and not request.user.is_authenticated:
@@ -72,7 +75,9 @@ class CanChangeProjectStatus(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        authorization = obj.get_user_authorization(request.user)
+        authorization = get_authorization_resolver(request).get_project_authorization(
+            obj
+        )
         role = authorization.role
 
         if request.method in WRITE_METHODS:
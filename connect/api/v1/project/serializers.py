@@ -12,6 +12,7 @@ from rest_framework.exceptions import ValidationError
 
 from connect.api.v1.internal.chats.chats_rest_client import ChatsRESTClient
 from connect.api.v1 import fields
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.api.v1.fields import TextField
 from connect.api.v1.internal.flows.flows_rest_client import FlowsRESTClient
 
@@ -275,9 +276,9 @@ class ProjectSerializer(serializers.ModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
 
-        data = ProjectAuthorizationSerializer(
-            obj.get_user_authorization(request.user)
-        ).data
+        resolver = get_authorization_resolver(request)
+        authorization = resolver.get_project_authorization(obj)
+        data = ProjectAuthorizationSerializer(authorization).data
         return data
 
     def get_last_opened_on(self, obj):
@@ -70,6 +70,7 @@ from connect.usecases.authorizations.exceptions import (
 from connect.usecases.project.update_project import UpdateProjectUseCase
 from connect.usecases.organizations.sso_access import (
     ExcludeNonCompliantOrganizationProjectsUseCase,
+    get_request_sso_access_usecase,
 )
 from connect.utils import count_contacts, rate_limit
 
@@ -113,7 +114,9 @@ class ProjectViewSet(
             .order_by("-opened_project__day")
         )
         if self.action == "list":
-            queryset = ExcludeNonCompliantOrganizationProjectsUseCase().execute(
+            queryset = ExcludeNonCompliantOrganizationProjectsUseCase(
+                evaluate_usecase=get_request_sso_access_usecase(self.request)
+            ).execute(
                 queryset,
                 self.request.user,
                 getattr(self.request, "session_identity_provider", None),
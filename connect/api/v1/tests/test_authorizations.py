@@ -0,0 +1,116 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+
+from connect.api.v1.authorizations import get_authorization_resolver
+from connect.api.v1.tests.utils import create_user_and_token
+from connect.common.exceptions import (
+    OrganizationAuthorizationException,
+    ProjectAuthorizationException,
+)
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, OrganizationRole
+
+
+class AuthorizationResolverTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.user, _ = create_user_and_token("resolver")
+        self.organizations = [
+            Organization.objects.create(
+                name=f"organization {index}",
+                inteligence_organization=1,
+                organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+                organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+            )
+            for index in range(3)
+        ]
+        for organization in self.organizations:
+            organization.authorizations.create(
+                user=self.user, role=OrganizationRole.ADMIN.value
+            )
+        self.project = self.organizations[0].project.create(
+            name="project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+        self.other_organization = Organization.objects.create(
+            name="other organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+
+    def build_request(self):
+        request = Request(RequestFactory().get("/"))
+        request.user = self.user
+        return request
+
+    def test_organization_authorizations_are_loaded_once(self):
+        resolver = get_authorization_resolver(self.build_request())
+
+        with self.assertNumQueries(1):
+            for organization in self.organizations:
+                authorization = resolver.get_organization_authorization(organization)
+                self.assertEqual(authorization.organization_id, organization.pk)
+                self.assertTrue(authorization.is_admin)
+            resolver.get_organization_authorization(self.organizations[0])
+
+    def test_resolver_is_memoized_on_the_request(self):
+        request = self.build_request()
+
+        self.assertIs(
+            get_authorization_resolver(request),
+            get_authorization_resolver(request._request),
+        )
+
+    def test_project_authorization_matches_model_lookup(self):
+        resolver = get_authorization_resolver(self.build_request())
+
+        authorization = resolver.get_project_authorization(self.project)
+
+        self.assertEqual(
+            authorization.pk, self.project.get_user_authorization(self.user).pk
+        )
+        with self.assertNumQueries(0):
+            resolver.get_project_authorization(self.project)
+
+    def test_missing_authorization_raises_model_exception(self):
+        resolver = get_authorization_resolver(self.build_request())
+        other_project = self.other_organization.project.create(
+            name="other project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+
+        with self.assertRaises(OrganizationAuthorizationException):
+            resolver.get_organization_authorization(self.other_organization)
+        # Like the model, a project of an organization the user is not part
+        # of fails on the organization authorization first.
+        with self.assertRaises(OrganizationAuthorizationException):
+            other_project.get_user_authorization(self.user)
+        with self.assertRaises(OrganizationAuthorizationException):
+            resolver.get_project_authorization(other_project)
+
+    def test_missing_project_authorization_raises_model_exception(self):
+        self.project.project_authorizations.filter(user=self.user).delete()
+        resolver = get_authorization_resolver(self.build_request())
+
+        with self.assertRaises(ProjectAuthorizationException):
+            self.project.get_user_authorization(self.user)
+        with self.assertRaises(ProjectAuthorizationException):
+            resolver.get_project_authorization(self.project)
+
+    def test_authorization_created_after_loading_is_found(self):
+        resolver = get_authorization_resolver(self.build_request())
+        resolver.get_organization_authorization(self.organizations[0])
+
+        self.other_organization.authorizations.create(
+            user=self.user, role=OrganizationRole.VIEWER.value
+        )
+
+        authorization = resolver.get_organization_authorization(self.other_organization)
+        self.assertEqual(authorization.role, OrganizationRole.VIEWER.value)
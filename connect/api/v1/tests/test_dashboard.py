@@ -27,7 +27,7 @@ from unittest.mock import patch
 
 
 class ListStatusServiceTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
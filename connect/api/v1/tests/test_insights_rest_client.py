@@ -12,7 +12,9 @@ class InsightsRESTClientTestCase(SimpleTestCase):
     @patch(
         "connect.api.v1.internal.insights.insights_rest_client.InternalAuthentication"
     )
-    @patch("connect.api.v1.internal.insights.insights_rest_client.requests.post")
+    @patch(
+        "connect.api.v1.internal.insights.insights_rest_client.internal_http_client.post"
+    )
     def test_update_user_language_posts_to_change_language_endpoint(
         self, mock_post, mock_auth_class
     ):
@@ -34,7 +36,9 @@ class InsightsRESTClientTestCase(SimpleTestCase):
     @patch(
         "connect.api.v1.internal.insights.insights_rest_client.InternalAuthentication"
     )
-    @patch("connect.api.v1.internal.insights.insights_rest_client.requests.patch")
+    @patch(
+        "connect.api.v1.internal.insights.insights_rest_client.internal_http_client.patch"
+    )
     def test_notify_vtex_account_migration_patches_project_endpoint(
         self, mock_patch, mock_auth_class
     ):
@@ -64,7 +68,9 @@ class InsightsRESTClientTestCase(SimpleTestCase):
     @patch(
         "connect.api.v1.internal.insights.insights_rest_client.InternalAuthentication"
     )
-    @patch("connect.api.v1.internal.insights.insights_rest_client.requests.patch")
+    @patch(
+        "connect.api.v1.internal.insights.insights_rest_client.internal_http_client.patch"
+    )
     def test_notify_vtex_account_migration_accepts_null_and_empty_values(
         self, mock_patch, mock_auth_class
     ):
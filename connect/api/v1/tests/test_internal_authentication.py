@@ -0,0 +1,120 @@
+"""Tests for the cached service token used by the internal REST clients."""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase, override_settings
+
+from connect.api.v1.internal.internal_authentication import (
+    InternalAuthentication,
+    ServiceTokenManager,
+)
+
+
+def token_response(access_token="token", expires_in=300):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": access_token,
+        "expires_in": expires_in,
+    }
+    return response
+
+
+@override_settings(
+    OIDC_OP_TOKEN_ENDPOINT="https://keycloak.weni.ai/token",
+    OIDC_RP_CLIENT_ID="connect",
+    OIDC_RP_CLIENT_SECRET="secret",
+)
+@patch("connect.api.v1.internal.internal_authentication.requests.post")
+class ServiceTokenManagerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.cache = LocMemCache("service-token-tests", {})
+        self.cache.clear()
+
+    def build_manager(self, **kwargs):
+        kwargs.setdefault("expiry_margin", 30)
+        return ServiceTokenManager(cache_backend=self.cache, **kwargs)
+
+    def test_token_is_reused_until_expiry(self, mock_post):
+        mock_post.return_value = token_response()
+        manager = self.build_manager()
+
+        self.assertEqual(manager.get_token(), "token")
+        self.assertEqual(manager.get_token(), "token")
+
+        mock_post.assert_called_once()
+
+    def test_token_is_refreshed_within_expiry_margin(self, mock_post):
+        mock_post.side_effect = [
+            token_response("first", expires_in=60),
+            token_response("second", expires_in=60),
+        ]
+        manager = self.build_manager(use_shared_cache=False)
+
+        with patch(
+            "connect.api.v1.internal.internal_authentication.time.time"
+        ) as mock_time:
+            mock_time.return_value = 1000
+            self.assertEqual(manager.get_token(), "first")
+            mock_time.return_value = 1031
+            self.assertEqual(manager.get_token(), "second")
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_token_is_shared_between_managers(self, mock_post):
+        mock_post.return_value = token_response()
+
+        self.build_manager().get_token()
+        token = self.build_manager().get_token()
+
+        self.assertEqual(token, "token")
+        mock_post.assert_called_once()
+
+    def test_shared_cache_can_be_disabled(self, mock_post):
+        mock_post.return_value = token_response()
+
+        self.build_manager(use_shared_cache=False).get_token()
+        self.build_manager(use_shared_cache=False).get_token()
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_failed_request_is_not_cached(self, mock_post):
+        failure = Mock(status_code=401)
+        failure.json.return_value = {"error": "unauthorized_client"}
+        mock_post.side_effect = [failure, token_response()]
+        manager = self.build_manager()
+
+        self.assertIsNone(manager.get_token())
+        self.assertEqual(manager.get_token(), "token")
+
+    def test_invalidate_forces_refresh(self, mock_post):
+        mock_post.side_effect = [token_response("first"), token_response("second")]
+        manager = self.build_manager()
+
+        manager.get_token()
+        manager.invalidate()
+
+        self.assertEqual(manager.get_token(), "second")
+
+    def test_invalidate_ignores_a_token_already_replaced(self, mock_post):
+        mock_post.side_effect = [token_response("first"), token_response("second")]
+        manager = self.build_manager()
+
+        manager.get_token()
+        manager.invalidate("first")
+        manager.get_token()
+        manager.invalidate("first")
+
+        self.assertEqual(manager.get_token(), "second")
+        self.assertEqual(mock_post.call_count, 2)
+
+
+class InternalAuthenticationTestCase(SimpleTestCase):
+    @patch("connect.api.v1.internal.internal_authentication.service_token_manager")
+    def test_headers_use_cached_token(self, mock_manager):
+        mock_manager.get_token.return_value = "token"
+
+        headers = InternalAuthentication().headers
+
+        self.assertEqual(headers["Authorization"], "Bearer token")
@@ -0,0 +1,85 @@
+"""Tests for the pooled HTTP client shared by the internal REST clients."""
+
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from connect.api.v1.internal.http_client import InternalHTTPClient
+
+
+class InternalHTTPClientTestCase(SimpleTestCase):
+    def build_client(self):
+        return InternalHTTPClient(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=2,
+            backoff_factor=0.1,
+            connect_timeout=1,
+            read_timeout=10,
+        )
+
+    def test_session_is_reused_within_a_process(self):
+        client = self.build_client()
+
+        self.assertIs(client.session, client.session)
+
+    def test_session_is_rebuilt_after_fork(self):
+        client = self.build_client()
+        session = client.session
+
+        with patch("connect.api.v1.internal.http_client.os.getpid", return_value=-1):
+            self.assertIsNot(client.session, session)
+
+    def test_adapter_uses_configured_pool_and_retries(self):
+        adapter = self.build_client().session.get_adapter("https://flows.weni.ai")
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn("GET", adapter.max_retries.allowed_methods)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_default_timeout_is_applied(self):
+        client = self.build_client()
+
+        with patch.object(client.session, "request") as mock_request:
+            client.get("https://flows.weni.ai/api/", params={"a": 1})
+
+        mock_request.assert_called_once_with(
+            "GET", "https://flows.weni.ai/api/", params={"a": 1}, timeout=(1, 10)
+        )
+
+    def test_explicit_timeout_is_kept(self):
+        client = self.build_client()
+
+        with patch.object(client.session, "request") as mock_request:
+            client.post("https://flows.weni.ai/api/", json={}, timeout=180)
+
+        mock_request.assert_called_once_with(
+            "POST", "https://flows.weni.ai/api/", json={}, timeout=180
+        )
+
+    @patch("connect.api.v1.internal.http_client.service_token_manager")
+    def test_unauthorized_response_drops_the_service_token(self, mock_manager):
+        client = self.build_client()
+
+        with patch.object(client.session, "request") as mock_request:
+            mock_request.return_value = Mock(status_code=401)
+            client.get(
+                "https://flows.weni.ai/api/",
+                headers={"Authorization": "Bearer revoked"},
+            )
+
+        mock_manager.invalidate.assert_called_once_with("revoked")
+
+    @patch("connect.api.v1.internal.http_client.service_token_manager")
+    def test_authorized_response_keeps_the_service_token(self, mock_manager):
+        client = self.build_client()
+
+        with patch.object(client.session, "request") as mock_request:
+            mock_request.return_value = Mock(status_code=200)
+            client.get(
+                "https://flows.weni.ai/api/", headers={"Authorization": "Bearer ok"}
+            )
+
+        mock_manager.invalidate.assert_not_called()
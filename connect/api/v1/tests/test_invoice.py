@@ -26,7 +26,7 @@ class CeleryResponse:
 
 @unittest.skip("Test broken, need to be fixed")
 class ListInvoiceAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -94,7 +94,7 @@ class ListInvoiceAPITestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class InvoiceDataTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -4,6 +4,7 @@ import unittest
 import uuid as uuid4
 from unittest.mock import patch, Mock
 from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.test import RequestFactory
 from django.test import TestCase
@@ -81,7 +82,7 @@ class CreateOrganizationAPITestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class ListOrganizationAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -127,7 +128,7 @@ class ListOrganizationAPITestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class GetOrganizationContactsAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -206,7 +207,7 @@ class GetOrganizationContactsAPITestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class OrgBillingPlan(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -430,7 +431,7 @@ class OrgBillingPlan(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class OrgBillingAdditionalInformation(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -530,7 +531,7 @@ class OrgBillingAdditionalInformation(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class ListOrganizationAuthorizationTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -589,7 +590,7 @@ class ListOrganizationAuthorizationTestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class UpdateAuthorizationRoleTestCase(TestCase):
-    # @patch("connect.common.signals.update_user_permission_project")
+    # @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -663,7 +664,7 @@ class UpdateAuthorizationRoleTestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class DestroyAuthorizationRoleTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -717,7 +718,7 @@ class DestroyAuthorizationRoleTestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class ActiveContactsLimitTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -819,7 +820,7 @@ class ActiveContactsLimitTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual("free plan is valid yet", content_data["message"])
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     def test_organization_over_limit(self, mock_permission):
         mock_permission.return_value = True
         self.project2 = Project.objects.create(
@@ -875,7 +876,7 @@ class ActiveContactsLimitTestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class ExtraIntegrationsTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -929,7 +930,7 @@ class ExtraIntegrationsTestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class GetOrganizationStripeDataTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -1163,3 +1164,81 @@ class OrganizationFieldTrackerTestCase(TestCase):
         # Save and verify reset
         self.organization.save()
         self.assertEqual(self.organization.tracker.changed(), {})
+
+
+class GetContactActiveJobTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.factory = RequestFactory()
+        self.owner, self.owner_token = create_user_and_token("owner")
+        self.organization, self.other_organization = [
+            Organization.objects.create(
+                name=f"Report organization {index}",
+                inteligence_organization=1,
+                organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+                organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+            )
+            for index in range(2)
+        ]
+        for organization in (self.organization, self.other_organization):
+            organization.authorizations.create(
+                user=self.owner, role=OrganizationRole.ADMIN.value
+            )
+        self.project = Project.objects.create(
+            name="Report project",
+            flow_organization=uuid4.uuid4(),
+            organization=self.organization,
+        )
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def request(self, path, method, **kwargs):
+        request = self.factory.get(
+            f"/v1/organization/org/{self.organization.uuid}/{path}",
+            HTTP_AUTHORIZATION=f"Token {self.owner_token.key}",
+        )
+        response = OrganizationViewSet.as_view({"get": method})(
+            request, uuid=self.organization.uuid, **kwargs
+        )
+        return response, json.loads(response.content)
+
+    def start_job(self):
+        return self.request(
+            f"grpc/contact-active/{self.organization.uuid}/"
+            "?before=2023-03-31&after=2023-03-01&async=true",
+            "get_contact_active",
+            organization_uuid=str(self.organization.uuid),
+        )
+
+    def poll_job(self, organization, job_id):
+        return self.request(
+            f"grpc/contact-active-job/{organization.uuid}/{job_id}/",
+            "get_contact_active_job",
+            organization_uuid=str(organization.uuid),
+            job_id=job_id,
+        )
+
+    def test_async_report_is_polled_until_done(self):
+        response, content_data = self.start_job()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response, content_data = self.poll_job(
+            self.organization, content_data["job_id"]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(content_data["status"], "done")
+        self.assertEqual(
+            [project["uuid"] for project in content_data["result"]["projects"]],
+            [str(self.project.uuid)],
+        )
+
+    def test_job_of_another_organization_is_not_found(self):
+        _, content_data = self.start_job()
+
+        response, _ = self.poll_job(self.other_organization, content_data["job_id"])
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
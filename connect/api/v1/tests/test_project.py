@@ -86,7 +86,7 @@ class CreateProjectAPITestCase(TestCase):
 
 
 class ListProjectAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -193,7 +193,7 @@ class ListProjectAPITestCase(TestCase):
 
 
 class UpdateProjectTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -283,7 +283,7 @@ class UpdateProjectTestCase(TestCase):
 
 
 class DeleteProjectAuthTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -363,7 +363,7 @@ class DeleteProjectAuthTestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class TemplateProjectTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -437,7 +437,7 @@ class TemplateProjectTestCase(TestCase):
         self.assertEquals(response.status_code, status.HTTP_200_OK)
 
     @unittest.skip("Test broken, need to be fixed")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     def test_create_template_project(self, mock_permission):
         mock_permission.return_value = True
         data = {
@@ -54,7 +54,7 @@ class CreateOrganizationAPITestCase(TestCase):
         return (response, content_data)
 
     @unittest.skip("Test broken, need to be fixed")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def test_create(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -81,7 +81,7 @@ class CreateOrganizationAPITestCase(TestCase):
         self.assertEquals(response.status_code, 201)
 
     @unittest.skip("Test broken, need to be fixed")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def test_create_org_with_customer(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -106,7 +106,7 @@ class CreateOrganizationAPITestCase(TestCase):
         self.assertEqual(org.organization_billing.stripe_customer, "cus_tomer")
 
     @unittest.skip("Test broken, need to be fixed")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def test_create_template_project(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -146,7 +146,7 @@ class CreateOrganizationAPITestCase(TestCase):
         self.assertEquals(ProjectAuthorization.objects.count(), 1)
 
     @unittest.skip("Test broken, need to be fixed")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def test_create_template_project_type_support(
         self, mock_get_gateway, mock_permission
@@ -175,7 +175,7 @@ class CreateOrganizationAPITestCase(TestCase):
 
 
 class RetrieveOrganizationProjectsAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission) -> None:
         mock_get_gateway.return_value = StripeMockGateway()
@@ -221,7 +221,7 @@ class RetrieveOrganizationProjectsAPITestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class PlanAPITestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission) -> None:
         mock_get_gateway.return_value = StripeMockGateway()
@@ -442,7 +442,7 @@ class BillingViewTestCase(TestCase):
         content_data = json.loads(response.content)
         return (response, content_data)
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def test_setup_plan(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -508,7 +508,7 @@ class BillingViewTestCase(TestCase):
 
 @freeze_time("2022-11-14")
 class IntegrationTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
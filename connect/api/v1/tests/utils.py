@@ -47,4 +47,4 @@ def create_contacts(num_contacts: int, day=None):
 
             contact_list.extend([contact, contact2, contact3])
 
-    Contact.objects.bulk_create(contact_list)
+    Contact.objects.bulk_create(contact_list, ignore_conflicts=True)
@@ -44,7 +44,7 @@ class GetTokenViewTestCase(TestCase):
     @patch(
         "connect.internals.event_driven.producer.rabbitmq_publisher.RabbitmqPublisher.send_message"
     )
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission, mock_publisher):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -141,7 +141,7 @@ class InvalidateSessionTokenViewTestCase(TestCase):
     @patch(
         "connect.internals.event_driven.producer.rabbitmq_publisher.RabbitmqPublisher.send_message"
     )
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission, mock_publisher):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -312,7 +312,7 @@ def build_weni_jwt(**claims) -> str:
 class ProjectAuthorizationViewTestCaseSetUp(APITestCase):
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -48,7 +48,7 @@ def _mock_lock_service():
 class CreateVtexProjectViewTestCase(APITestCase):
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -261,7 +261,7 @@ class CreateVtexProjectUseCaseTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -480,7 +480,7 @@ class SetVtexHostStoreViewTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -654,7 +654,7 @@ class SetVtexHostStoreUseCaseTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -714,7 +714,7 @@ class UpdateProjectConfigViewTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -848,7 +848,7 @@ class UpdateProjectConfigUseCaseTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -1029,7 +1029,7 @@ class LinkVtexAccountViewTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -1155,7 +1155,7 @@ class LinkVtexAccountUseCaseTestCase(APITestCase):
 
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -71,12 +71,16 @@ class CRMOrganizationFilter(filters.FilterSet):
         containing that project and show all projects from that organization.
         """
         try:
-            project = Project.objects.get(uuid=value)
-            return queryset.filter(uuid=project.organization.uuid)
-        except Project.DoesNotExist:
-            raise NotFound(_("Project {} does not exist").format(value))
+            organization_id = (
+                Project.objects.filter(uuid=value)
+                .values_list("organization_id", flat=True)
+                .first()
+            )
         except DjangoValidationError:
             raise NotFound(_("Invalid project UUID"))
+        if organization_id is None:
+            raise NotFound(_("Project {} does not exist").format(value))
+        return queryset.filter(pk=organization_id)
 
     def filter_has_vtex_account(self, queryset, name, value):
         """
@@ -84,18 +88,14 @@ class CRMOrganizationFilter(filters.FilterSet):
         true: organizations with at least one project having vtex_account
         false: organizations with no projects having vtex_account
         """
+        # A subquery instead of a join keeps one row per organization, so
+        # no DISTINCT is needed over the paginated queryset.
+        organizations_with_vtex = Project.objects.filter(
+            vtex_account__isnull=False, vtex_account__gt=""
+        ).values("organization_id")
         if value is True:
-            return queryset.filter(
-                project__vtex_account__isnull=False, project__vtex_account__gt=""
-            ).distinct()
+            return queryset.filter(pk__in=organizations_with_vtex)
         elif value is False:
-            organizations_with_vtex = (
-                Organization.objects.filter(
-                    project__vtex_account__isnull=False, project__vtex_account__gt=""
-                )
-                .distinct()
-                .values_list("uuid", flat=True)
-            )
-            return queryset.exclude(uuid__in=organizations_with_vtex)
+            return queryset.exclude(pk__in=organizations_with_vtex)
 
         return queryset
@@ -1,4 +1,9 @@
-from rest_framework.pagination import PageNumberPagination
+import uuid
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from django.conf import settings
 
 
@@ -11,3 +16,60 @@ class ProjectsPageNumberPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 1000
     page_query_param = 'page'
+
+
+class ProjectsKeysetPagination(BasePagination):
+    """
+    Keyset pagination for internal projects API, ordered by uuid.
+    Each page starts after the uuid given in `after` (empty for the first
+    page), so there is no COUNT(*) and no OFFSET to skip.
+    Returns paginated results in the format: {next, results}
+    """
+    page_size = ProjectsPageNumberPagination.page_size
+    page_size_query_param = ProjectsPageNumberPagination.page_size_query_param
+    max_page_size = ProjectsPageNumberPagination.max_page_size
+    after_query_param = 'after'
+    ordering = 'uuid'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_after(self, request):
+        after = request.query_params.get(self.after_query_param)
+        if not after:
+            return None
+        try:
+            return uuid.UUID(after)
+        except ValueError:
+            raise ValidationError({self.after_query_param: ['Must be a valid UUID.']})
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return up to `page_size` rows; `queryset` must yield the uuid first."""
+        self.request = request
+        page_size = self.get_page_size(request)
+        after = self.get_after(request)
+
+        queryset = queryset.order_by(self.ordering)
+        if after is not None:
+            queryset = queryset.filter(**{f'{self.ordering}__gt': after})
+
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.last = rows[-1][0] if rows else None
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.after_query_param, str(self.last))
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
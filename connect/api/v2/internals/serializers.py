@@ -216,9 +216,11 @@ class CRMOrganizationSerializer(serializers.ModelSerializer):
 
     def get_users(self, obj):
         """Get organization users excluding NOT_SETTED roles"""
-        org_authorizations = obj.authorizations.exclude(
-            role=OrganizationRole.NOT_SETTED.value
-        ).select_related("user")
+        org_authorizations = getattr(obj, "crm_authorizations", None)
+        if org_authorizations is None:
+            org_authorizations = obj.authorizations.exclude(
+                role=OrganizationRole.NOT_SETTED.value
+            ).select_related("user")
 
         users = []
         for auth in org_authorizations:
@@ -229,7 +231,9 @@ class CRMOrganizationSerializer(serializers.ModelSerializer):
 
     def get_projects(self, obj):
         """Get all organization projects"""
-        projects = obj.project.all()
+        projects = getattr(obj, "crm_projects", None)
+        if projects is None:
+            projects = obj.project.all()
         return CRMProjectSerializer(projects, many=True).data
 
 
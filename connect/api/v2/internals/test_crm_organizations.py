@@ -1,8 +1,13 @@
+import os
+import time
 import uuid
 from datetime import datetime, timedelta
+from unittest import skipUnless
 from unittest.mock import patch, Mock
 
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
@@ -25,7 +30,7 @@ from connect.common.mocks import StripeMockGateway
 class CRMOrganizationViewSetTestCase(APITestCase):
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -369,3 +374,116 @@ class CRMOrganizationViewSetTestCase(APITestCase):
 
         response = self.client.delete(detail_url)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    # Query Tests
+    @override_settings(ALLOW_CRM_ACCESS=True, CRM_EMAILS_LIST=["crmuser@user.com"])
+    def test_query_count_does_not_depend_on_page_size(self):
+        self._auth_as_crm()
+        counts = {}
+        for page_size in (1, 3):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.list_url, {"page_size": page_size})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["results"]), page_size)
+            counts[page_size] = len(queries)
+
+        self.assertEqual(counts[1], counts[3])
+
+    @override_settings(ALLOW_CRM_ACCESS=True, CRM_EMAILS_LIST=["crmuser@user.com"])
+    @patch("connect.common.signals.RabbitmqPublisher")
+    @patch("connect.common.signals.update_project_permissions")
+    def test_filters_do_not_duplicate_organizations(self, *mocks):
+        self._create_project(
+            "Project 5", self.org1, "vtex-account-3", TypeProject.COMMERCE
+        )
+        self._auth_as_crm()
+
+        response = self.client.get(self.list_url, {"has_vtex_account": "true"})
+
+        org_uuids = [org["uuid"] for org in response.data["results"]]
+        self.assertEqual(len(org_uuids), len(set(org_uuids)))
+        org1 = next(
+            org
+            for org in response.data["results"]
+            if org["uuid"] == str(self.org1.uuid)
+        )
+        self.assertEqual(len(org1["projects"]), 3)
+
+
+@skipUnless(
+    os.environ.get("RUN_BENCHMARKS"),
+    "Set RUN_BENCHMARKS=1 to benchmark the CRM organizations listing",
+)
+@override_settings(
+    USE_EDA_PERMISSIONS=False,
+    ALLOW_CRM_ACCESS=True,
+    CRM_EMAILS_LIST=["crmbench@user.com"],
+)
+class CRMOrganizationViewSetBenchmark(APITestCase):
+    ORGANIZATIONS = 3000
+    USERS_PER_ORGANIZATION = 3
+    PROJECTS_PER_ORGANIZATION = 2
+    PAGE_SIZE = 100
+
+    def setUp(self):
+        self.client = APIClient()
+        self.crm_user, _ = create_user_and_token("crmbench")
+        users = [
+            create_user_and_token(f"crmbench{index}")[0]
+            for index in range(self.USERS_PER_ORGANIZATION)
+        ]
+        organizations = Organization.objects.bulk_create(
+            [
+                Organization(name=f"Benchmark {index}", description="Benchmark")
+                for index in range(self.ORGANIZATIONS)
+            ]
+        )
+        OrganizationAuthorization.objects.bulk_create(
+            [
+                OrganizationAuthorization(
+                    user=user,
+                    organization=organization,
+                    role=OrganizationRole.CONTRIBUTOR.value,
+                )
+                for organization in organizations
+                for user in users
+            ]
+        )
+        Project.objects.bulk_create(
+            [
+                Project(
+                    name=f"{organization.name} project {index}",
+                    organization=organization,
+                    flow_organization=uuid.uuid4(),
+                    vtex_account=f"vtex-{organization.pk}-{index}",
+                )
+                for organization in organizations
+                for index in range(self.PROJECTS_PER_ORGANIZATION)
+            ]
+        )
+        self.list_url = reverse("crm-organizations-list")
+
+    def test_benchmark(self):
+        self.client.force_authenticate(user=self.crm_user)
+        url = f"{self.list_url}?page_size={self.PAGE_SIZE}&has_vtex_account=true"
+        pages = 0
+        organizations = 0
+        queries_per_page = set()
+
+        started = time.perf_counter()
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            queries_per_page.add(len(queries))
+            organizations += len(response.data["results"])
+            pages += 1
+            url = response.data["next"]
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"\nCRM listing of {organizations} organizations: {pages} pages "
+            f"in {elapsed:.2f}s, queries per page {sorted(queries_per_page)}"
+        )
+        self.assertEqual(organizations, self.ORGANIZATIONS)
+        self.assertEqual(len(queries_per_page), 1)
@@ -8,7 +8,10 @@ from rest_framework.test import APIRequestFactory, force_authenticate
 from unittest.mock import patch
 
 from connect.api.v1.tests.utils import create_user_and_token
-from connect.api.v2.internals.views import InternalProjectPlanStatusView
+from connect.api.v2.internals.views import (
+    InternalProjectPlanStatusView,
+    InternalProjectsPlanStatusView,
+)
 from connect.common.mocks import StripeMockGateway
 from connect.common.models import (
     BillingPlan,
@@ -16,10 +19,11 @@ from connect.common.models import (
     OrganizationRole,
     Project,
 )
+from connect.usecases.project.get_project_plan_status import local_cache
 
 
 class InternalProjectPlanStatusViewTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -52,6 +56,7 @@ class InternalProjectPlanStatusViewTestCase(TestCase):
             organization=self.org,
         )
         cache.clear()
+        local_cache.clear()
 
     def tearDown(self):
         cache.clear()
@@ -97,3 +102,24 @@ class InternalProjectPlanStatusViewTestCase(TestCase):
         response, _ = self._request(str(self.project.uuid))
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("connect.api.v1.internal.permissions.ModuleHasPermission.has_permission")
+    def test_bulk_returns_payloads_and_not_found(self, module_has_permission):
+        module_has_permission.return_value = True
+        unknown = str(uuid.uuid4())
+        request = self.factory.post(
+            "/v2/internals/connect/projects/plan-status",
+            {"project_uuids": [str(self.project.uuid), unknown]},
+            format="json",
+        )
+        force_authenticate(request, user=self.user)
+
+        response = InternalProjectsPlanStatusView.as_view()(request)
+        response.render()
+        content = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(content["results"]), 1)
+        self.assertEqual(content["results"][0]["project_uuid"], str(self.project.uuid))
+        self.assertTrue(content["results"][0]["is_trial"])
+        self.assertEqual(content["not_found"], [unknown])
@@ -0,0 +1,80 @@
+import json
+import uuid
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from unittest.mock import patch
+
+from connect.api.v2.internals.views import InternalProjectsListView
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project
+
+
+@override_settings(PROJECTS_API_TOKEN="projects-token")
+class InternalProjectsListViewTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.factory = APIRequestFactory()
+
+        organization = Organization.objects.create(
+            name="Projects List Org",
+            description="Org for projects list tests",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_TRIAL,
+        )
+        for index in range(5):
+            Project.objects.create(
+                name=f"Projects List Project {index}",
+                flow_organization=uuid.uuid4(),
+                organization=organization,
+                timezone="America/Sao_Paulo",
+            )
+        self.uuids = sorted(
+            str(project_uuid)
+            for project_uuid in Project.objects.values_list("uuid", flat=True)
+        )
+
+    def request(self, params: dict):
+        request = self.factory.get(
+            "/v2/internals/connect/projects",
+            params,
+            HTTP_AUTHORIZATION="Bearer projects-token",
+        )
+        return InternalProjectsListView.as_view()(request)
+
+    def test_keyset_pages_walk_every_project_without_count(self):
+        seen = []
+        params = {"after": "", "page_size": 2}
+        while True:
+            with self.assertNumQueries(1):
+                response = self.request(params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            seen.extend(row["uuid"] for row in response.data["results"])
+            if response.data["next"] is None:
+                break
+            params["after"] = seen[-1]
+            self.assertIn(f"after={seen[-1]}", response.data["next"])
+
+        self.assertEqual(seen, self.uuids)
+        self.assertEqual(response.data["results"][-1]["timezone"], "America/Sao_Paulo")
+
+    def test_keyset_rejects_invalid_after(self):
+        response = self.request({"after": "not-a-uuid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stream_returns_every_project_as_ndjson(self):
+        response = self.request({"stream": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual([row["uuid"] for row in rows], self.uuids)
+        self.assertEqual(rows[0]["timezone"], "America/Sao_Paulo")
@@ -6,7 +6,12 @@ from rest_framework.viewsets import GenericViewSet
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 
-from connect.common.models import Organization, Project
+from connect.common.models import (
+    Organization,
+    OrganizationAuthorization,
+    OrganizationRole,
+    Project,
+)
 from connect.api.v2.internals.serializers import (
     OrganizationAISerializer,
     CustomParameterSerializer,
@@ -15,17 +20,26 @@ from connect.api.v2.internals.serializers import (
     CRMOrganizationSerializer,
     InternalProjectsListSerializer,
 )
-from connect.api.v2.projects.serializers import ProjectPlanStatusSerializer
+from connect.api.v2.projects.serializers import (
+    ProjectPlanStatusBulkRequestSerializer,
+    ProjectPlanStatusSerializer,
+)
 from connect.usecases.project.get_project_plan_status import (
     GetProjectPlanStatusUseCase,
 )
 from connect.api.v2.internals.filters import CRMOrganizationFilter
 from connect.api.v2.internals.permissions import ProjectsAPITokenPermission
-from connect.api.v2.internals.paginations import ProjectsPageNumberPagination
+from connect.api.v2.internals.paginations import (
+    ProjectsKeysetPagination,
+    ProjectsPageNumberPagination,
+)
 from connect.api.v1.internal.permissions import ModuleHasPermission
 from connect.api.v1.organization.permissions import IsCRMUser
 from connect.api.v2.paginations import CustomCursorPagination
 
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
 from drf_yasg2.utils import swagger_auto_schema
@@ -111,8 +125,23 @@ class CRMOrganizationViewSet(
 
         queryset = super().get_queryset()
 
-        queryset = queryset.select_related().prefetch_related(
-            "authorizations__user", "project"
+        # One query per relation for the whole page, already filtered and
+        # trimmed to the fields the CRM serializers read.
+        queryset = queryset.select_related("organization_billing").prefetch_related(
+            Prefetch(
+                "authorizations",
+                queryset=OrganizationAuthorization.objects.exclude(
+                    role=OrganizationRole.NOT_SETTED.value
+                ).select_related("user"),
+                to_attr="crm_authorizations",
+            ),
+            Prefetch(
+                "project",
+                queryset=Project.objects.only(
+                    "uuid", "name", "vtex_account", "organization_id"
+                ),
+                to_attr="crm_projects",
+            ),
         )
 
         return queryset
@@ -173,21 +202,76 @@ class InternalProjectPlanStatusView(views.APIView):
         return Response(serializer.data)
 
 
+class InternalProjectsPlanStatusView(views.APIView):
+    """Return the cached billing plan status for many projects at once.
+
+    Bulk variant of ``InternalProjectPlanStatusView`` for callers that sweep
+    hundreds of projects: one cache round trip and at most one query per call.
+    Unknown projects are listed in ``not_found``.
+    """
+
+    permission_classes = [ModuleHasPermission]
+
+    @swagger_auto_schema(
+        operation_description="POST /v2/internals/connect/projects/plan-status",
+        request_body=ProjectPlanStatusBulkRequestSerializer,
+        responses={200: ProjectPlanStatusSerializer(many=True)},
+        tags=["Internal"],
+    )
+    def post(self, request, **kwargs):
+        request_serializer = ProjectPlanStatusBulkRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        project_uuids = list(
+            dict.fromkeys(
+                str(project_uuid)
+                for project_uuid in request_serializer.validated_data["project_uuids"]
+            )
+        )
+
+        payloads = GetProjectPlanStatusUseCase().execute_many(project_uuids)
+        serializer = ProjectPlanStatusSerializer(
+            [payloads[uuid] for uuid in project_uuids if uuid in payloads], many=True
+        )
+        return Response(
+            {
+                "results": serializer.data,
+                "not_found": [uuid for uuid in project_uuids if uuid not in payloads],
+            }
+        )
+
+
+def _project_list_row(project_uuid, timezone):
+    """Same fields as InternalProjectsListSerializer, from a values_list row."""
+    return {
+        "uuid": str(project_uuid),
+        "timezone": str(timezone) if timezone else None,
+    }
+
+
 class InternalProjectsListView(views.APIView):
     """
     Internal API endpoint to list all projects with pagination.
     Returns projects in format: {count, next, previous, results: [{uuid, timezone}]}
+    With `after` (empty for the first page) pages are keyset-paginated by uuid
+    and returned as {next, results}; with `stream=true` every project is sent
+    in one application/x-ndjson response, one JSON object per line.
     Authentication: Bearer token via PROJECTS_API_TOKEN setting
     """
     authentication_classes = []
     permission_classes = [ProjectsAPITokenPermission]
     pagination_class = ProjectsPageNumberPagination
+    keyset_pagination_class = ProjectsKeysetPagination
 
     def get(self, request, **kwargs):
         """
         List all projects with pagination.
-        Query params: page, page_size
+        Query params: page, page_size; or after, page_size; or stream
         """
+        if request.query_params.get("stream") == "true":
+            return self.stream_projects()
+        if "after" in request.query_params:
+            return self.list_projects_after(request)
+
         queryset = Project.objects.all().order_by('uuid')
 
         paginator = self.pagination_class()
@@ -199,3 +283,22 @@ class InternalProjectsListView(views.APIView):
 
         serializer = InternalProjectsListSerializer(queryset, many=True)
         return Response(serializer.data)
+
+    def list_projects_after(self, request):
+        paginator = self.keyset_pagination_class()
+        rows = paginator.paginate_queryset(
+            Project.objects.values_list("uuid", "timezone"), request, view=self
+        )
+        return paginator.get_paginated_response(
+            [_project_list_row(*row) for row in rows]
+        )
+
+    def stream_projects(self):
+        # iterator() reads through a server-side cursor, chunk by chunk.
+        rows = (
+            Project.objects.order_by("uuid")
+            .values_list("uuid", "timezone")
+            .iterator(chunk_size=settings.PROJECTS_STREAM_CHUNK_SIZE)
+        )
+        lines = (json.dumps(_project_list_row(*row)) + "\n" for row in rows)
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
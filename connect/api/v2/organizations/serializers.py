@@ -9,6 +9,7 @@ from django.utils.html import strip_tags
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.common.models import (
     Organization,
     BillingPlan,
@@ -132,9 +133,9 @@ class OrganizationSeralizer(serializers.HyperlinkedModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
 
-        data = OrganizationAuthorizationSerializer(
-            obj.get_user_authorization(request.user)
-        ).data
+        resolver = get_authorization_resolver(request)
+        authorization = resolver.get_organization_authorization(obj)
+        data = OrganizationAuthorizationSerializer(authorization).data
         return data
 
     def create_authorizations(
@@ -69,7 +69,8 @@ class OrganizationViewSet(
             .values("organization")
         )
 
-        queryset = self.queryset.filter(pk__in=auth)
+        # sso_config is read by every serialized organization.
+        queryset = self.queryset.filter(pk__in=auth).select_related("sso_config")
         return queryset
 
     def get_serializer_context(self):
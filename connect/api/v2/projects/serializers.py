@@ -15,6 +15,7 @@ from weni.eda.django.connection_params import AMQConnectionParamsFactory
 from weni.eda.events import Event
 
 from connect.api.v1 import fields
+from connect.api.v1.authorizations import get_authorization_resolver
 from connect.api.v1.internal.chats.chats_rest_client import ChatsRESTClient
 from connect.api.v1.internal.flows.flows_rest_client import FlowsRESTClient
 from connect.api.v1.project.validators import CanContributeInOrganizationValidator
@@ -270,9 +271,9 @@ class ProjectSerializer(serializers.ModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
 
-        data = ProjectAuthorizationSerializer(
-            obj.get_user_authorization(request.user)
-        ).data
+        resolver = get_authorization_resolver(request)
+        authorization = resolver.get_project_authorization(obj)
+        data = ProjectAuthorizationSerializer(authorization).data
         return data
 
     def create_flows_project(
@@ -568,7 +569,7 @@ class ProjectListAuthorizationSerializer(serializers.ModelSerializer):
         exclude_roles = [ProjectRole.SUPPORT.value]
         queryset = obj.project_authorizations.exclude(
             role__in=exclude_roles
-        ).select_related("user")
+        ).select_related("user", "rocket_authorization")
 
         return [
             {
@@ -596,25 +597,34 @@ class ProjectListAuthorizationSerializer(serializers.ModelSerializer):
         }
 
     def get_pending_authorizations_data(self, obj):
-        pending_authorizations = obj.requestpermissionproject_set.all()
+        pending_authorizations = list(
+            obj.requestpermissionproject_set.select_related("created_by")
+        )
+        rocket_roles = self.get_pending_rocketchat_roles(
+            {pending.email for pending in pending_authorizations}
+        )
         return [
             {
                 "email": pending.email,
                 "project_role": pending.role,
                 "created_by": pending.created_by.email,
-                "chats_role": self.get_pending_rocketchat_role(pending.email),
+                "chats_role": rocket_roles.get(pending.email),
             }
             for pending in pending_authorizations
         ]
 
-    def get_pending_rocketchat_role(self, email):
-        rocket_authorization = RequestRocketPermission.objects.filter(
-            email=email
-        ).first()
-
-        if rocket_authorization:
-            return rocket_authorization.role
-        return None
+    def get_pending_rocketchat_roles(self, emails) -> dict:
+        """Role of the first rocket permission request of each email."""
+        if not emails:
+            return {}
+        roles = {}
+        for email, role in (
+            RequestRocketPermission.objects.filter(email__in=emails)
+            .order_by("pk")
+            .values_list("email", "role")
+        ):
+            roles.setdefault(email, role)
+        return roles
 
 
 class OpenedProjectSerializer(serializers.ModelSerializer):
@@ -668,6 +678,16 @@ class ProjectPlanStatusSerializer(serializers.Serializer):
     is_suspended = serializers.BooleanField()
 
 
+class ProjectPlanStatusBulkRequestSerializer(serializers.Serializer):
+    """Body accepted by the bulk `plan-status` internal endpoint."""
+
+    project_uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.PLAN_STATUS_BULK_MAX_PROJECTS,
+    )
+
+
 class ProjectDetailSerializer(serializers.Serializer):
     uuid = serializers.UUIDField()
     name = serializers.CharField()
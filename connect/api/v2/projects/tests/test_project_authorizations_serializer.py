@@ -0,0 +1,130 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from connect.api.v1.tests.utils import create_user_and_token
+from connect.api.v2.projects.serializers import ProjectListAuthorizationSerializer
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import (
+    BillingPlan,
+    Organization,
+    OrganizationAuthorization,
+    OrganizationRole,
+    Project,
+    ProjectAuthorization,
+    ProjectRole,
+    RequestPermissionProject,
+    RequestRocketPermission,
+    RocketAuthorization,
+    RocketRole,
+)
+
+
+class ProjectListAuthorizationSerializerTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.owner, _ = create_user_and_token("owner")
+        self.organization = Organization.objects.create(
+            name="Authorizations Org",
+            description="Authorizations Org",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_TRIAL,
+        )
+        self.project = Project.objects.create(
+            name="Authorizations Project",
+            flow_organization=uuid.uuid4(),
+            organization=self.organization,
+        )
+
+    def add_members(self, count: int, offset: int = 0):
+        # bulk_create skips the permission signals, which call other modules.
+        users = [
+            create_user_and_token(f"member{offset + index}")[0]
+            for index in range(count)
+        ]
+        org_authorizations = OrganizationAuthorization.objects.bulk_create(
+            [
+                OrganizationAuthorization(
+                    user=user,
+                    organization=self.organization,
+                    role=OrganizationRole.CONTRIBUTOR.value,
+                )
+                for user in users
+            ]
+        )
+        ProjectAuthorization.objects.bulk_create(
+            [
+                ProjectAuthorization(
+                    user=user,
+                    project=self.project,
+                    organization_authorization=org_authorization,
+                    role=ProjectRole.CONTRIBUTOR.value,
+                    rocket_authorization=RocketAuthorization.objects.create(
+                        role=RocketRole.AGENT.value
+                    ),
+                )
+                for user, org_authorization in zip(users, org_authorizations)
+            ]
+        )
+        emails = [f"invite{offset + index}@weni.ai" for index in range(count)]
+        RequestPermissionProject.objects.bulk_create(
+            [
+                RequestPermissionProject(
+                    email=email,
+                    project=self.project,
+                    role=ProjectRole.VIEWER.value,
+                    created_by=self.owner,
+                )
+                for email in emails
+            ]
+        )
+        RequestRocketPermission.objects.bulk_create(
+            [
+                RequestRocketPermission(
+                    email=email,
+                    project=self.project,
+                    role=RocketRole.USER.value,
+                    created_by=self.owner,
+                )
+                for email in emails
+            ]
+        )
+
+    def test_query_count_does_not_grow_with_members(self):
+        self.add_members(2)
+        with self.assertNumQueries(3):
+            ProjectListAuthorizationSerializer(self.project).data
+
+        self.add_members(8, offset=2)
+        with self.assertNumQueries(3):
+            data = ProjectListAuthorizationSerializer(self.project).data
+
+        self.assertEqual(data["authorizations"]["count"], 10)
+        self.assertEqual(data["pending_authorizations"]["count"], 10)
+
+    def test_serializes_chats_roles(self):
+        self.add_members(1)
+        RequestPermissionProject.objects.create(
+            email="no-chats@weni.ai",
+            project=self.project,
+            role=ProjectRole.VIEWER.value,
+            created_by=self.owner,
+        )
+
+        data = ProjectListAuthorizationSerializer(self.project).data
+
+        [member] = data["authorizations"]["users"]
+        self.assertEqual(member["email"], "member0@user.com")
+        self.assertEqual(member["chats_role"], RocketRole.AGENT.value)
+        pending = {
+            invite["email"]: invite
+            for invite in data["pending_authorizations"]["users"]
+        }
+        self.assertEqual(
+            pending["invite0@weni.ai"]["chats_role"], RocketRole.USER.value
+        )
+        self.assertEqual(pending["invite0@weni.ai"]["created_by"], self.owner.email)
+        self.assertIsNone(pending["no-chats@weni.ai"]["chats_role"])
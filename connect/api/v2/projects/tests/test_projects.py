@@ -33,7 +33,7 @@ from connect.api.v1.internal.flows.flows_rest_client import FlowsRESTClient
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class ProjectViewSetTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -410,7 +410,7 @@ class ProjectViewSetTestCase(TestCase):
 
 @unittest.skip("Test broken, need to configure rabbitmq")
 class ProjectTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -500,8 +500,9 @@ class ProjectTestCase(TestCase):
         created, data = project.create_flows(classifier_uuid)
         self.assertTrue(created)
 
-    @patch("requests.post")
-    def test_create_flows_json(self, post):
+    @patch("connect.api.v1.internal.flows.flows_rest_client.InternalAuthentication")
+    @patch("connect.api.v1.internal.flows.flows_rest_client.internal_http_client.post")
+    def test_create_flows_json(self, post, mock_auth_class):
         flows = FlowsRESTClient()
         project_uuid = uuid.uuid4()
         classifier_uuid = uuid.uuid4()
@@ -545,7 +546,7 @@ class ProjectAuthorizationTestCase(TestCase):
 
 @override_settings(USE_EDA_PERMISSIONS=False)
 class ProjectDetailViewTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -772,7 +773,7 @@ class ProjectListQuerysetFilterTestCase(TestCase):
     HTTP 500 (the cause of `weni project list` failing on the CLI).
     """
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -881,7 +882,7 @@ class ProjectViewSetAccessControlTestCase(TestCase):
     denied and authorized users only ever see their own projects.
     """
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -20,7 +20,7 @@ from connect.common.models import (
 class RecentActivityViewSetTestCase(APITestCase):
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -229,6 +229,11 @@ urlpatterns += [
         "internals/connect/organizations/",
         connect_internal_views.AIGetOrganizationView.as_view(),
     ),
+    path(
+        "internals/connect/projects/plan-status",
+        connect_internal_views.InternalProjectsPlanStatusView.as_view(),
+        name="internal-projects-plan-status",
+    ),
     path(
         "internals/connect/projects/<uuid>",
         connect_internal_views.InternalProjectViewSet.as_view(
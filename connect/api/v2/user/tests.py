@@ -10,7 +10,7 @@ from connect.common.models import Project, Organization, OrganizationRole, Billi
 
 
 class UserAPITokenTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.factory = RequestFactory()
@@ -57,7 +57,7 @@ class UserAPITokenTestCase(TestCase):
 
 
 class UserIsPayingTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.owner, self.owner_token = create_user_and_token("owner")
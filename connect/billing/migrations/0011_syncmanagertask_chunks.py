@@ -0,0 +1,45 @@
+# Generated by Django 3.2.20 on 2026-10-17 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("billing", "0010_auto_20230830_2014"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="syncmanagertask",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Run this task is a chunk of, for sharded tasks.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="chunks",
+                to="billing.syncmanagertask",
+            ),
+        ),
+        migrations.AddField(
+            model_name="syncmanagertask",
+            name="cursor_start",
+            field=models.UUIDField(
+                blank=True,
+                help_text="Exclusive lower bound of the chunk (None: from the start).",
+                null=True,
+                verbose_name="cursor start",
+            ),
+        ),
+        migrations.AddField(
+            model_name="syncmanagertask",
+            name="cursor_end",
+            field=models.UUIDField(
+                blank=True,
+                help_text="Inclusive upper bound of the chunk (None: to the end).",
+                null=True,
+                verbose_name="cursor end",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 3.2.20 on 2026-10-17 12:30
+
+from django.db import migrations, models
+
+# Contacts ingested twice from Elasticsearch share project, contact and
+# last_seen_on. Messages are moved to the row that is kept before the
+# duplicates are dropped, so the unique constraint can be created.
+REMOVE_DUPLICATED_CONTACTS = """
+WITH ranked AS (
+    SELECT
+        uuid,
+        first_value(uuid) OVER (
+            PARTITION BY project_id, contact_flow_uuid, last_seen_on
+            ORDER BY created_at, uuid
+        ) AS keeper
+    FROM billing_contact
+    WHERE project_id IS NOT NULL AND last_seen_on IS NOT NULL
+)
+UPDATE billing_message AS message
+SET contact_id = ranked.keeper
+FROM ranked
+WHERE message.contact_id = ranked.uuid AND ranked.uuid <> ranked.keeper;
+
+WITH ranked AS (
+    SELECT
+        uuid,
+        first_value(uuid) OVER (
+            PARTITION BY project_id, contact_flow_uuid, last_seen_on
+            ORDER BY created_at, uuid
+        ) AS keeper
+    FROM billing_contact
+    WHERE project_id IS NOT NULL AND last_seen_on IS NOT NULL
+)
+DELETE FROM billing_contact AS contact
+USING ranked
+WHERE contact.uuid = ranked.uuid AND ranked.uuid <> ranked.keeper;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("billing", "0011_syncmanagertask_chunks"),
+    ]
+
+    operations = [
+        migrations.RunSQL(REMOVE_DUPLICATED_CONTACTS, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                fields=("project", "contact_flow_uuid", "last_seen_on"),
+                name="unique_contact_sighting",
+            ),
+        ),
+    ]
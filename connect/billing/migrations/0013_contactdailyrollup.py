@@ -0,0 +1,57 @@
+# Generated by Django 3.2.20 on 2026-10-17 13:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0099_project_currency"),
+        ("billing", "0012_contact_unique_contact_sighting"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContactDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="distinct contacts"
+                    ),
+                ),
+                (
+                    "contact_uuids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.UUIDField(), default=list, size=None
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contact_daily_rollups",
+                        to="common.project",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="contactdailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("project", "day"), name="unique_contact_daily_rollup"
+            ),
+        ),
+    ]
@@ -1,12 +1,28 @@
 import logging
 import uuid as uuid4
-from django.db import models
+
+import pendulum
+import pytz
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection, models, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 
 logger = logging.getLogger(__name__)
 
+# Timezone in which billing days are cut. The exact count (``count_contacts``)
+# and the daily rollup must agree on where a day starts and ends.
+BILLING_TIMEZONE = "America/Maceio"
+
+
+def billing_day_start(day) -> pendulum.DateTime:
+    """Start of ``day`` in ``BILLING_TIMEZONE``."""
+    return pendulum.datetime(day.year, day.month, day.day, tz=BILLING_TIMEZONE)
+
 
 class FailMessageLog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -31,6 +47,26 @@ class SyncManagerTask(models.Model):
     finished_at = models.DateTimeField(_("finished at"), null=True)
     before = models.DateTimeField(_("before"))
     after = models.DateTimeField(_("after"))
+    parent = models.ForeignKey(
+        "self",
+        models.CASCADE,
+        related_name="chunks",
+        null=True,
+        blank=True,
+        help_text=_("Run this task is a chunk of, for sharded tasks."),
+    )
+    cursor_start = models.UUIDField(
+        _("cursor start"),
+        null=True,
+        blank=True,
+        help_text=_("Exclusive lower bound of the chunk (None: from the start)."),
+    )
+    cursor_end = models.UUIDField(
+        _("cursor end"),
+        null=True,
+        blank=True,
+        help_text=_("Inclusive upper bound of the chunk (None: to the end)."),
+    )
 
 
 class ContactManager(models.Manager):
@@ -64,6 +100,14 @@ class Contact(models.Model):
 
     objects = ContactManager()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "contact_flow_uuid", "last_seen_on"],
+                name="unique_contact_sighting",
+            )
+        ]
+
 
 class Message(models.Model):
     uuid = models.UUIDField(
@@ -90,3 +134,114 @@ class ContactCount(models.Model):
     def increase_contact_count(self, contact_count):
         self.count += contact_count
         self.save()
+
+
+class ContactDailyRollupQuerySet(models.QuerySet):
+    def attendances(self) -> int:
+        """Sum of the per-day distinct contacts of the rows."""
+        return self.aggregate(total=Sum("count"))["total"] or 0
+
+    def active_contacts(self) -> int:
+        """Distinct contacts across the rows, merging their per-day sets."""
+        sql, params = self.values("contact_uuids").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(DISTINCT contact_uuid) "
+                f"FROM ({sql}) AS rollup, unnest(rollup.contact_uuids) AS contact_uuid",
+                params,
+            )
+            return cursor.fetchone()[0]
+
+    def attendances_by_project(self) -> dict:
+        """``attendances`` of every project, as ``{project_id: total}``."""
+        return dict(
+            self.values("project")
+            .annotate(total=Sum("count"))
+            .order_by()
+            .values_list("project", "total")
+        )
+
+    def active_contacts_by_project(self) -> dict:
+        """``active_contacts`` of every project, as ``{project_id: total}``."""
+        sql, params = self.values("project", "contact_uuids").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT rollup.project_id, COUNT(DISTINCT contact_uuid) "
+                f"FROM ({sql}) AS rollup, unnest(rollup.contact_uuids) AS contact_uuid "
+                "GROUP BY rollup.project_id",
+                params,
+            )
+            return dict(cursor.fetchall())
+
+
+class ContactDailyRollupManager(
+    models.Manager.from_queryset(ContactDailyRollupQuerySet)
+):
+    def refresh(self, start_day, end_day, projects=None) -> int:
+        """Rebuild the rollup rows of ``[start_day, end_day]`` from Contact.
+
+        Every (project, day) pair is computed with one grouped query and the
+        stale rows are replaced atomically. ``projects`` restricts the rebuild
+        to some projects. Returns the number of rows written.
+        """
+        contacts = Contact.objects.filter(
+            project__isnull=False,
+            last_seen_on__gte=billing_day_start(start_day),
+            last_seen_on__lt=billing_day_start(end_day).add(days=1),
+        )
+        stale = self.filter(day__range=(start_day, end_day))
+        if projects is not None:
+            contacts = contacts.filter(project__in=projects)
+            stale = stale.filter(project__in=projects)
+
+        rows = (
+            contacts.annotate(
+                day=TruncDate("last_seen_on", tzinfo=pytz.timezone(BILLING_TIMEZONE))
+            )
+            .values("project", "day")
+            .annotate(
+                total=Count("contact_flow_uuid", distinct=True),
+                contact_uuids=ArrayAgg("contact_flow_uuid", distinct=True),
+            )
+            .order_by()
+        )
+        rollups = [
+            self.model(
+                project_id=row["project"],
+                day=row["day"],
+                count=row["total"],
+                contact_uuids=row["contact_uuids"],
+            )
+            for row in rows
+        ]
+
+        with transaction.atomic():
+            stale.delete()
+            self.bulk_create(rollups, batch_size=500)
+        return len(rollups)
+
+
+class ContactDailyRollup(models.Model):
+    """Distinct active contacts of a project on one day.
+
+    ``contact_uuids`` keeps the exact set of contacts seen that day, so
+    multi-day ranges can be merged into an exact distinct count without
+    scanning the Contact table.
+    """
+
+    project = models.ForeignKey(
+        "common.Project", models.CASCADE, related_name="contact_daily_rollups"
+    )
+    day = models.DateField(_("day"))
+    count = models.PositiveIntegerField(_("distinct contacts"), default=0)
+    contact_uuids = ArrayField(models.UUIDField(), default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ContactDailyRollupManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "day"], name="unique_contact_daily_rollup"
+            )
+        ]
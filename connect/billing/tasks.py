@@ -8,32 +8,79 @@ from connect.common.models import (
 )
 from connect.billing.models import (
     Contact,
+    ContactDailyRollup,
     SyncManagerTask,
     ContactCount,
 )
+from connect.billing.utils import rollup_days
 from connect.elastic.flow import ElasticFlow
+from connect.usecases.organizations.active_contacts_report import (
+    ActiveContactsReportUseCase,
+)
 from django.utils import timezone
 from celery import current_app
 from django.conf import settings
 
 
+def _build_contacts(sources: list, project: Project) -> list:
+    return [
+        Contact(
+            contact_flow_uuid=source.get("uuid"),
+            name=source.get("name"),
+            last_seen_on=(
+                pendulum.parse(source["last_seen_on"])
+                if source.get("last_seen_on")
+                else None
+            ),
+            project=project,
+        )
+        for source in sources
+    ]
+
+
 @app.task(name="create_contacts", ignore_result=True)
 def create_contacts(active_contacts: list, project_uuid: Project):
-
+    # Kept to drain messages enqueued before contacts were streamed by
+    # sync_project_contacts; nothing enqueues this task anymore.
     project = Project.objects.get(uuid=project_uuid)
-    contacts_to_save = list()
-    for elastic_contact in active_contacts:
-        contacts_to_save.append(
-            Contact(
-                contact_flow_uuid=elastic_contact["_source"].get("uuid"),
-                name=elastic_contact["_source"].get("name"),
-                last_seen_on=pendulum.parse(
-                    elastic_contact["_source"].get("last_seen_on")
-                ),
-                project=project,
+    Contact.objects.bulk_create(
+        _build_contacts([contact["_source"] for contact in active_contacts], project),
+        ignore_conflicts=True,
+    )
+
+
+@app.task(name="sync_project_contacts", ignore_result=True)
+def sync_project_contacts(
+    project_uuid: str, sync_before: str, sync_after: str, task_uuid: str
+):
+    """Stream one project's active contacts from Elasticsearch into Contact.
+
+    Pages are written as they arrive with ``bulk_create(ignore_conflicts=True)``
+    on (project, contact_flow_uuid, last_seen_on), so re-running a page never
+    duplicates rows.
+    """
+    try:
+        project = Project.objects.get(uuid=project_uuid)
+        elastic_instance = ElasticFlow()
+        for page in elastic_instance.iter_contact_pages(
+            str(project.flow_id), sync_before, sync_after
+        ):
+            Contact.objects.bulk_create(
+                _build_contacts(page, project), ignore_conflicts=True
             )
+
+        ContactDailyRollup.objects.refresh(
+            *rollup_days(sync_after, sync_before), projects=[project]
         )
-    Contact.objects.bulk_create(contacts_to_save)
+        current_app.send_task(
+            name="count_contacts", args=[sync_before, sync_after, project_uuid]
+        )
+        return True
+    except Exception as error:
+        manager = SyncManagerTask.objects.get(uuid=task_uuid)
+        manager.fail_message.create(message=f"{project_uuid}: {error}")
+        SyncManagerTask.objects.filter(uuid=task_uuid).update(status=False)
+        return False
 
 
 @app.task(name="sync_contacts", ignore_result=True)
@@ -41,8 +88,6 @@ def sync_contacts(
     sync_before: str = None, sync_after: str = None, task_uuid: str = None
 ):
     if sync_before and sync_after:
-        sync_before = pendulum.parse(sync_before)
-        sync_after = pendulum.parse(sync_after)
         manager = SyncManagerTask.objects.get(uuid=task_uuid)
     else:
         manager = SyncManagerTask.objects.create(
@@ -53,42 +98,30 @@ def sync_contacts(
         )
 
     try:
-        elastic_instance = ElasticFlow()
-        update_fields = ["finished_at", "status"]
-        projects = Project.objects.exclude(flow_id=None)
-        scroll = {}
-        for project in projects:
-            if scroll != {}:
-                elastic_instance.clear_scroll(scroll_id=scroll["scroll_id"])
-            scroll, active_contacts = list(
-                elastic_instance.get_paginated_contacts(
-                    str(project.flow_id), str(manager.before), str(manager.after)
-                )
-            )
-
-            scrolled = 0
-
-            while scrolled <= scroll["scroll_size"]:
-                scrolled += len(active_contacts)
-
-                create_contacts.apply_async(args=[active_contacts, str(project.uuid)])
-                active_contacts = elastic_instance.get_paginated_contacts(
-                    str(project.flow_id),
+        dispatched_at = timezone.now()
+        project_uuids = Project.objects.exclude(flow_id=None).values_list(
+            "uuid", flat=True
+        )
+        # Each project is synced by its own task, so the billing workers
+        # ingest projects in parallel while broker payloads stay constant.
+        for project_uuid in project_uuids:
+            current_app.send_task(
+                name="sync_project_contacts",
+                args=[
+                    str(project_uuid),
                     str(manager.before),
                     str(manager.after),
-                    scroll_id=scroll["scroll_id"],
-                )
-                if scrolled == scroll["scroll_size"]:
-                    break
-
-            count_contacts.apply_async(
-                args=[manager.before, manager.after, project.uuid]
+                    str(manager.uuid),
+                ],
             )
 
-        manager.finished_at = timezone.now()
-        manager.status = True
-        manager.save(update_fields=update_fields)
-        return manager.status
+        run = SyncManagerTask.objects.filter(uuid=manager.uuid)
+        run.update(finished_at=timezone.now())
+        # A project task that already failed has set status=False; marking the
+        # run successful over it would hide it from retry_billing_tasks.
+        return bool(
+            run.exclude(fail_message__created_at__gte=dispatched_at).update(status=True)
+        )
     except Exception as error:
         manager.finished_at = timezone.now()
         manager.fail_message.create(message=str(error))
@@ -103,7 +136,7 @@ def retry_billing_tasks():
 
     for task in task_failed:
         task.retried = True
-        task.save()
+        task.save(update_fields=["retried"])
 
         if task.task_type == "sync_contacts":  # pragma: no cover
             current_app.send_task(
@@ -178,11 +211,7 @@ def problem_capture_invoice():
             organization.save(update_fields=["is_suspended"])
             organization.organization_billing.is_active = False
             organization.organization_billing.save(update_fields=["is_active"])
-            for project in organization.project.all():
-                current_app.send_task(  # pragma: no cover
-                    name="update_suspend_project",
-                    args=[project.uuid, True],
-                )
+            organization.suspend_projects(True)
 
 
 @app.task(name="end_trial_plan")
@@ -213,20 +242,38 @@ def end_trial_plan():
         organization.organization_billing.send_email_trial_plan_expired_due_time_limit()
 
 
+@app.task(name="refresh_contact_daily_rollups", ignore_result=True)
+def refresh_contact_daily_rollups(start_day: str, end_day: str):
+    """Rebuild the daily rollups of every project, e.g. to backfill them."""
+    return ContactDailyRollup.objects.refresh(
+        pendulum.parse(start_day).date(), pendulum.parse(end_day).date()
+    )
+
+
+@app.task(name="generate_active_contacts_report", ignore_result=True)
+def generate_active_contacts_report(
+    job_id: str, organization_uuid: str, before: str, after: str
+):
+    """Build an organization's active-contact report for a polled job."""
+    ActiveContactsReportUseCase().run_job(job_id, organization_uuid, before, after)
+
+
 @app.task(name="daily_contact_count")
 def daily_contact_count():
     """Daily contacts"""
     today = pendulum.now().end_of("day")
+    after = today.start_of("day")
 
-    for project in Project.objects.all():
-        after = today.start_of("day")
-        before = today
-        total_day_calls = (
-            Contact.objects.filter(project=project)
-            .filter(last_seen_on__range=(after, before))
-            .distinct("contact_flow_uuid")
-            .count()
+    ContactDailyRollup.objects.refresh(after.date(), after.date())
+    day_counts = dict(
+        ContactDailyRollup.objects.filter(day=after.date()).values_list(
+            "project", "count"
         )
-        cc, created = ContactCount.objects.get_or_create(
-            project=project, day=after, defaults={"count": total_day_calls}
+    )
+
+    for project_uuid in Project.objects.values_list("uuid", flat=True):
+        ContactCount.objects.get_or_create(
+            project_id=project_uuid,
+            day=after,
+            defaults={"count": day_counts.get(project_uuid, 0)},
         )
@@ -0,0 +1,270 @@
+import os
+import random
+import time
+import uuid
+from itertools import groupby
+from unittest import skipUnless
+from unittest.mock import patch
+
+import pendulum
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from connect.billing.models import Contact
+from connect.billing.utils import (
+    count_contacts_by_project,
+    custom_get_attendances,
+    custom_get_attendances_by_project,
+)
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization
+
+START = "2023-01-01T00:00:00+00:00"
+END = "2023-01-31T23:59:59+00:00"
+
+
+def python_attendances(project, start, end):
+    """Previous in-memory implementation, kept as the reference behaviour."""
+    total_attendances = 0
+    contacts = Contact.objects.filter(
+        last_seen_on__range=(pendulum.parse(start), pendulum.parse(end)),
+        project=project,
+    ).order_by("contact_flow_uuid", "-last_seen_on")
+
+    for _, group in groupby(contacts, lambda contact: contact.contact_flow_uuid):
+        contact_group = list(group)
+        attendances = 1
+        base_contact = contact_group[0]
+        for contact in contact_group:
+            date_period = pendulum.instance(
+                base_contact.last_seen_on
+            ) - pendulum.instance(contact.last_seen_on)
+            if abs(date_period.days) >= 1:
+                attendances += 1
+                base_contact = contact
+        total_attendances += attendances
+
+    return total_attendances
+
+
+class AttendancesTestMixin:
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        organization = Organization.objects.create(
+            name="Attendances organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.project = organization.project.create(
+            name="Attendances project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+
+
+class CustomGetAttendancesTestCase(AttendancesTestMixin, TestCase):
+    def create_sightings(self, hours, contact_flow_uuid=None, project=None):
+        contact_flow_uuid = contact_flow_uuid or uuid.uuid4()
+        base = pendulum.parse("2023-01-10T00:00:00+00:00")
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    contact_flow_uuid=contact_flow_uuid,
+                    last_seen_on=base.add(hours=hour),
+                    project=project or self.project,
+                )
+                for hour in hours
+            ],
+            ignore_conflicts=True,
+        )
+
+    def assertAttendances(self, expected):
+        self.assertEqual(python_attendances(self.project, START, END), expected)
+        self.assertEqual(custom_get_attendances(self.project, START, END), expected)
+
+    def test_no_contacts(self):
+        self.assertAttendances(0)
+
+    def test_sightings_within_a_day_are_one_attendance(self):
+        self.create_sightings([0, 5, 12, 23.9])
+
+        self.assertAttendances(1)
+
+    def test_gap_of_exactly_one_day_starts_new_attendance(self):
+        self.create_sightings([0, 24])
+
+        self.assertAttendances(2)
+
+    def test_chained_sightings_are_measured_from_the_anchor(self):
+        # Consecutive gaps are all under a day, but 26h separate the ends.
+        self.create_sightings([0, 13, 26])
+
+        self.assertAttendances(2)
+
+    def test_long_chain_reanchors_on_each_attendance(self):
+        # Walking back from 90h, attendances start at 90h, 60h, 30h and 0h.
+        self.create_sightings([hour * 10 for hour in range(10)])
+
+        self.assertAttendances(4)
+
+    def test_contacts_are_counted_independently(self):
+        self.create_sightings([0, 2])
+        self.create_sightings([0, 30, 60])
+
+        self.assertAttendances(4)
+
+    def test_sightings_outside_period_or_project_are_ignored(self):
+        other_project = self.project.organization.project.create(
+            name="Other project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+        contact_flow_uuid = uuid.uuid4()
+        self.create_sightings([0], contact_flow_uuid=contact_flow_uuid)
+        self.create_sightings(
+            [48], contact_flow_uuid=contact_flow_uuid, project=other_project
+        )
+        self.create_sightings([24 * 40], contact_flow_uuid=contact_flow_uuid)
+
+        self.assertAttendances(1)
+
+    def test_matches_python_implementation_on_random_data(self):
+        rng = random.Random(7)
+        for _ in range(60):
+            self.create_sightings(
+                [
+                    rng.choice([rng.uniform(0, 72), rng.uniform(0, 24 * 20)])
+                    for _ in range(rng.randint(1, 25))
+                ]
+            )
+
+        expected = python_attendances(self.project, START, END)
+
+        self.assertGreater(expected, 60)
+        self.assertEqual(custom_get_attendances(self.project, START, END), expected)
+
+
+class CountContactsByProjectTestCase(AttendancesTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_project = self.project.organization.project.create(
+            name="Other project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+        self.empty_project = self.project.organization.project.create(
+            name="Empty project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+        rng = random.Random(11)
+        base = pendulum.parse("2023-01-10T00:00:00+00:00")
+        shared_contacts = [uuid.uuid4() for _ in range(8)]
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    contact_flow_uuid=contact_flow_uuid,
+                    last_seen_on=base.add(hours=rng.uniform(0, 24 * 5)),
+                    project=project,
+                )
+                for project in (self.project, self.other_project)
+                for contact_flow_uuid in shared_contacts
+                for _ in range(rng.randint(1, 6))
+            ]
+        )
+        self.project_ids = [
+            self.project.pk,
+            self.other_project.pk,
+            self.empty_project.pk,
+        ]
+
+    def assertMatchesPerProject(self, counting_method, start=START, end=END):
+        with self.assertNumQueries(1):
+            counts = count_contacts_by_project(
+                self.project_ids, start, end, counting_method, exact=True
+            )
+
+        for project in (self.project, self.other_project, self.empty_project):
+            self.assertEqual(
+                counts.get(project.pk, 0),
+                project.get_contacts(
+                    pendulum.parse(end),
+                    pendulum.parse(start),
+                    counting_method=counting_method,
+                    exact=True,
+                ),
+            )
+
+    def test_active_contacts(self):
+        self.assertMatchesPerProject(BillingPlan.ACTIVE_CONTACTS)
+
+    @override_settings(NEW_ATTENDANCE_DATE="2023-06-30")
+    def test_legacy_attendances(self):
+        self.assertMatchesPerProject(BillingPlan.ATTENDANCES)
+
+    @override_settings(NEW_ATTENDANCE_DATE="2022-06-30")
+    def test_attendances(self):
+        self.assertMatchesPerProject(BillingPlan.ATTENDANCES)
+
+    def test_same_contact_is_counted_per_project(self):
+        counts = custom_get_attendances_by_project(self.project_ids, START, END)
+
+        self.assertEqual(
+            counts[self.project.pk], python_attendances(self.project, START, END)
+        )
+        self.assertEqual(
+            counts[self.other_project.pk],
+            python_attendances(self.other_project, START, END),
+        )
+        self.assertNotIn(self.empty_project.pk, counts)
+
+
+@skipUnless(
+    os.environ.get("RUN_BENCHMARKS"),
+    "Set RUN_BENCHMARKS=1 to benchmark attendance counting",
+)
+class CustomGetAttendancesBenchmark(AttendancesTestMixin, TestCase):
+    ROWS = 1_000_000
+    SIGHTINGS_PER_CONTACT = 10
+
+    def setUp(self):
+        super().setUp()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO billing_contact
+                    (uuid, contact_flow_uuid, last_seen_on, created_at, project_id)
+                SELECT
+                    md5('sighting' || i)::uuid,
+                    md5('contact' || (i / %(per_contact)s))::uuid,
+                    %(start)s::timestamptz + random() * INTERVAL '30 days',
+                    NOW(),
+                    %(project)s
+                FROM generate_series(1, %(rows)s) AS i
+                ON CONFLICT DO NOTHING
+                """,
+                {
+                    "per_contact": self.SIGHTINGS_PER_CONTACT,
+                    "start": START,
+                    "project": self.project.pk,
+                    "rows": self.ROWS,
+                },
+            )
+            cursor.execute("ANALYZE billing_contact")
+
+    def measure(self, function):
+        started = time.perf_counter()
+        result = function(self.project, START, END)
+        return result, time.perf_counter() - started
+
+    def test_benchmark(self):
+        sql_result, sql_elapsed = self.measure(custom_get_attendances)
+        python_result, python_elapsed = self.measure(python_attendances)
+
+        print(
+            f"\nattendances over {self.ROWS} rows: "
+            f"sql {sql_elapsed:.2f}s, python {python_elapsed:.2f}s"
+        )
+        self.assertEqual(sql_result, python_result)
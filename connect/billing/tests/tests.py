@@ -336,14 +336,8 @@ class BillingTasksTestCase(TestCase):
         response = celery_app.send_task(name="retry_billing_tasks")
         self.assertTrue(response.result)
 
-    @patch("connect.elastic.flow.ElasticFlow.clear_scroll")
-    @patch("connect.elastic.flow.ElasticFlow.get_paginated_contacts")
-    def test_sync_contacts_task_no_projects(
-        self, mock_clear_scroll, mock_get_paginated_contacts
-    ):
-        mock_clear_scroll.return_value = True
-        mock_get_paginated_contacts.return_value = True
-
+    @patch("connect.elastic.flow.ElasticFlow.iter_contact_pages")
+    def test_sync_contacts_task_no_projects(self, mock_iter_contact_pages):
         response = celery_app.send_task(
             name="sync_contacts",
             args=[
@@ -353,28 +347,45 @@ class BillingTasksTestCase(TestCase):
             ],
         )
         self.assertTrue(response.result)
+        mock_iter_contact_pages.assert_not_called()
 
-    @patch("connect.elastic.flow.ElasticFlow.clear_scroll")
-    @patch("connect.elastic.flow.ElasticFlow.get_paginated_contacts")
-    def test_sync_contacts_else_task(
-        self, mock_clear_scroll, mock_get_paginated_contacts
-    ):
-        mock_clear_scroll.return_value = True
-        mock_get_paginated_contacts.return_value = True
-
+    @patch("connect.elastic.flow.ElasticFlow.iter_contact_pages")
+    def test_sync_contacts_else_task(self, mock_iter_contact_pages):
         response = celery_app.send_task(name="sync_contacts")
         self.assertTrue(response.result)
 
-    @patch("connect.elastic.flow.ElasticFlow.get_paginated_contacts")
-    @patch("connect.elastic.flow.ElasticFlow.clear_scroll")
-    def test_sync_contacts_task(self, mock_clear_scroll, mock_get_paginated_contacts):
-        mock_clear_scroll.return_value = True
+    @patch("connect.elastic.flow.ElasticFlow.iter_contact_pages")
+    def test_sync_contacts_task(self, mock_iter_contact_pages):
+        contact_uuid = str(uuid.uuid4())
+        page = [
+            {
+                "uuid": contact_uuid,
+                "name": "contact",
+                "last_seen_on": "2022-04-08T10:20:00+00:00",
+            }
+        ]
+        # The second page repeats the first one, as a retried page would.
+        mock_iter_contact_pages.return_value = iter([page, page])
 
-        mock_scroll = {"scroll_id": "123", "scroll_size": 100}
-        mock_hits = "test"
+        self.project.flow_id = 1
+        self.project.save()
 
-        mock_get_paginated_contacts.return_value = mock_scroll, mock_hits
+        response = celery_app.send_task(
+            name="sync_contacts",
+            args=[
+                str(self.manager_task.before),
+                str(self.manager_task.after),
+                str(self.manager_task.uuid),
+            ],
+        )
+        self.assertTrue(response.result)
+        contacts = Contact.objects.filter(project=self.project)
+        self.assertEqual(contacts.count(), 1)
+        self.assertEqual(str(contacts.first().contact_flow_uuid), contact_uuid)
 
+    @patch("connect.elastic.flow.ElasticFlow.iter_contact_pages")
+    def test_sync_contacts_keeps_a_project_failure(self, mock_iter_contact_pages):
+        mock_iter_contact_pages.side_effect = Exception("test")
         self.project.flow_id = 1
         self.project.save()
 
@@ -386,28 +397,33 @@ class BillingTasksTestCase(TestCase):
                 str(self.manager_task.uuid),
             ],
         )
-        self.assertTrue(response.result)
 
-    @patch("connect.elastic.flow.ElasticFlow.get_paginated_contacts")
-    @patch("connect.elastic.flow.ElasticFlow.clear_scroll")
-    def test_exception_sync_contacts_task(
-        self, mock_clear_scroll, mock_get_paginated_contacts
-    ):
-        mock_clear_scroll.return_value = True
-        mock_get_paginated_contacts.side_effect = Exception("test")
+        self.assertFalse(response.result)
+        self.manager_task.refresh_from_db()
+        self.assertFalse(self.manager_task.status)
+        self.assertIsNotNone(self.manager_task.finished_at)
+        self.assertEqual(self.manager_task.fail_message.count(), 1)
+
+    @patch("connect.elastic.flow.ElasticFlow.iter_contact_pages")
+    def test_exception_sync_project_contacts_task(self, mock_iter_contact_pages):
+        mock_iter_contact_pages.side_effect = Exception("test")
 
         self.project.flow_id = 1
         self.project.save()
 
         response = celery_app.send_task(
-            name="sync_contacts",
+            name="sync_project_contacts",
             args=[
+                str(self.project.uuid),
                 str(self.manager_task.before),
                 str(self.manager_task.after),
                 str(self.manager_task.uuid),
             ],
         )
         self.assertFalse(response.result)
+        self.manager_task.refresh_from_db()
+        self.assertFalse(self.manager_task.status)
+        self.assertEqual(self.manager_task.fail_message.count(), 1)
 
 
 class EndTrialPlanVtexExclusionTestCase(TestCase):
@@ -455,7 +471,7 @@ class EndTrialPlanVtexExclusionTestCase(TestCase):
         self.vtex_project.save(update_fields=["vtex_account"])
         self.assertFalse(self.org_with_vtex.has_vtex_project)
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.common.models.current_app.send_task")
     def test_end_trial_plan_skips_org_with_vtex_project(
         self, mock_send_task, mock_permission
@@ -471,7 +487,7 @@ class EndTrialPlanVtexExclusionTestCase(TestCase):
         self.assertFalse(self.org_with_vtex.is_suspended)
         self.assertTrue(self.org_with_vtex.organization_billing.is_active)
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.common.models.current_app.send_task")
     def test_end_trial_plan_suspends_org_without_vtex_project(
         self, mock_send_task, mock_permission
@@ -487,7 +503,7 @@ class EndTrialPlanVtexExclusionTestCase(TestCase):
         self.assertTrue(self.org_without_vtex.is_suspended)
         self.assertFalse(self.org_without_vtex.organization_billing.is_active)
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.common.models.current_app.send_task")
     def test_end_trial_plan_skips_vtex_org_with_extension(
         self, mock_send_task, mock_permission
@@ -3,8 +3,14 @@ import random
 import pendulum
 from django.test import TestCase
 from connect.common.models import Project, Organization, BillingPlan
-from connect.billing.models import Contact, ContactCount
+from connect.billing.models import (
+    BILLING_TIMEZONE,
+    Contact,
+    ContactCount,
+    ContactDailyRollup,
+)
 from connect.billing.tasks import daily_contact_count
+from connect.billing.utils import get_attendances
 from freezegun import freeze_time
 from connect.common.mocks import StripeMockGateway
 from unittest.mock import patch
@@ -110,7 +116,7 @@ class CountContactsTestCase(TestCase):
 
                 contact_list.extend([contact, contact2, contact3])
 
-        Contact.objects.bulk_create(contact_list)
+        Contact.objects.bulk_create(contact_list, ignore_conflicts=True)
 
     def test_count(self):
         daily_contact_count()
@@ -122,3 +128,148 @@ class CountContactsTestCase(TestCase):
             )
             total = sum([day_count.count for day_count in contacts_day_count])
             self.assertEquals(total, 20)
+
+
+class ContactDailyRollupTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway) -> None:
+        mock_get_gateway.return_value = StripeMockGateway()
+        organization = Organization.objects.create(
+            name="test organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.project = organization.project.create(
+            name="Project",
+            timezone="America/Sao_Paulo",
+            flow_organization=uuid.uuid4(),
+        )
+        self.day = pendulum.datetime(2023, 8, 1, tz="UTC")
+        self.contact_uuids = [uuid.uuid4() for _ in range(3)]
+
+        # Every contact is seen on both days, the first one twice on day 1.
+        sightings = [(self.contact_uuids[0], self.day.add(hours=1))]
+        for contact_uuid in self.contact_uuids:
+            sightings.append((contact_uuid, self.day.add(hours=10)))
+            sightings.append((contact_uuid, self.day.add(days=1, hours=10)))
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    contact_flow_uuid=contact_uuid,
+                    last_seen_on=last_seen_on,
+                    project=self.project,
+                )
+                for contact_uuid, last_seen_on in sightings
+            ]
+        )
+
+    def refresh(self):
+        return ContactDailyRollup.objects.refresh(
+            self.day.date(), self.day.add(days=1).date()
+        )
+
+    def test_refresh_builds_one_row_per_project_and_day(self):
+        self.assertEqual(self.refresh(), 2)
+
+        rollup = ContactDailyRollup.objects.get(
+            project=self.project, day=self.day.date()
+        )
+        self.assertEqual(rollup.count, 3)
+        self.assertEqual(sorted(rollup.contact_uuids), sorted(self.contact_uuids))
+
+    def test_refresh_replaces_stale_rows(self):
+        self.refresh()
+        Contact.objects.create(
+            contact_flow_uuid=uuid.uuid4(),
+            last_seen_on=self.day.add(hours=20),
+            project=self.project,
+        )
+
+        self.refresh()
+
+        self.assertEqual(
+            ContactDailyRollup.objects.get(
+                project=self.project, day=self.day.date()
+            ).count,
+            4,
+        )
+
+    def test_rollup_counts_match_raw_counts(self):
+        self.refresh()
+        after = str(self.day)
+        before = str(self.day.add(days=1).end_of("day"))
+
+        with self.settings(USE_CONTACT_DAILY_ROLLUP=True):
+            active_contacts = self.project.get_contacts(
+                before, after, counting_method=BillingPlan.ACTIVE_CONTACTS
+            )
+            attendances = self.project.get_contacts(
+                before, after, counting_method=BillingPlan.ATTENDANCES
+            )
+
+        self.assertEqual(active_contacts, 3)
+        self.assertEqual(attendances, get_attendances(self.project, after, before))
+        self.assertEqual(attendances, 6)
+
+    def test_days_are_cut_in_the_billing_timezone(self):
+        late_contact, early_contact = uuid.uuid4(), uuid.uuid4()
+        Contact.objects.bulk_create(
+            [
+                # 22:00 of day 1 in America/Maceio (UTC-3).
+                Contact(
+                    contact_flow_uuid=late_contact,
+                    last_seen_on=self.day.add(days=1, hours=1),
+                    project=self.project,
+                ),
+                # 01:00 of day 2 in America/Maceio.
+                Contact(
+                    contact_flow_uuid=early_contact,
+                    last_seen_on=self.day.add(days=1, hours=4),
+                    project=self.project,
+                ),
+            ]
+        )
+        self.refresh()
+
+        first_day, second_day = [
+            set(
+                ContactDailyRollup.objects.get(
+                    project=self.project, day=day.date()
+                ).contact_uuids
+            )
+            for day in (self.day, self.day.add(days=1))
+        ]
+        self.assertIn(late_contact, first_day)
+        self.assertNotIn(early_contact, first_day)
+        self.assertIn(early_contact, second_day)
+        self.assertNotIn(late_contact, second_day)
+
+        day = pendulum.datetime(2023, 8, 1, tz=BILLING_TIMEZONE)
+        after, before = str(day), str(day.end_of("day"))
+        with self.settings(USE_CONTACT_DAILY_ROLLUP=True):
+            rollup_count, exact_count = [
+                self.project.get_contacts(
+                    before,
+                    after,
+                    counting_method=BillingPlan.ACTIVE_CONTACTS,
+                    exact=exact,
+                )
+                for exact in (False, True)
+            ]
+        self.assertEqual(rollup_count, 4)
+        self.assertEqual(exact_count, rollup_count)
+
+    def test_exact_count_ignores_rollup(self):
+        after = str(self.day)
+        before = str(self.day.add(days=1).end_of("day"))
+
+        with self.settings(USE_CONTACT_DAILY_ROLLUP=True):
+            active_contacts = self.project.get_contacts(
+                before,
+                after,
+                counting_method=BillingPlan.ACTIVE_CONTACTS,
+                exact=True,
+            )
+
+        self.assertEqual(active_contacts, 3)
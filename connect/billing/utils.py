@@ -1,9 +1,14 @@
-from connect.common.models import Project
+import datetime
+from collections import defaultdict
+from connect.common.models import BillingPlan, Project
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import TruncDate
 from pendulum.datetime import DateTime
-from typing import Tuple
-from connect.billing.models import Contact
+from typing import Dict, List, Tuple
+from connect.billing.models import BILLING_TIMEZONE, Contact, ContactDailyRollup
 import pendulum
-from itertools import groupby
 
 
 def day_period(day: DateTime) -> Tuple[DateTime, ...]:
@@ -37,33 +42,255 @@ def get_attendances(project: Project, start: str, end: str) -> int:
     return total_per_project
 
 
-def count_attendances(contact_group: list):
-    attendances = 1
-    base_contact = contact_group[0]
+def rollup_days(start: str, end: str) -> Tuple:
+    """Return the ``BILLING_TIMEZONE`` days covering ``[start, end]``."""
+    start = pendulum.parse(start).in_timezone(BILLING_TIMEZONE)
+    end = pendulum.parse(end).in_timezone(BILLING_TIMEZONE)
+    return start.date(), end.date()
 
-    for contact in contact_group:
-        date_period = pendulum.instance(base_contact.last_seen_on) - pendulum.instance(
-            contact.last_seen_on
+
+def get_rollup_active_contacts(project: Project, start: str, end: str) -> int:
+    """Distinct contacts of the period, read from the daily rollup.
+
+    Partial days at the edges of the period are counted as whole days; use
+    the Contact table when an exact count is required (e.g. invoices).
+    """
+    first_day, last_day = rollup_days(start, end)
+    return ContactDailyRollup.objects.filter(
+        project=project, day__range=(first_day, last_day)
+    ).active_contacts()
+
+
+def get_rollup_attendances(project: Project, start: str, end: str) -> int:
+    """Same as ``get_attendances``, read from the daily rollup."""
+    first_day, last_day = rollup_days(start, end)
+    return ContactDailyRollup.objects.filter(
+        project=project, day__range=(first_day, last_day)
+    ).attendances()
+
+
+# A contact's sightings are walked from the latest to the oldest, and a new
+# attendance starts whenever a sighting is at least one day older than the
+# sighting that started the current attendance.
+#
+# A gap of one day or more between consecutive sightings (LAG) always starts a
+# new attendance, which splits the sightings into independent islands. An
+# island spanning less than a day is exactly one attendance; only the rare
+# islands spanning a day or more are walked row by row (recursive CTE).
+#
+# Every project in %(projects)s is counted in the same pass, one row each.
+ATTENDANCES_SQL = """
+WITH RECURSIVE sightings AS (
+    SELECT
+        project_id,
+        contact_flow_uuid,
+        last_seen_on,
+        LAG(last_seen_on) OVER (
+            PARTITION BY project_id, contact_flow_uuid ORDER BY last_seen_on DESC
+        ) AS later_seen_on
+    FROM billing_contact
+    WHERE project_id = ANY(%(projects)s)
+      AND last_seen_on BETWEEN %(start)s AND %(end)s
+),
+islands AS (
+    SELECT
+        project_id,
+        contact_flow_uuid,
+        last_seen_on,
+        SUM(
+            CASE
+                WHEN later_seen_on IS NULL
+                  OR later_seen_on - last_seen_on >= INTERVAL '1 day'
+                THEN 1 ELSE 0
+            END
+        ) OVER (
+            PARTITION BY project_id, contact_flow_uuid
+            ORDER BY last_seen_on DESC
+            ROWS UNBOUNDED PRECEDING
+        ) AS island
+    FROM sightings
+),
+spans AS (
+    SELECT
+        project_id,
+        contact_flow_uuid,
+        island,
+        MAX(last_seen_on) - MIN(last_seen_on) >= INTERVAL '1 day' AS is_long
+    FROM islands
+    GROUP BY project_id, contact_flow_uuid, island
+),
+long_sightings AS (
+    SELECT
+        islands.project_id,
+        islands.contact_flow_uuid,
+        islands.island,
+        islands.last_seen_on,
+        ROW_NUMBER() OVER (
+            PARTITION BY islands.project_id, islands.contact_flow_uuid, islands.island
+            ORDER BY islands.last_seen_on DESC
+        ) AS position
+    FROM islands
+    JOIN spans USING (project_id, contact_flow_uuid, island)
+    WHERE spans.is_long
+),
+walk AS (
+    SELECT
+        project_id,
+        contact_flow_uuid,
+        island,
+        position,
+        last_seen_on AS anchor,
+        1 AS total
+    FROM long_sightings
+    WHERE position = 1
+    UNION ALL
+    SELECT
+        sighting.project_id,
+        sighting.contact_flow_uuid,
+        sighting.island,
+        sighting.position,
+        CASE
+            WHEN walk.anchor - sighting.last_seen_on >= INTERVAL '1 day'
+            THEN sighting.last_seen_on ELSE walk.anchor
+        END,
+        walk.total + CASE
+            WHEN walk.anchor - sighting.last_seen_on >= INTERVAL '1 day'
+            THEN 1 ELSE 0
+        END
+    FROM walk
+    JOIN long_sightings AS sighting
+      ON sighting.project_id = walk.project_id
+     AND sighting.contact_flow_uuid = walk.contact_flow_uuid
+     AND sighting.island = walk.island
+     AND sighting.position = walk.position + 1
+)
+SELECT project_id, SUM(attendances)
+FROM (
+    SELECT project_id, COUNT(*) AS attendances
+    FROM spans
+    WHERE NOT is_long
+    GROUP BY project_id
+    UNION ALL
+    SELECT project_id, total
+    FROM (
+        SELECT DISTINCT ON (project_id, contact_flow_uuid, island)
+            project_id, total
+        FROM walk
+        ORDER BY project_id, contact_flow_uuid, island, position DESC
+    ) AS finished_walks
+) AS counts
+GROUP BY project_id
+"""
+
+
+def custom_get_attendances_by_project(
+    project_ids: List[int], start: str, end: str
+) -> Dict[int, int]:
+    """``custom_get_attendances`` of several projects with a single query."""
+    start = pendulum.parse(start)
+    end = pendulum.parse(end)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            ATTENDANCES_SQL,
+            {"projects": list(project_ids), "start": start, "end": end},
+        )
+        return {project_id: int(total) for project_id, total in cursor.fetchall()}
+
+
+def custom_get_attendances(project: Project, start: str, end: str) -> int:
+    return custom_get_attendances_by_project([project.pk], start, end).get(
+        project.pk, 0
+    )
+
+
+def get_active_contacts_by_project(
+    project_ids: List[int], start: str, end: str
+) -> Dict[int, int]:
+    """Distinct contacts of each project in the period, with one query."""
+    return dict(
+        Contact.objects.filter(
+            project_id__in=project_ids,
+            last_seen_on__range=(pendulum.parse(start), pendulum.parse(end)),
         )
-        if abs(date_period.days) >= 1:
-            attendances += 1
-            base_contact = contact
+        .values("project")
+        .annotate(total=Count("contact_flow_uuid", distinct=True))
+        .order_by()
+        .values_list("project", "total")
+    )
 
-    return attendances
 
+def get_attendances_by_project(
+    project_ids: List[int], start: str, end: str
+) -> Dict[int, int]:
+    """``get_attendances`` of several projects with one grouped query.
 
-def custom_get_attendances(project: Project, start: str, end: str):
+    Days are cut in the timezone of ``start``, as ``get_attendances`` does.
+    """
     start = pendulum.parse(start)
     end = pendulum.parse(end)
-    total_attendances = 0
+    days = (
+        Contact.objects.filter(
+            project_id__in=project_ids, last_seen_on__range=(start, end)
+        )
+        .annotate(
+            day=TruncDate("last_seen_on", tzinfo=datetime.timezone(start.utcoffset()))
+        )
+        .values("project", "day")
+        .annotate(total=Count("contact_flow_uuid", distinct=True))
+        .order_by()
+        .values_list("project", "total")
+    )
+    totals = defaultdict(int)
+    for project_id, total in days:
+        totals[project_id] += total
+    return dict(totals)
+
+
+def get_rollup_active_contacts_by_project(
+    project_ids: List[int], start: str, end: str
+) -> Dict[int, int]:
+    """``get_rollup_active_contacts`` of several projects with one query."""
+    first_day, last_day = rollup_days(start, end)
+    return ContactDailyRollup.objects.filter(
+        project_id__in=project_ids, day__range=(first_day, last_day)
+    ).active_contacts_by_project()
+
+
+def get_rollup_attendances_by_project(
+    project_ids: List[int], start: str, end: str
+) -> Dict[int, int]:
+    """``get_rollup_attendances`` of several projects with one query."""
+    first_day, last_day = rollup_days(start, end)
+    return ContactDailyRollup.objects.filter(
+        project_id__in=project_ids, day__range=(first_day, last_day)
+    ).attendances_by_project()
+
+
+def count_contacts_by_project(
+    project_ids: List[int],
+    start: str,
+    end: str,
+    counting_method: str,
+    exact: bool = False,
+) -> Dict[int, int]:
+    """``Project.get_contacts`` for several projects of the same plan method.
+
+    Each counting method is answered with one grouped query, whatever the
+    number of projects. Projects without contacts are left out.
+    """
+    use_rollup = settings.USE_CONTACT_DAILY_ROLLUP and not exact
 
-    contacts = Contact.objects.filter(
-        last_seen_on__range=(start, end), project=project
-    ).order_by("contact_flow_uuid", "-last_seen_on")
-    grouped_contacts = groupby(contacts, lambda contact: contact.contact_flow_uuid)
+    if counting_method == BillingPlan.ACTIVE_CONTACTS:
+        if use_rollup:
+            return get_rollup_active_contacts_by_project(project_ids, start, end)
+        return get_active_contacts_by_project(project_ids, start, end)
 
-    for _, group in grouped_contacts:
-        contact_group = list(group)
-        total_attendances += count_attendances(contact_group)
+    if pendulum.parse(start) < pendulum.parse(settings.NEW_ATTENDANCE_DATE).end_of(
+        "day"
+    ):
+        if use_rollup:
+            return get_rollup_attendances_by_project(project_ids, start, end)
+        return get_attendances_by_project(project_ids, start, end)
 
-    return total_attendances
+    return custom_get_attendances_by_project(project_ids, start, end)
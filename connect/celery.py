@@ -22,9 +22,11 @@ app.conf.task_routes = {
     "count_contacts": {"queue": "billing"},
     "retry_billing_tasks": {"queue": "billing"},
     "create_contacts": {"queue": "billing"},
+    "sync_project_contacts": {"queue": "billing"},
     "end_trial_plan": {"queue": "billing"},
     "daily_contact_count": {"queue": "billing"},
     "sync_total_contact_count": {"queue": "sync"},
+    "sync_total_contact_count_chunk": {"queue": "sync"},
 }
 
 
@@ -34,7 +36,7 @@ app.conf.beat_schedule = {
         "schedule": schedules.crontab(minute="*/6"),
     },
     "sync_total_contact_count": {
-        "task": "connect.common.tasks.sync_total_contact_count",
+        "task": "sync_total_contact_count",
         "schedule": schedules.crontab(hour="3", minute=0),
     },
     "capture_invoice": {
@@ -65,6 +67,10 @@ app.conf.beat_schedule = {
         "task": "daily_contact_count",
         "schedule": schedules.crontab(hour="23", minute=59),
     },
+    "reconcile_organization_aggregates": {
+        "task": "reconcile_organization_aggregates",
+        "schedule": schedules.crontab(hour="4", minute=0),
+    },
     "end_trial_plan": {
         "task": "end_trial_plan",
         "schedule": schedules.crontab(hour="20", minute=0),
@@ -0,0 +1,51 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Tuple
+
+from django.db.models import F
+
+
+class ProjectCounters:
+    """Buffers project counter deltas and applies them with atomic UPDATEs.
+
+    Callers ``add`` deltas as events arrive (one per project, or one for all
+    projects of an organization) and ``flush`` them once per batch. Deltas
+    for the same project and field are summed, and projects that end up with
+    the same delta share one ``UPDATE ... SET field = field + n`` statement,
+    so concurrent consumers never lose increments and no other column is
+    rewritten.
+    """
+
+    FIELDS = ("flow_count", "inteligence_count")
+
+    def __init__(self) -> None:
+        self._deltas: Dict[Tuple[str, int], int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def add(self, field: str, project_ids: Iterable[int], delta: int = 1) -> None:
+        if field not in self.FIELDS:
+            raise ValueError(f"{field} is not a project counter")
+        for project_id in project_ids:
+            self._deltas[(field, project_id)] += delta
+
+    def merge(self, other: "ProjectCounters") -> None:
+        """Add the deltas buffered by ``other`` to this buffer."""
+        for key, delta in other._deltas.items():
+            self._deltas[key] += delta
+
+    def flush(self) -> int:
+        """Apply the buffered deltas; returns the number of statements run."""
+        from connect.common.models import Project
+
+        groups = defaultdict(list)
+        for (field, project_id), delta in self._deltas.items():
+            if delta:
+                groups[(field, delta)].append(project_id)
+        self._deltas.clear()
+
+        for (field, delta), project_ids in groups.items():
+            Project.objects.filter(pk__in=project_ids).update(
+                **{field: F(field) + delta}
+            )
+        return len(groups)
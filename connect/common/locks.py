@@ -72,6 +72,11 @@ class RedisLockService:
                 f"Redis unavailable for lock key={key}; proceeding unlocked: {exc}"
             )
             return None
+        except NotImplementedError:
+            # django-redis raises this when the default cache is not Redis
+            # (e.g. LocMemCache in tests): there is nothing to lock with.
+            logger.debug(f"No Redis cache for lock key={key}; proceeding unlocked")
+            return None
 
         if not acquired:
             raise LockNotAcquiredError(
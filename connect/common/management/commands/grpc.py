@@ -1,10 +1,13 @@
 import grpc
 from concurrent import futures
+from django.conf import settings
 from django_grpc_framework.management.commands.grpcrunserver import (
     Command as BaseCommand,
 )
 from django_grpc_framework.settings import grpc_settings
 
+from connect.api.grpc.interceptors import DatabaseConnectionInterceptor
+
 
 class Command(BaseCommand):
     def add_arguments(self, parser):
@@ -22,9 +25,15 @@ class Command(BaseCommand):
         super().handle(*args, **options)
 
     def _serve(self):
+        # Each worker thread holds at most one database connection; RPCs past
+        # the concurrency limit are rejected instead of queueing for a thread.
         server = grpc.server(
             futures.ThreadPoolExecutor(max_workers=self.max_workers),
-            interceptors=grpc_settings.SERVER_INTERCEPTORS,
+            interceptors=[
+                DatabaseConnectionInterceptor(),
+                *(grpc_settings.SERVER_INTERCEPTORS or []),
+            ],
+            maximum_concurrent_rpcs=settings.GRPC_SERVER_MAXIMUM_CONCURRENT_RPCS,
         )
         grpc_settings.ROOT_HANDLERS_HOOK(server)
 
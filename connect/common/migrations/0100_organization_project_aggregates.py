@@ -0,0 +1,57 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_project_aggregates(apps, schema_editor):
+    Organization = apps.get_model("common", "Organization")
+    Project = apps.get_model("common", "Project")
+
+    totals = (
+        Project.objects.filter(organization=OuterRef("pk"))
+        .order_by()
+        .values("organization")
+    )
+    Organization.objects.update(
+        project_count=Coalesce(
+            Subquery(totals.annotate(total=Count("pk")).values("total")), 0
+        ),
+        project_contact_count=Coalesce(
+            Subquery(totals.annotate(total=Sum("contact_count")).values("total")), 0
+        ),
+        project_extra_active_integration=Coalesce(
+            Subquery(
+                totals.annotate(total=Sum("extra_active_integration")).values("total")
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0099_project_currency"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="project_count",
+            field=models.IntegerField(default=0, verbose_name="projects count"),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="project_contact_count",
+            field=models.IntegerField(
+                default=0, verbose_name="contacts count of all projects"
+            ),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="project_extra_active_integration",
+            field=models.IntegerField(
+                default=0, verbose_name="Whatsapp integrations of all projects"
+            ),
+        ),
+        migrations.RunPython(backfill_project_aggregates, migrations.RunPython.noop),
+    ]
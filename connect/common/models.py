@@ -10,8 +10,10 @@ import pendulum
 import stripe
 from celery import current_app
 from django.conf import settings
-from django.db import models
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.template.loader import render_to_string
 from django.utils import timezone, translation
 from django.utils.translation import activate, ugettext_lazy as _
@@ -26,6 +28,7 @@ from connect.api.v1.internal.intelligence.intelligence_rest_client import (
 )
 from connect.authentication.models import User
 from connect.billing.gateways.stripe_gateway import StripeGateway
+from connect.common.counters import ProjectCounters
 from connect.common.currencies import ISO_4217_CODE_LENGTH
 from connect.common.exceptions import (
     OrganizationAuthorizationException,
@@ -122,6 +125,68 @@ class OrganizationManager(models.Manager):
         BillingPlan.objects.create(organization=instance, **new_kwargs)
         return instance
 
+    def add_project_aggregates(
+        self,
+        organization_id,
+        project_count: int = 0,
+        contact_count: int = 0,
+        extra_active_integration: int = 0,
+    ) -> None:
+        """Atomically add deltas to an organization's project aggregates."""
+        if not (project_count or contact_count or extra_active_integration):
+            return
+        self.filter(pk=organization_id).update(
+            project_count=F("project_count") + project_count,
+            project_contact_count=F("project_contact_count") + contact_count,
+            project_extra_active_integration=(
+                F("project_extra_active_integration") + extra_active_integration
+            ),
+        )
+
+    def reconcile_project_aggregates(self) -> int:
+        """Recompute the project aggregates of organizations that drifted.
+
+        Returns the number of organizations that were repaired.
+        """
+        totals = (
+            Project.objects.filter(organization=OuterRef("pk"))
+            .order_by()
+            .values("organization")
+        )
+        actual = {
+            "project_count": Coalesce(
+                Subquery(totals.annotate(total=Count("pk")).values("total")), 0
+            ),
+            "project_contact_count": Coalesce(
+                Subquery(totals.annotate(total=Sum("contact_count")).values("total")),
+                0,
+            ),
+            "project_extra_active_integration": Coalesce(
+                Subquery(
+                    totals.annotate(total=Sum("extra_active_integration")).values(
+                        "total"
+                    )
+                ),
+                0,
+            ),
+        }
+        drifted = list(
+            self.annotate(**{f"actual_{name}": value for name, value in actual.items()})
+            .filter(
+                ~Q(project_count=F("actual_project_count"))
+                | ~Q(project_contact_count=F("actual_project_contact_count"))
+                | ~Q(
+                    project_extra_active_integration=F(
+                        "actual_project_extra_active_integration"
+                    )
+                )
+            )
+            .values_list("pk", flat=True)
+        )
+        if drifted:
+            self.filter(pk__in=drifted).update(**actual)
+        return len(drifted)
+
 
 class Organization(models.Model):
     class Meta:
@@ -141,6 +206,15 @@ class Organization(models.Model):
         default=False, help_text=_("Whether this organization is currently suspended.")
     )
     extra_integration = models.IntegerField(_("Whatsapp Extra Integration"), default=0)
+    # Aggregates of the organization's projects, kept up to date by the
+    # Project signals and repaired by reconcile_organization_aggregates.
+    project_count = models.IntegerField(_("projects count"), default=0)
+    project_contact_count = models.IntegerField(
+        _("contacts count of all projects"), default=0
+    )
+    project_extra_active_integration = models.IntegerField(
+        _("Whatsapp integrations of all projects"), default=0
+    )
     enforce_2fa = models.BooleanField(
         _("Only users with 2fa can access the organization"), default=False
     )
@@ -153,6 +227,12 @@ class Organization(models.Model):
 
     tracker = FieldTracker(fields=["is_suspended"])
 
+    PROJECT_AGGREGATE_FIELDS = (
+        "project_count",
+        "project_contact_count",
+        "project_extra_active_integration",
+    )
+
     @property
     def has_vtex_project(self):
         return self.project.filter(
@@ -163,6 +243,56 @@ class Organization(models.Model):
     def __str__(self):
         return f"{self.uuid} - {self.name}"
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        # The project aggregates only change through F() deltas; writing them
+        # back from a stale instance would undo concurrent project changes.
+        if update_fields is None and not (self._state.adding or force_insert):
+            deferred_fields = self.get_deferred_fields()
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred_fields
+                and field.name not in self.PROJECT_AGGREGATE_FIELDS
+            ]
+        super().save(
+            force_insert=force_insert,
+            force_update=force_update,
+            using=using,
+            update_fields=update_fields,
+        )
+
+    def suspend_projects(self, is_suspended: bool) -> bool:
+        """Sends one task that (un)suspends every project of the organization.
+
+        Asking again for the same state within SUSPEND_PROJECTS_DEDUP_TTL
+        seconds is a no-op, so callers that save the organization (which
+        already dispatches on an ``is_suspended`` change) and then ask
+        explicitly only send it once.
+        """
+        dedup_key = f"organization:{self.uuid}:projects-suspended"
+        try:
+            if cache.get(dedup_key) == is_suspended:
+                return False
+            cache.set(dedup_key, is_suspended, settings.SUSPEND_PROJECTS_DEDUP_TTL)
+        except Exception as error:
+            logger.warning(f"Failed to deduplicate projects suspension: {error}")
+
+        project_uuids = [
+            str(project_uuid)
+            for project_uuid in self.project.values_list("uuid", flat=True)
+        ]
+        if not project_uuids:
+            return False
+
+        current_app.send_task(  # pragma: no cover
+            name="suspend_organization_projects",
+            args=[project_uuids, is_suspended],
+        )
+        return True
+
     def get_user_authorization(self, user, **kwargs):
         if user.is_anonymous:
             return OrganizationAuthorization(organization=self)  # pragma: no cover
@@ -239,16 +369,11 @@ class Organization(models.Model):
 
     @property
     def active_contacts(self):
-        active_contact_counter = 0
-        for project in self.project.all():
-            active_contact_counter += project.contact_count
-        return active_contact_counter
+        return self.project_contact_count
 
     @property
     def extra_active_integrations(self):
-        active_integrations_counter = 0
-        for project in self.project.all():
-            active_integrations_counter += project.extra_active_integration
+        active_integrations_counter = self.project_extra_active_integration
         return (
             0 if active_integrations_counter <= 1 else active_integrations_counter - 1
         )
@@ -647,6 +772,10 @@ class Project(models.Model):
         blank=True,
     )
 
+    tracker = FieldTracker(
+        fields=["organization", "contact_count", "extra_active_integration"]
+    )
+
     def __str__(self):
         return f"{self.uuid} - Project: {self.name} - Org: {self.organization.name}"
 
@@ -675,19 +804,9 @@ class Project(models.Model):
 
     def project_search(self, text: str):
         """Searches for project in flows and intelligence"""
+        from connect.usecases.project.search_project import SearchProjectUseCase
 
-        flows_client = FlowsRESTClient()
-        intelligence_client = IntelligenceRESTClient()
-
-        flows_result = flows_client.get_project_flows(
-            project_uuid=self.uuid, flow_name=text
-        )
-        intelligence_result = intelligence_client.get_organization_intelligences(
-            intelligence_name=text,
-            organization_id=self.organization.inteligence_organization,
-        )
-
-        return {"flow": flows_result, "intelligence": intelligence_result}
+        return SearchProjectUseCase().execute(self, text)
 
     def create_classifier(self, authorization, template_type: str, access_token: str):
         flow_instance = FlowsRESTClient()
@@ -816,14 +935,34 @@ class Project(models.Model):
             )
         return email
 
-    def get_contacts(self, before: str, after: str, counting_method: str = None):
+    def get_contacts(
+        self,
+        before: str,
+        after: str,
+        counting_method: str = None,
+        exact: bool = False,
+    ):
+        """Count the project's contacts between ``after`` and ``before``.
+
+        With ``USE_CONTACT_DAILY_ROLLUP`` on, active contacts and legacy
+        attendances are read from the daily rollup unless ``exact`` is set.
+        """
         from connect.billing.models import Contact
-        from connect.billing.utils import custom_get_attendances, get_attendances
+        from connect.billing.utils import (
+            custom_get_attendances,
+            get_attendances,
+            get_rollup_active_contacts,
+            get_rollup_attendances,
+        )
 
         if not counting_method:
             counting_method = self.organization.organization_billing.plan_method
 
+        use_rollup = settings.USE_CONTACT_DAILY_ROLLUP and not exact
+
         if counting_method == BillingPlan.ACTIVE_CONTACTS:
+            if use_rollup:
+                return get_rollup_active_contacts(self, str(after), str(before))
             return (
                 Contact.objects.filter(project=self)
                 .filter(last_seen_on__range=(after, before))
@@ -834,25 +973,29 @@ class Project(models.Model):
         if pendulum.parse(str(after)) < pendulum.parse(
             settings.NEW_ATTENDANCE_DATE
         ).end_of("day"):
+            if use_rollup:
+                return get_rollup_attendances(self, str(after), str(before))
             return get_attendances(self, str(after), str(before))
 
         return custom_get_attendances(self, str(after), str(before))
 
+    def _add_to_counter(self, field: str, delta: int):
+        counters = ProjectCounters()
+        counters.add(field, [self.pk], delta)
+        counters.flush()
+        self.refresh_from_db(fields=[field])
+
     def increment_inteligence_count(self):
-        self.inteligence_count += 1
-        self.save()
+        self._add_to_counter("inteligence_count", 1)
 
     def decrement_inteligence_count(self):
-        self.inteligence_count -= 1
-        self.save()
+        self._add_to_counter("inteligence_count", -1)
 
     def increment_flow_count(self):
-        self.flow_count += 1
-        self.save()
+        self._add_to_counter("flow_count", 1)
 
     def decrement_flow_count(self):
-        self.flow_count -= 1
-        self.save()
+        self._add_to_counter("flow_count", -1)
 
 
 class OpenedProject(models.Model):
@@ -1391,10 +1534,7 @@ class BillingPlan(models.Model):
                     payment_method="credit_card",
                     invoice_amount=(charges["data"][0]["amount"] / 100),
                 )
-                for project in self.organization.project.all():  # pragma: no cover
-                    current_app.send_task(
-                        name="update_suspend_project", args=[project.uuid, False]
-                    )
+                self.organization.suspend_projects(False)
 
         return super().save(force_insert, force_update, using, update_fields)
 
@@ -1511,9 +1651,7 @@ class BillingPlan(models.Model):
 
     @property
     def _currenty_invoice(self):
-        contact_count = self.organization.project.aggregate(
-            total_contact_count=Sum("contact_count")
-        ).get("total_contact_count")
+        contact_count = self.organization.project_contact_count
 
         amount_currenty = 0
 
@@ -1538,9 +1676,7 @@ class BillingPlan(models.Model):
     @property
     def currenty_invoice(self):
         # Total contacts of the organization
-        contact_count = self.organization.project.aggregate(
-            total_contact_count=Sum("contact_count")
-        ).get("total_contact_count")
+        contact_count = self.organization.project_contact_count
 
         if self.plan != self.PLAN_ENTERPRISE:
             amount_currenty = Decimal(
@@ -1799,10 +1935,7 @@ class BillingPlan(models.Model):
         self.save(update_fields=["is_active"])
         self.organization.is_suspended = True
         self.organization.save(update_fields=["is_suspended"])
-        for project in self.organization.project.all():
-            current_app.send_task(  # pragma: no cover
-                name="update_suspend_project", args=[project.uuid, True]
-            )
+        self.organization.suspend_projects(True)
 
     @property
     def days_till_trial_end(self):
@@ -1849,10 +1982,7 @@ class BillingPlan(models.Model):
                 pass
             self.organization.is_suspended = False
             self.organization.save(update_fields=["is_suspended"])
-            for project in self.organization.project.all():
-                current_app.send_task(  # pragma: no cover
-                    name="update_suspend_project", args=[project.uuid, False]
-                )
+            self.organization.suspend_projects(False)
         return True
 
 
@@ -2191,7 +2321,37 @@ class RecentActivity(models.Model):
         return data
 
     @staticmethod
-    def create_recent_activities(validated_data, user):
+    def create_recent_activities(validated_data, user, counters=None):
+        """Record the activity for the event's projects and update their counts.
+
+        Counter changes go through ``ProjectCounters``. When ``counters`` is
+        given the deltas are only buffered, so a consumer can aggregate a
+        batch of events and flush them together; otherwise they are applied
+        here with one UPDATE for all projects.
+        """
+        flush = counters is None
+        counters = counters if counters is not None else ProjectCounters()
+        recent_activities = RecentActivity.build_recent_activities(
+            validated_data, user, counters
+        )
+
+        with transaction.atomic():
+            new_recent_activities = RecentActivity.objects.bulk_create(
+                recent_activities
+            )
+            if flush:
+                counters.flush()
+
+        return new_recent_activities
+
+    @staticmethod
+    def build_recent_activities(validated_data, user, counters, identity_cache=None):
+        """Return the unsaved activities of an event, buffering its counts.
+
+        Nothing is written: callers save the activities and flush
+        ``counters`` themselves, which lets a batch of events share them.
+        ``identity_cache`` resolves ``flow_organization`` when given.
+        """
         action = validated_data.get("action")
         entity = validated_data.get("entity")
         entity_name = validated_data.get("entity_name")
@@ -2201,59 +2361,60 @@ class RecentActivity(models.Model):
         organization_uuid = validated_data.get("organization_uuid")
 
         list_projects = []
-        organization = None
 
-        action_map = {
+        counter_map = {
             RecentActivity.FLOW: {
-                RecentActivity.CREATE: "increment_flow_count",
-                RecentActivity.DELETE: "decrement_flow_count",
+                RecentActivity.CREATE: ("flow_count", 1),
+                RecentActivity.DELETE: ("flow_count", -1),
             },
             RecentActivity.AI: {
-                RecentActivity.CREATE: "increment_inteligence_count",
-                RecentActivity.DELETE: "decrement_inteligence_count",
+                RecentActivity.CREATE: ("inteligence_count", 1),
+                RecentActivity.DELETE: ("inteligence_count", -1),
             },
             RecentActivity.NEXUS: {
-                RecentActivity.CREATE: "increment_inteligence_count",
-                RecentActivity.DELETE: "decrement_inteligence_count",
+                RecentActivity.CREATE: ("inteligence_count", 1),
+                RecentActivity.DELETE: ("inteligence_count", -1),
             },
         }
 
         if intelligence_id:
             raise Exception("Intelligence ID is not supported for recent activities")
         elif organization_uuid:
-            organization = Organization.objects.get(uuid=organization_uuid)
-            list_projects = list(organization.project.all())
+            list_projects = list(
+                Project.objects.filter(organization__uuid=organization_uuid).only("pk")
+            )
+            if not list_projects:
+                Organization.objects.get(uuid=organization_uuid)
+        elif flow_organization and identity_cache is not None:
+            list_projects = [
+                identity_cache.get_project_by_flow_organization(flow_organization)
+            ]
         else:
             list_projects = (
                 [Project.objects.filter(flow_organization=flow_organization).first()]
                 if flow_organization
                 else [Project.objects.filter(uuid=project.uuid).first()]
             )
+        list_projects = [item for item in list_projects if item is not None]
 
         if not list_projects:
             raise Exception("Project not found")
 
-        recent_activities = []
-        for project in list_projects:
-            try:
-                action_method = action_map.get(entity, {}).get(action)
-                if action_method:
-                    getattr(project, action_method)()
-                recent_activities.append(
-                    RecentActivity(
-                        action=action,
-                        entity=entity,
-                        user=user,
-                        project=project,
-                        entity_name=entity_name,
-                    )
-                )
-            except Exception as e:
-                print(f"Failed to execute action: {e}")
-
-        new_recent_activities = RecentActivity.objects.bulk_create(recent_activities)
+        counter = counter_map.get(entity, {}).get(action)
+        if counter:
+            field, delta = counter
+            counters.add(field, [item.pk for item in list_projects], delta)
 
-        return new_recent_activities
+        return [
+            RecentActivity(
+                action=action,
+                entity=entity,
+                user=user,
+                project=item,
+                entity_name=entity_name,
+            )
+            for item in list_projects
+        ]
 
 
 class NewsletterOrganization(models.Model):
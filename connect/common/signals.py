@@ -1,12 +1,12 @@
 import logging
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 
 from connect.authentication.models import User
-from connect.common.exceptions import ProjectAuthorizationException
 from connect.common.models import (
     BillingPlan,
     ChatsRole,
@@ -24,9 +24,13 @@ from connect.usecases.project.get_project_plan_status import (
     invalidate_organization_plan_status,
     invalidate_project_plan_status,
 )
-from connect.celery import app as celery_app
+from connect.usecases.project.resolve_flow_organizations import (
+    invalidate_organization_flow_mappings,
+    invalidate_project_flow_mapping,
+)
+from connect.usecases.recent_activities.identity_cache import identity_cache
 from connect.api.v1.internal.chats.chats_rest_client import ChatsRESTClient
-from connect.common.tasks import update_user_permission_project
+from connect.common.tasks import update_project_permissions
 
 from connect.usecases.authorizations.create import CreateAuthorizationUseCase
 from connect.usecases.authorizations.dto import CreateAuthorizationDTO
@@ -55,36 +59,83 @@ def create_service_status(sender, instance, created, **kwargs):
                 instance.created_by.send_request_flow_user_info(data)
 
         if instance.flow_organization:
-            for permission in instance.project_authorizations.all():
-                update_user_permission_project(
-                    project_uuid=str(instance.uuid),
-                    flow_organization=str(instance.flow_organization),
-                    user_email=permission.user.email,
-                    permission=permission.role,
-                )
+            propagate_project_permissions(instance)
 
-        for authorization in instance.organization.authorizations.all():
-            if authorization.can_contribute:
-                try:
-                    project_auth = instance.get_user_authorization(authorization.user)
-                    project_auth.role = authorization.role
-                    project_auth.save()
-                except ProjectAuthorizationException:
-                    project_auth = ProjectAuthorization.objects.create(
-                        user=authorization.user,
-                        project=instance,
-                        role=authorization.role,
-                        organization_authorization=authorization,
-                    )
+        sync_organization_project_authorizations(instance)
 
     elif update_fields and "flow_organization" in update_fields:
-        for permission in instance.project_authorizations.all():
-            update_user_permission_project(
-                project_uuid=str(instance.uuid),
-                flow_organization=str(instance.flow_organization),
-                user_email=permission.user.email,
-                permission=permission.role,
+        propagate_project_permissions(instance)
+
+
+def propagate_project_permissions(project: Project):
+    """Sends the project's (user, role) pairs to the modules in one task, once
+    the surrounding transaction commits."""
+    permissions = [
+        [user_email, role]
+        for user_email, role in project.project_authorizations.values_list(
+            "user__email", "role"
+        )
+    ]
+    if not permissions:
+        return
+
+    project_uuid = str(project.uuid)
+    flow_organization = str(project.flow_organization)
+    transaction.on_commit(
+        lambda: update_project_permissions.delay(
+            project_uuid=project_uuid,
+            flow_organization=flow_organization,
+            permissions=permissions,
+        )
+    )
+
+
+def sync_organization_project_authorizations(project: Project):
+    """Gives every contributing organization member the same role on a new
+    project, writing the authorizations in bulk."""
+    existing = {
+        authorization.user_id: authorization
+        for authorization in project.project_authorizations.all()
+    }
+    to_create = []
+    to_update = []
+
+    for authorization in project.organization.authorizations.all():
+        if not authorization.can_contribute:
+            continue
+
+        project_auth = existing.get(authorization.user_id)
+        if project_auth is None:
+            to_create.append(
+                ProjectAuthorization(
+                    user_id=authorization.user_id,
+                    project=project,
+                    role=authorization.role,
+                    organization_authorization=authorization,
+                )
             )
+        elif project_auth.role != authorization.role:
+            project_auth.role = authorization.role
+            to_update.append(project_auth)
+
+    ProjectAuthorization.objects.bulk_create(to_create)
+    ProjectAuthorization.objects.bulk_update(to_update, ["role"])
+
+    # bulk_create skips the post_save receiver that records the opened project.
+    user_ids = [authorization.user_id for authorization in to_create + to_update]
+    opened = set(
+        OpenedProject.objects.filter(project=project, user_id__in=user_ids).values_list(
+            "user_id", flat=True
+        )
+    )
+    now = timezone.now()
+    OpenedProject.objects.bulk_create(
+        [
+            OpenedProject(user_id=user_id, project=project, day=now)
+            for user_id in user_ids
+            if user_id not in opened
+        ]
+    )
 
 
 @receiver(post_save, sender=Service)
@@ -95,17 +146,11 @@ def create_service_default_in_all_user(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=Organization)
-def update_organization(instance, **kwargs):
+def update_organization(instance, created=False, **kwargs):
     from connect.usecases.organizations.eda_publisher import OrganizationEDAPublisher
 
-    for project in instance.project.all():
-        celery_app.send_task(  # pragma: no cover
-            name="update_suspend_project",
-            args=[
-                str(project.uuid),
-                instance.is_suspended,
-            ],
-        )
+    if not created and instance.tracker.has_changed("is_suspended"):
+        instance.suspend_projects(instance.is_suspended)
 
     if settings.USE_EDA and not settings.TESTING:
         eda_publisher = OrganizationEDAPublisher()
@@ -144,6 +189,97 @@ def invalidate_plan_status_on_project_delete(sender, instance, **kwargs):
     invalidate_project_plan_status(instance.uuid)
 
 
+@receiver(post_save, sender=Project)
+def update_organization_aggregates_on_project_save(
+    sender, instance, created=False, **kwargs
+):
+    """Keep the organization's project aggregates in step with the project."""
+    if created:
+        Organization.objects.add_project_aggregates(
+            instance.organization_id,
+            project_count=1,
+            contact_count=instance.contact_count,
+            extra_active_integration=instance.extra_active_integration,
+        )
+        return
+
+    tracker = instance.tracker
+    if not tracker.has_changed("organization"):
+        Organization.objects.add_project_aggregates(
+            instance.organization_id,
+            contact_count=instance.contact_count
+            - (tracker.previous("contact_count") or 0),
+            extra_active_integration=instance.extra_active_integration
+            - (tracker.previous("extra_active_integration") or 0),
+        )
+        return
+
+    # Moved to another organization: take it out of the old one entirely.
+    Organization.objects.add_project_aggregates(
+        tracker.previous("organization"),
+        project_count=-1,
+        contact_count=-(tracker.previous("contact_count") or 0),
+        extra_active_integration=-(tracker.previous("extra_active_integration") or 0),
+    )
+    Organization.objects.add_project_aggregates(
+        instance.organization_id,
+        project_count=1,
+        contact_count=instance.contact_count,
+        extra_active_integration=instance.extra_active_integration,
+    )
+
+
+@receiver(post_delete, sender=Project)
+def update_organization_aggregates_on_project_delete(sender, instance, **kwargs):
+    """Remove the deleted project from its organization's aggregates."""
+    Organization.objects.add_project_aggregates(
+        instance.organization_id,
+        project_count=-1,
+        contact_count=-instance.contact_count,
+        extra_active_integration=-instance.extra_active_integration,
+    )
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_flow_mapping_on_project_change(sender, instance, **kwargs):
+    """Drop the project's cached flow organization mapping."""
+    invalidate_project_flow_mapping(instance)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_identity_cache_on_project_change(sender, instance, **kwargs):
+    """Drop the project from this process' EDA identity cache."""
+    identity_cache.invalidate_project(instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_identity_cache_on_user_change(sender, instance, **kwargs):
+    """Drop the user from this process' EDA identity cache."""
+    identity_cache.invalidate_user(instance)
+
+
+@receiver(post_save, sender=Organization)
+def invalidate_flow_mappings_on_organization_save(
+    sender, instance, created=False, **kwargs
+):
+    """Drop cached flow organization mappings when mapped org fields change."""
+    if created:
+        return
+    update_fields = kwargs.get("update_fields") or set()
+    if update_fields and not set(update_fields) & {
+        "name",
+        "description",
+        "inteligence_organization",
+        "extra_integration",
+        "is_suspended",
+    }:
+        return
+    invalidate_organization_flow_mappings(instance)
+
+
 @receiver(post_delete, sender=ProjectAuthorization)
 def delete_opened_project(sender, instance, **kwargs):
     opened = OpenedProject.objects.filter(user=instance.user, project=instance.project)
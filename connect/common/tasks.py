@@ -1,12 +1,17 @@
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pendulum
 import grpc
 from grpc._channel import _InactiveRpcError
 
 from django.conf import settings
+from django.db.models import Count
 
 from connect import utils, billing
 from connect.authentication.models import User
+from connect.billing.models import SyncManagerTask
 from connect.celery import app
 from connect.common.models import (
     Organization,
@@ -25,12 +30,15 @@ from connect.api.v1.internal.intelligence.intelligence_rest_client import (
     IntelligenceRESTClient,
 )
 from connect.common.keycloak import KeycloakCleanup
+from connect.common.locks import LockNotAcquiredError, RedisLockService
 
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+FREE_PLAN_CHECK_LOCK_KEY = "lock:check_organization_free_plan"
+
 
 @app.task(name="delete_organization")
 def delete_organization(inteligence_organization: int, user_email):
@@ -94,13 +102,32 @@ def update_project(organization_uuid: str, organization_name: str):
 def update_user_permission_project(
     project_uuid: str, flow_organization: str, user_email: str, permission: int
 ):
+    _propagate_project_permission(
+        _get_permission_clients(),
+        project_uuid,
+        flow_organization,
+        user_email,
+        permission,
+    )
+    return True
+
+
+def _get_permission_clients() -> tuple:
     if settings.USE_FLOW_REST:
         flow_instance = FlowsRESTClient()
     else:
         flow_instance = utils.get_grpc_types().get("flow")
-    chats_client = ChatsRESTClient()
-    integrations_client = IntegrationsRESTClient()
+    return flow_instance, IntegrationsRESTClient(), ChatsRESTClient()
+
 
+def _propagate_project_permission(
+    clients: tuple,
+    project_uuid: str,
+    flow_organization: str,
+    user_email: str,
+    permission: int,
+):
+    flow_instance, integrations_client, chats_client = clients
     flow_instance.update_user_permission_project(
         organization_uuid=flow_organization,
         user_email=user_email,
@@ -112,6 +139,47 @@ def update_user_permission_project(
     chats_client.update_user_permission(
         permission=permission, user_email=user_email, project_uuid=project_uuid
     )
+
+
+@app.task(
+    bind=True,
+    name="update_project_permissions",
+    max_retries=5,
+)
+def update_project_permissions(
+    self, project_uuid: str, flow_organization: str, permissions: list
+):
+    """Propagates every (user_email, role) pair of a project in one task.
+
+    The modules have no bulk permission endpoint, so each pair is still one
+    call per module, but they share the clients (and their pooled
+    connections). Failed pairs are logged and only they are retried.
+    """
+    clients = _get_permission_clients()
+    failed = []
+
+    for user_email, permission in permissions:
+        try:
+            _propagate_project_permission(
+                clients, project_uuid, flow_organization, user_email, permission
+            )
+        except Exception as error:
+            logger.error(
+                f"Failed to update {user_email} permission on project "
+                f"{project_uuid}: {error}"
+            )
+            failed.append([user_email, permission])
+
+    if failed:
+        raise self.retry(
+            kwargs=dict(
+                project_uuid=project_uuid,
+                flow_organization=flow_organization,
+                permissions=failed,
+            ),
+            countdown=2**self.request.retries,
+        )
+
     return True
 
 
@@ -244,57 +312,265 @@ def search_project(organization_id: int, project_uuid: str, text: str):
     }
 
 
-@app.task()
-def check_organization_free_plan():
+def _get_free_plan_contact_count(flow_instance, project):
+    now = pendulum.now(project.timezone)
+    before = now.strftime("%Y-%m-%d %H:%M")
+    # first day of month
+    after = now.start_of("month").strftime("%Y-%m-%d %H:%M")
+
+    return flow_instance.get_billing_total_statistics(
+        project_uuid=str(project.flow_organization), before=before, after=after
+    ).get("active_contacts")
+
+
+def _map_projects_concurrently(fetch, projects, max_workers: int) -> dict:
+    """Call ``fetch(project)`` for every project on a bounded thread pool.
+
+    Returns a ``{project.pk: result}`` dict. Projects whose call raises are
+    logged and left out, so callers keep their current values.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, project): project for project in projects}
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                results[project.pk] = future.result()
+            except Exception as error:
+                logger.error(f"Failed to fetch data of project {project.pk}: {error}")
+    return results
+
+
+def _check_organization_free_plan():
     limits = GenericBillingData.get_generic_billing_data_instance()
     if settings.USE_FLOW_REST:
         flow_instance = FlowsRESTClient()
     else:
         flow_instance = utils.get_grpc_types().get("flow")
 
-    for organization in Organization.objects.filter(
-        organization_billing__plan="free", is_suspended=False
-    ):
-        for project in organization.project.all():
-            project_timezone = project.timezone
-            now = pendulum.now(project_timezone)
-            before = now.strftime("%Y-%m-%d %H:%M")
-            # first day of month
-            after = now.start_of("month").strftime("%Y-%m-%d %H:%M")
-
-            contact_count = flow_instance.get_billing_total_statistics(
-                project_uuid=str(project.flow_organization), before=before, after=after
-            ).get("active_contacts")
-            project.contact_count = int(contact_count)
-            project.save(update_fields=["contact_count"])
-        current_active_contacts = organization.active_contacts
-        if current_active_contacts > limits.free_active_contacts_limit:
-            organization.is_suspended = True
-            for project in organization.project.all():
-                app.send_task(
-                    "update_suspend_project",
-                    args=[str(project.uuid), True],
-                )
-            organization.save(update_fields=["is_suspended"])
-            organization.organization_billing.send_email_expired_free_plan(
-                organization.name,
-                organization.authorizations.values_list("user__email", flat=True),
+    organizations = {
+        organization.pk: organization
+        for organization in Organization.objects.filter(
+            organization_billing__plan="free", is_suspended=False
+        ).select_related("organization_billing")
+    }
+    if not organizations:
+        return
+
+    projects = list(
+        Project.objects.filter(organization__in=organizations.keys()).only(
+            "uuid", "organization", "timezone", "flow_organization", "contact_count"
+        )
+    )
+    contact_counts = _map_projects_concurrently(
+        lambda project: _get_free_plan_contact_count(flow_instance, project),
+        projects,
+        max_workers=settings.FREE_PLAN_CHECK_WORKERS,
+    )
+
+    updated_projects = []
+    active_contacts = defaultdict(int)
+    contact_deltas = defaultdict(int)
+    for project in projects:
+        if contact_counts.get(project.pk) is not None:
+            previous_count = project.contact_count
+            project.contact_count = int(contact_counts[project.pk])
+            contact_deltas[project.organization_id] += (
+                project.contact_count - previous_count
             )
+            updated_projects.append(project)
+        active_contacts[project.organization_id] += project.contact_count
+
+    Project.objects.bulk_update(
+        updated_projects,
+        ["contact_count"],
+        batch_size=settings.FREE_PLAN_CHECK_BATCH_SIZE,
+    )
+    # bulk_update skips the Project signals that maintain the aggregates.
+    for organization_pk, delta in contact_deltas.items():
+        Organization.objects.add_project_aggregates(
+            organization_pk, contact_count=delta
+        )
+
+    for organization_pk, organization in organizations.items():
+        if active_contacts[organization_pk] <= limits.free_active_contacts_limit:
+            continue
+        # The Organization post_save receiver dispatches the suspension of
+        # every project, so it is not sent again from here.
+        organization.is_suspended = True
+        organization.save(update_fields=["is_suspended"])
+        organization.organization_billing.send_email_expired_free_plan(
+            organization.name,
+            organization.authorizations.values_list("user__email", flat=True),
+        )
+
+
+@app.task()
+def check_organization_free_plan():
+    lock_service = RedisLockService(
+        ttl=settings.FREE_PLAN_CHECK_LOCK_TTL, blocking_timeout=0
+    )
+    try:
+        with lock_service.lock(FREE_PLAN_CHECK_LOCK_KEY):
+            _check_organization_free_plan()
+    except LockNotAcquiredError:
+        logger.info("check_organization_free_plan is still running; skipping run")
+        return False
     return True
 
 
+def _create_total_contact_count_run() -> SyncManagerTask:
+    """Shard all projects into keyset-paginated chunks of one sync run."""
+    now = pendulum.now()
+    run = SyncManagerTask.objects.create(
+        task_type="sync_total_contact_count",
+        started_at=now,
+        before=now,
+        after=now,
+    )
+
+    chunks = []
+    cursor = None
+    while True:
+        projects = Project.objects.order_by("uuid")
+        if cursor is not None:
+            projects = projects.filter(uuid__gt=cursor)
+        chunk = list(
+            projects.values_list("uuid", flat=True)[
+                : settings.SYNC_CONTACT_COUNT_CHUNK_SIZE
+            ]
+        )
+        if not chunk:
+            break
+
+        chunks.append(
+            SyncManagerTask(
+                task_type="sync_total_contact_count_chunk",
+                started_at=now,
+                before=now,
+                after=now,
+                parent=run,
+                cursor_start=cursor,
+                cursor_end=chunk[-1],
+            )
+        )
+        cursor = chunk[-1]
+
+    if chunks:
+        # Projects created after sharding land in the open-ended last chunk.
+        chunks[-1].cursor_end = None
+    SyncManagerTask.objects.bulk_create(chunks)
+    return run
+
+
+def _finish_total_contact_count_run(run_uuid) -> None:
+    if SyncManagerTask.objects.filter(parent=run_uuid, status=False).exists():
+        return
+    SyncManagerTask.objects.filter(uuid=run_uuid, finished_at=None).update(
+        status=True, finished_at=pendulum.now()
+    )
+
+
+def _is_resumable_total_contact_count_run(run: SyncManagerTask) -> bool:
+    max_age = pendulum.duration(seconds=settings.SYNC_CONTACT_COUNT_RUN_MAX_AGE)
+    if run.started_at < pendulum.now() - max_age:
+        return False
+    return not (
+        run.chunks.filter(status=False)
+        .annotate(attempts=Count("fail_message"))
+        .filter(attempts__gte=settings.SYNC_CONTACT_COUNT_MAX_CHUNK_ATTEMPTS)
+        .exists()
+    )
+
+
+def _fail_total_contact_count_run(run: SyncManagerTask) -> None:
+    now = pendulum.now()
+    run.chunks.filter(status=False, finished_at=None).update(finished_at=now)
+    run.finished_at = now
+    run.save(update_fields=["finished_at"])
+    run.fail_message.create(message="Run abandoned before all chunks completed")
+    logger.warning(f"sync_total_contact_count: abandoned unfinished run {run.uuid}")
+
+
 @app.task(name="sync_total_contact_count")
 def sync_total_contact_count():
+    """Dispatch one ``sync_total_contact_count_chunk`` task per chunk.
+
+    A run whose chunks did not all complete (e.g. a worker crashed) is
+    resumed: only its pending chunks are dispatched again, instead of
+    starting over from the first project. Runs older than
+    SYNC_CONTACT_COUNT_RUN_MAX_AGE, or with a chunk that already failed
+    SYNC_CONTACT_COUNT_MAX_CHUNK_ATTEMPTS times, are closed as failed and a
+    new run is started instead.
+    """
+    run = (
+        SyncManagerTask.objects.filter(
+            task_type="sync_total_contact_count", finished_at=None
+        )
+        .order_by("-started_at")
+        .first()
+    )
+    if run is not None and not _is_resumable_total_contact_count_run(run):
+        _fail_total_contact_count_run(run)
+        run = None
+    if run is None:
+        run = _create_total_contact_count_run()
+
+    pending_chunks = list(
+        run.chunks.filter(status=False).values_list("uuid", flat=True)
+    )
+    for chunk_uuid in pending_chunks:
+        sync_total_contact_count_chunk.delay(str(chunk_uuid))
+
+    _finish_total_contact_count_run(run.uuid)
+    return True
+
+
+@app.task(name="sync_total_contact_count_chunk")
+def sync_total_contact_count_chunk(chunk_uuid: str):
+    chunk = SyncManagerTask.objects.get(uuid=chunk_uuid)
+    if chunk.status:
+        return True
+
     if settings.USE_FLOW_REST:
         flow_instance = FlowsRESTClient()
     else:
         flow_instance = utils.get_grpc_types().get("flow")
 
-    for project in Project.objects.all():
-        response = flow_instance.get_project_statistic(project_uuid=str(project.uuid))
-        contacts = response.get("active_contacts", project.total_contact_count)
-        project.total_contact_count = contacts
-        project.save(update_fields=["total_contact_count"])
+    try:
+        projects = Project.objects.order_by("uuid").only("uuid", "total_contact_count")
+        if chunk.cursor_start is not None:
+            projects = projects.filter(uuid__gt=chunk.cursor_start)
+        if chunk.cursor_end is not None:
+            projects = projects.filter(uuid__lte=chunk.cursor_end)
+        projects = list(projects)
+
+        statistics = _map_projects_concurrently(
+            lambda project: flow_instance.get_project_statistic(
+                project_uuid=str(project.uuid)
+            ),
+            projects,
+            max_workers=settings.SYNC_CONTACT_COUNT_WORKERS,
+        )
+
+        updated_projects = []
+        for project in projects:
+            contacts = (statistics.get(project.pk) or {}).get("active_contacts")
+            if contacts is not None:
+                project.total_contact_count = contacts
+                updated_projects.append(project)
+        Project.objects.bulk_update(updated_projects, ["total_contact_count"])
+
+        chunk.status = True
+        chunk.finished_at = pendulum.now()
+        chunk.save(update_fields=["status", "finished_at"])
+    except Exception as error:
+        chunk.finished_at = pendulum.now()
+        chunk.fail_message.create(message=str(error))
+        chunk.save(update_fields=["finished_at"])
+        return False
+
+    _finish_total_contact_count_run(chunk.parent_id)
     return True
 
 
@@ -362,9 +638,38 @@ def update_suspend_project(project_uuid: str, is_suspended: bool):
     )
 
 
+@app.task(bind=True, name="suspend_organization_projects", max_retries=5)
+def suspend_organization_projects(self, project_uuids: list, is_suspended: bool):
+    """(Un)suspends a whole organization's projects from a single message.
+
+    Only the projects that failed are retried.
+    """
+    if settings.USE_FLOW_REST:
+        failed = FlowsRESTClient().suspend_or_unsuspend_projects(
+            project_uuids=project_uuids, is_suspended=is_suspended
+        )
+    else:
+        flow_instance = utils.get_grpc_types().get("flow")
+        failed = []
+        for project_uuid in project_uuids:
+            try:
+                flow_instance.suspend_or_unsuspend_project(
+                    project_uuid=project_uuid, is_suspended=is_suspended
+                )
+            except Exception as error:
+                logger.error(f"Failed to suspend project {project_uuid}: {error}")
+                failed.append(project_uuid)
+
+    if failed:
+        raise self.retry(
+            args=[failed, is_suspended], countdown=2**self.request.retries
+        )
+
+    return True
+
+
 @app.task(name="update_user_photo")
 def update_user_photo(user_email: str, photo_url: str):
-
     chats_client = ChatsRESTClient()
     integrations_client = IntegrationsRESTClient()
 
@@ -382,7 +687,6 @@ def update_user_photo(user_email: str, photo_url: str):
 
 @app.task(name="update_user_name")
 def update_user_name(user_email: str, first_name: str, last_name: str):
-
     chats_client = ChatsRESTClient()
     integrations_client = IntegrationsRESTClient()
 
@@ -655,3 +959,12 @@ def keycloak_logs_cleanup_routine():
     client = KeycloakCleanup()
     client.delete(date_time)
     client.vacuum()
+
+
+@app.task(name="reconcile_organization_aggregates", ignore_result=True)
+def reconcile_organization_aggregates():
+    """Repair organization project aggregates that drifted from their projects."""
+    repaired = Organization.objects.reconcile_project_aggregates()
+    if repaired:
+        logger.warning(f"Repaired project aggregates of {repaired} organizations")
+    return repaired
@@ -0,0 +1,159 @@
+import uuid
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from connect.api.v1.tests.utils import create_user_and_token
+from connect.common.counters import ProjectCounters
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project, RecentActivity
+from connect.usecases.recent_activities.create import RecentActivityUseCase
+from connect.usecases.recent_activities.exceptions import InvalidActionEntityCombination
+from connect.usecases.recent_activities.identity_cache import identity_cache
+
+
+class ProjectCountersTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        identity_cache.clear()
+        self.user, _ = create_user_and_token("counters")
+        self.organization = Organization.objects.create(
+            name="Counters organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.projects = [
+            Project.objects.create(
+                name=f"Counters project {index}",
+                flow_organization=uuid.uuid4(),
+                organization=self.organization,
+                flow_count=5,
+            )
+            for index in range(3)
+        ]
+
+    def flow_counts(self):
+        return list(
+            Project.objects.filter(pk__in=[project.pk for project in self.projects])
+            .order_by("name")
+            .values_list("flow_count", flat=True)
+        )
+
+    def test_deltas_are_summed_and_grouped(self):
+        counters = ProjectCounters()
+        counters.add("flow_count", [project.pk for project in self.projects])
+        counters.add("flow_count", [self.projects[0].pk], 2)
+        counters.add("inteligence_count", [self.projects[1].pk], -1)
+        counters.add("inteligence_count", [self.projects[1].pk], 1)
+
+        with self.assertNumQueries(2):
+            self.assertEqual(counters.flush(), 2)
+
+        self.assertEqual(self.flow_counts(), [8, 6, 6])
+        self.assertEqual(len(counters), 0)
+
+    def test_unknown_field_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ProjectCounters().add("contact_count", [self.projects[0].pk])
+
+    def test_increment_keeps_instance_in_sync(self):
+        project = self.projects[0]
+        Project.objects.filter(pk=project.pk).update(flow_count=10)
+
+        project.increment_flow_count()
+
+        self.assertEqual(project.flow_count, 11)
+
+    def test_organization_event_updates_projects_in_one_statement(self):
+        data = {
+            "action": RecentActivity.CREATE,
+            "entity": RecentActivity.FLOW,
+            "entity_name": "flow",
+            "organization_uuid": self.organization.uuid,
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            activities = RecentActivity.create_recent_activities(data, self.user)
+
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "common_project"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(len(activities), 3)
+        self.assertEqual(self.flow_counts(), [6, 6, 6])
+
+    def test_buffered_event_is_applied_on_flush(self):
+        counters = ProjectCounters()
+        data = {
+            "action": RecentActivity.DELETE,
+            "entity": RecentActivity.FLOW,
+            "entity_name": "flow",
+            "flow_organization": self.projects[0].flow_organization,
+        }
+
+        RecentActivity.create_recent_activities(data, self.user, counters=counters)
+        RecentActivity.create_recent_activities(data, self.user, counters=counters)
+        self.assertEqual(self.flow_counts(), [5, 5, 5])
+
+        counters.flush()
+        self.assertEqual(self.flow_counts(), [3, 5, 5])
+
+    def test_batch_of_events_shares_one_set_of_writes(self):
+        flow_organization = str(self.projects[0].flow_organization)
+        create = {
+            "user": self.user.email,
+            "action": RecentActivity.CREATE,
+            "entity": RecentActivity.FLOW,
+            "entity_name": "flow",
+            "flow_organization": flow_organization,
+        }
+        invalid = dict(create, action="UNKNOWN")
+        unknown_user = dict(create, user="nobody@user.com")
+
+        with CaptureQueriesContext(connection) as queries:
+            errors = RecentActivityUseCase().create_recent_activities(
+                [create, invalid, create, unknown_user]
+            )
+
+        inserts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "common_recentactivity"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertIsNone(errors[0])
+        self.assertIsInstance(errors[1], InvalidActionEntityCombination)
+        self.assertIsNone(errors[2])
+        self.assertIsNotNone(errors[3])
+        self.assertEqual(self.flow_counts(), [7, 5, 5])
+        self.assertEqual(
+            RecentActivity.objects.filter(user=self.user, entity_name="flow").count(), 2
+        )
+
+    def test_one_unsaveable_event_does_not_drop_the_batch(self):
+        create = {
+            "user": self.user.email,
+            "action": RecentActivity.CREATE,
+            "entity": RecentActivity.FLOW,
+            "entity_name": "flow",
+            "flow_organization": str(self.projects[0].flow_organization),
+        }
+        oversized = dict(create, entity_name="x" * 256)
+
+        errors = RecentActivityUseCase().create_recent_activities(
+            [create, oversized, create]
+        )
+
+        self.assertIsNone(errors[0])
+        self.assertIsNotNone(errors[1])
+        self.assertIsNone(errors[2])
+        self.assertEqual(self.flow_counts(), [7, 5, 5])
+        self.assertEqual(
+            RecentActivity.objects.filter(user=self.user, entity_name="flow").count(), 2
+        )
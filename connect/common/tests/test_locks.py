@@ -50,6 +50,18 @@ class RedisLockServiceTestCase(TestCase):
         self.assertTrue(entered)
         self.redis_lock.release.assert_not_called()
 
+    @patch("connect.common.locks.get_redis_connection")
+    def test_proceeds_unlocked_when_cache_is_not_redis(self, mock_get_connection):
+        mock_get_connection.side_effect = NotImplementedError(
+            "This backend does not support this feature"
+        )
+        entered = False
+
+        with RedisLockService().lock("my-key"):
+            entered = True
+
+        self.assertTrue(entered)
+
     def test_release_failure_is_swallowed(self):
         self.redis_lock.acquire.return_value = True
         self.redis_lock.release.side_effect = RedisConnectionError("expired")
@@ -0,0 +1,106 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project
+from connect.common.tasks import reconcile_organization_aggregates
+
+
+class OrganizationProjectAggregatesTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization, self.other_organization = [
+            Organization.objects.create(
+                name=f"Aggregates organization {index}",
+                inteligence_organization=1,
+                organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+                organization_billing__plan=BillingPlan.PLAN_FREE,
+            )
+            for index in range(2)
+        ]
+        self.projects = [
+            Project.objects.create(
+                name=f"Aggregates project {index}",
+                flow_organization=uuid.uuid4(),
+                organization=self.organization,
+                contact_count=10 * (index + 1),
+                extra_active_integration=index,
+            )
+            for index in range(3)
+        ]
+
+    def assertAggregates(self, organization, projects, contacts, integrations):
+        organization.refresh_from_db()
+        self.assertEqual(organization.project_count, projects)
+        self.assertEqual(organization.project_contact_count, contacts)
+        self.assertEqual(organization.project_extra_active_integration, integrations)
+
+    def test_created_projects_are_added(self):
+        self.assertAggregates(self.organization, 3, 60, 3)
+
+    def test_aggregates_are_read_without_queries(self):
+        organization = Organization.objects.get(pk=self.organization.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(organization.active_contacts, 60)
+            self.assertEqual(organization.extra_active_integrations, 2)
+
+    def test_project_changes_apply_deltas(self):
+        project = self.projects[0]
+        project.contact_count = 25
+        project.extra_active_integration = 4
+        project.save()
+
+        self.assertAggregates(self.organization, 3, 75, 7)
+
+    def test_unrelated_project_save_keeps_aggregates(self):
+        project = self.projects[1]
+        project.name = "Renamed"
+        project.save(update_fields=["name"])
+
+        self.assertAggregates(self.organization, 3, 60, 3)
+
+    def test_stale_organization_save_keeps_aggregates(self):
+        organization = Organization.objects.get(pk=self.organization.pk)
+        Project.objects.create(
+            name="Aggregates project 3",
+            flow_organization=uuid.uuid4(),
+            organization=self.organization,
+            contact_count=40,
+            extra_active_integration=1,
+        )
+
+        organization.name = "Renamed"
+        organization.save()
+
+        self.assertAggregates(organization, 4, 100, 4)
+        self.assertEqual(organization.name, "Renamed")
+
+    def test_deleted_project_is_removed(self):
+        self.projects[2].delete()
+
+        self.assertAggregates(self.organization, 2, 30, 1)
+
+    def test_moved_project_changes_organization(self):
+        project = self.projects[1]
+        project.organization = self.other_organization
+        project.contact_count = 5
+        project.save()
+
+        self.assertAggregates(self.organization, 2, 40, 2)
+        self.assertAggregates(self.other_organization, 1, 5, 1)
+
+    def test_reconcile_repairs_drift(self):
+        Organization.objects.filter(pk=self.organization.pk).update(
+            project_count=0, project_contact_count=999
+        )
+        Project.objects.filter(pk=self.projects[0].pk).update(contact_count=40)
+
+        self.assertEqual(reconcile_organization_aggregates(), 1)
+
+        self.assertAggregates(self.organization, 3, 90, 3)
+        self.assertAggregates(self.other_organization, 0, 0, 0)
+        self.assertEqual(reconcile_organization_aggregates(), 0)
@@ -0,0 +1,394 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pendulum
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from connect.api.v1.tests.utils import create_user_and_token
+from connect.billing.models import SyncManagerTask
+from connect.common.locks import LockNotAcquiredError
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import (
+    BillingPlan,
+    OpenedProject,
+    Organization,
+    OrganizationRole,
+    ProjectAuthorization,
+)
+from connect.common.tasks import (
+    check_organization_free_plan,
+    sync_total_contact_count,
+    suspend_organization_projects,
+    sync_total_contact_count_chunk,
+    update_project_permissions,
+)
+
+
+@override_settings(USE_FLOW_REST=True, FREE_PLAN_CHECK_WORKERS=2)
+class CheckOrganizationFreePlanTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization = Organization.objects.create(
+            name="Free organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_FREE,
+        )
+        self.projects = [
+            self.organization.project.create(
+                name=f"project {index}",
+                timezone="America/Sao_Paulo",
+                flow_organization=uuid.uuid4(),
+            )
+            for index in range(3)
+        ]
+
+    def run_task(self, contact_counts):
+        flows_client = MagicMock()
+        flows_client.get_billing_total_statistics.side_effect = (
+            lambda project_uuid, before, after: {
+                "active_contacts": contact_counts[project_uuid]
+            }
+        )
+        with patch(
+            "connect.common.tasks.FlowsRESTClient", return_value=flows_client
+        ), patch("connect.common.tasks.app.send_task"):
+            return check_organization_free_plan()
+
+    def test_updates_contact_count_of_every_project(self):
+        counts = {str(project.flow_organization): 10 for project in self.projects}
+
+        self.assertTrue(self.run_task(counts))
+
+        for project in self.projects:
+            project.refresh_from_db()
+            self.assertEqual(project.contact_count, 10)
+        self.organization.refresh_from_db()
+        self.assertFalse(self.organization.is_suspended)
+
+    def test_suspends_organization_over_the_limit(self):
+        counts = {str(project.flow_organization): 100 for project in self.projects}
+
+        self.run_task(counts)
+
+        self.organization.refresh_from_db()
+        self.assertTrue(self.organization.is_suspended)
+
+    def test_failed_project_keeps_previous_count(self):
+        failing, *others = self.projects
+        failing.contact_count = 7
+        failing.save(update_fields=["contact_count"])
+        counts = {str(project.flow_organization): 1 for project in others}
+
+        self.run_task(counts)
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.contact_count, 7)
+        for project in others:
+            project.refresh_from_db()
+            self.assertEqual(project.contact_count, 1)
+
+    @patch("connect.common.tasks.RedisLockService")
+    def test_skips_run_while_previous_one_holds_the_lock(self, mock_lock_service):
+        mock_lock_service.return_value.lock.side_effect = LockNotAcquiredError()
+
+        with patch("connect.common.tasks.FlowsRESTClient") as flows_client:
+            self.assertFalse(check_organization_free_plan())
+
+        flows_client.assert_not_called()
+
+
+@override_settings(
+    USE_FLOW_REST=True,
+    SYNC_CONTACT_COUNT_CHUNK_SIZE=2,
+    SYNC_CONTACT_COUNT_WORKERS=2,
+)
+class SyncTotalContactCountTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        organization = Organization.objects.create(
+            name="Organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.projects = [
+            organization.project.create(
+                name=f"project {index}",
+                timezone="America/Sao_Paulo",
+                flow_organization=uuid.uuid4(),
+            )
+            for index in range(5)
+        ]
+        self.flows_client = MagicMock()
+        self.flows_client.get_project_statistic.return_value = {"active_contacts": 42}
+
+    def run_coordinator(self):
+        with patch(
+            "connect.common.tasks.sync_total_contact_count_chunk.delay"
+        ) as mock_delay:
+            sync_total_contact_count()
+        return [call.args[0] for call in mock_delay.call_args_list]
+
+    def run_chunk(self, chunk_uuid):
+        with patch(
+            "connect.common.tasks.FlowsRESTClient", return_value=self.flows_client
+        ):
+            return sync_total_contact_count_chunk(chunk_uuid)
+
+    def test_projects_are_sharded_into_chunks(self):
+        chunk_uuids = self.run_coordinator()
+
+        self.assertEqual(len(chunk_uuids), 3)
+        run = SyncManagerTask.objects.get(task_type="sync_total_contact_count")
+        self.assertEqual(run.chunks.count(), 3)
+        self.assertEqual(run.chunks.filter(cursor_start=None).count(), 1)
+        self.assertEqual(run.chunks.filter(cursor_end=None).count(), 1)
+
+    def test_chunks_update_every_project_and_finish_the_run(self):
+        for chunk_uuid in self.run_coordinator():
+            self.assertTrue(self.run_chunk(chunk_uuid))
+
+        for project in self.projects:
+            project.refresh_from_db()
+            self.assertEqual(project.total_contact_count, 42)
+        run = SyncManagerTask.objects.get(task_type="sync_total_contact_count")
+        self.assertTrue(run.status)
+        self.assertIsNotNone(run.finished_at)
+
+    def test_unfinished_run_resumes_from_pending_chunks(self):
+        first, *pending = self.run_coordinator()
+        self.run_chunk(first)
+
+        resumed = self.run_coordinator()
+
+        self.assertEqual(sorted(resumed), sorted(pending))
+        self.assertEqual(
+            SyncManagerTask.objects.filter(
+                task_type="sync_total_contact_count"
+            ).count(),
+            1,
+        )
+
+    def assertAbandonedAndRestarted(self, first_run_chunks):
+        runs = SyncManagerTask.objects.filter(task_type="sync_total_contact_count")
+        self.assertEqual(runs.count(), 2)
+        old_run = runs.get(chunks__uuid=first_run_chunks[0])
+        self.assertFalse(old_run.status)
+        self.assertIsNotNone(old_run.finished_at)
+        self.assertEqual(old_run.fail_message.count(), 1)
+        self.assertFalse(old_run.chunks.filter(finished_at=None).exists())
+
+    def test_stale_run_is_closed_and_a_new_run_started(self):
+        first_run_chunks = self.run_coordinator()
+        SyncManagerTask.objects.filter(task_type="sync_total_contact_count").update(
+            started_at=pendulum.now().subtract(days=2)
+        )
+
+        restarted = self.run_coordinator()
+
+        self.assertEqual(len(restarted), 3)
+        self.assertFalse(set(restarted) & set(first_run_chunks))
+        self.assertAbandonedAndRestarted(first_run_chunks)
+
+    @override_settings(SYNC_CONTACT_COUNT_MAX_CHUNK_ATTEMPTS=2)
+    def test_run_with_a_failing_chunk_is_not_resumed_forever(self):
+        first_run_chunks = self.run_coordinator()
+        self.flows_client.get_project_statistic.side_effect = Exception("timeout")
+        self.assertFalse(self.run_chunk(first_run_chunks[0]))
+
+        self.assertEqual(sorted(self.run_coordinator()), sorted(first_run_chunks))
+        self.assertFalse(self.run_chunk(first_run_chunks[0]))
+
+        restarted = self.run_coordinator()
+
+        self.assertFalse(set(restarted) & set(first_run_chunks))
+        self.assertAbandonedAndRestarted(first_run_chunks)
+
+
+class UpdateProjectPermissionsTestCase(TestCase):
+    def setUp(self):
+        self.clients = (MagicMock(), MagicMock(), MagicMock())
+        patcher = patch(
+            "connect.common.tasks._get_permission_clients", return_value=self.clients
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_every_pair_is_sent_to_every_module(self):
+        flows, integrations, chats = self.clients
+
+        update_project_permissions(
+            project_uuid="project",
+            flow_organization="flow-org",
+            permissions=[["a@weni.ai", 3], ["b@weni.ai", 1]],
+        )
+
+        self.assertEqual(flows.update_user_permission_project.call_count, 2)
+        self.assertEqual(integrations.update_user_permission_project.call_count, 2)
+        chats.update_user_permission.assert_any_call(
+            permission=1, user_email="b@weni.ai", project_uuid="project"
+        )
+
+    def test_only_failed_pairs_are_retried(self):
+        flows, _, _ = self.clients
+
+        def update_user_permission_project(organization_uuid, user_email, permission):
+            if user_email == "b@weni.ai":
+                raise ConnectionError()
+
+        flows.update_user_permission_project.side_effect = (
+            update_user_permission_project
+        )
+
+        with patch.object(
+            update_project_permissions, "retry", return_value=Exception()
+        ) as mock_retry, self.assertRaises(Exception):
+            update_project_permissions(
+                project_uuid="project",
+                flow_organization="flow-org",
+                permissions=[["a@weni.ai", 3], ["b@weni.ai", 1]],
+            )
+
+        self.assertEqual(
+            mock_retry.call_args.kwargs["kwargs"]["permissions"], [["b@weni.ai", 1]]
+        )
+
+
+@override_settings(USE_EDA_PERMISSIONS=False)
+class ProjectPermissionsSignalTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization = Organization.objects.create(
+            name="Organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.users = [create_user_and_token(f"member{index}")[0] for index in range(3)]
+        for user in self.users:
+            self.organization.authorizations.create(
+                user=user, role=OrganizationRole.CONTRIBUTOR.value
+            )
+        viewer, _ = create_user_and_token("viewer")
+        self.organization.authorizations.create(
+            user=viewer, role=OrganizationRole.VIEWER.value
+        )
+
+    @patch("connect.common.signals.update_project_permissions")
+    def test_contributors_get_project_authorizations_in_bulk(self, mock_task):
+        project = self.organization.project.create(
+            name="project", timezone="America/Sao_Paulo"
+        )
+
+        authorizations = ProjectAuthorization.objects.filter(project=project)
+        self.assertEqual(
+            set(authorizations.values_list("user", flat=True)),
+            {user.pk for user in self.users},
+        )
+        self.assertEqual(OpenedProject.objects.filter(project=project).count(), 3)
+
+    @patch("connect.common.signals.update_project_permissions")
+    def test_permissions_are_sent_in_one_task_after_commit(self, mock_task):
+        project = self.organization.project.create(
+            name="project", timezone="America/Sao_Paulo"
+        )
+        project.flow_organization = uuid.uuid4()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save(update_fields=["flow_organization"])
+            mock_task.delay.assert_not_called()
+
+        mock_task.delay.assert_called_once()
+        self.assertEqual(
+            sorted(mock_task.delay.call_args.kwargs["permissions"]),
+            sorted(
+                [user.email, OrganizationRole.CONTRIBUTOR.value] for user in self.users
+            ),
+        )
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "suspend-projects-tests",
+        }
+    },
+    SUSPEND_PROJECTS_DEDUP_TTL=60,
+)
+@patch("connect.common.models.current_app.send_task")
+class SuspendOrganizationProjectsTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        cache.clear()
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization = Organization.objects.create(
+            name="Organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.projects = [
+            self.organization.project.create(
+                name=f"project {index}", timezone="America/Sao_Paulo"
+            )
+            for index in range(3)
+        ]
+
+    def suspension_calls(self, mock_send_task):
+        return [
+            call
+            for call in mock_send_task.call_args_list
+            if call.kwargs.get("name") == "suspend_organization_projects"
+        ]
+
+    def test_unrelated_save_does_not_dispatch(self, mock_send_task):
+        self.organization.name = "Renamed"
+        self.organization.save()
+
+        self.assertEqual(self.suspension_calls(mock_send_task), [])
+
+    def test_suspension_sends_one_task_with_every_project(self, mock_send_task):
+        self.organization.is_suspended = True
+        self.organization.save(update_fields=["is_suspended"])
+
+        (call,) = self.suspension_calls(mock_send_task)
+        project_uuids, is_suspended = call.kwargs["args"]
+        self.assertTrue(is_suspended)
+        self.assertEqual(
+            sorted(project_uuids),
+            sorted(str(project.uuid) for project in self.projects),
+        )
+
+    def test_repeated_requests_are_deduplicated(self, mock_send_task):
+        self.organization.is_suspended = True
+        self.organization.save(update_fields=["is_suspended"])
+        self.organization.suspend_projects(True)
+
+        self.assertEqual(len(self.suspension_calls(mock_send_task)), 1)
+
+        self.organization.suspend_projects(False)
+
+        self.assertEqual(len(self.suspension_calls(mock_send_task)), 2)
+
+
+@override_settings(USE_FLOW_REST=True)
+class SuspendOrganizationProjectsTaskTestCase(TestCase):
+    @patch("connect.common.tasks.FlowsRESTClient")
+    def test_only_failed_projects_are_retried(self, mock_flows_client):
+        mock_flows_client.return_value.suspend_or_unsuspend_projects.return_value = [
+            "b"
+        ]
+
+        with patch.object(
+            suspend_organization_projects, "retry", return_value=Exception()
+        ) as mock_retry, self.assertRaises(Exception):
+            suspend_organization_projects(["a", "b"], True)
+
+        self.assertEqual(mock_retry.call_args.kwargs["args"], [["b"], True])
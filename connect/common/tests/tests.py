@@ -545,7 +545,7 @@ class BillingPlanTestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class ProjectAuthorizationTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -662,7 +662,7 @@ class RocketAuthorizationTestCase(TestCase):
 
 @unittest.skip("Test broken, need to be fixed")
 class RequestPermissionProjectTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission):
         self.owner = User.objects.create_user("owner@user.com", "owner")
@@ -686,7 +686,7 @@ class RequestPermissionProjectTestCase(TestCase):
             flow_organization=uuid4.uuid4(),
         )
 
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     def test_create_request_permission(self, mock_permission):
         mock_permission.return_value = True
         self.request_permission = RequestPermissionProject.objects.create(
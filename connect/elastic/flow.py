@@ -38,59 +38,72 @@ class ElasticFlow(ElasticHandler):  # pragma: no cover
         response = contacts.scan()
         return response
 
-    def get_paginated_contacts(
-        self, flow_id: int, before: str, after: str, scroll_id: str = None
+    def iter_contact_pages(
+        self, flow_id: int, before: str, after: str, page_size: int = None
     ):
-        before, after = es_convert_datetime(before, after)
+        """Yield pages of active contacts using a point in time and search_after.
 
-        if scroll_id:
-            page = self.client.scroll(scroll_id=scroll_id, scroll="1m")
-            return page["hits"]["hits"]
+        Only ``uuid``, ``name`` and ``last_seen_on`` are fetched from
+        ``_source``, and each page is a list of those dicts. A point in time
+        keeps the snapshot consistent across pages without holding scroll
+        contexts, and it is always closed when the generator ends.
+        """
+        before, after = es_convert_datetime(before, after)
+        page_size = page_size or int(settings.SCROLL_SIZE)
+        keep_alive = settings.ELASTIC_PIT_KEEP_ALIVE
 
         query = {
-            "query": {
-                "bool": {
-                    "must": [
-                        {
-                            "match": {"org_id": f"{flow_id}"},
-                        },
-                        {
-                            "match": {
-                                "is_active": "true",
-                            }
-                        },
-                        {
-                            "nested": {
-                                "path": "urns",
-                                "query": {
-                                    "bool": {
-                                        "must": [{"exists": {"field": "urns.path"}}]
-                                    }
-                                },
-                            }
-                        },
-                        {
-                            "range": {
-                                "last_seen_on": {"gte": str(after), "lte": str(before)}
-                            }
-                        },
-                    ]
-                }
+            "bool": {
+                "must": [
+                    {"match": {"org_id": f"{flow_id}"}},
+                    {"match": {"is_active": "true"}},
+                    {
+                        "nested": {
+                            "path": "urns",
+                            "query": {
+                                "bool": {"must": [{"exists": {"field": "urns.path"}}]}
+                            },
+                        }
+                    },
+                    {
+                        "range": {
+                            "last_seen_on": {"gte": str(after), "lte": str(before)}
+                        }
+                    },
+                ]
             }
         }
 
-        page = self.client.search(
-            index="contacts",
-            body=query,
-            scroll=settings.SCROLL_KEEP_ALIVE,
-            size=settings.SCROLL_SIZE,
-            request_timeout=settings.ELASTICSEARCH_TIMEOUT_REQUEST,
-        )
-        scroll_id = page["_scroll_id"]
-        scroll_size = page["hits"]["total"]["value"]
-        hits = page["hits"]["hits"]
-        scroll = {"scroll_id": scroll_id, "scroll_size": scroll_size}
-        return scroll, hits
+        pit_id = self.client.open_point_in_time(index="contacts", keep_alive=keep_alive)[
+            "id"
+        ]
+        try:
+            search_after = None
+            while True:
+                body = {
+                    "query": query,
+                    "size": page_size,
+                    "_source": ["uuid", "name", "last_seen_on"],
+                    "sort": [{"last_seen_on": "asc"}, {"_shard_doc": "asc"}],
+                    "track_total_hits": False,
+                    "pit": {"id": pit_id, "keep_alive": keep_alive},
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+
+                page = self.client.search(
+                    body=body,
+                    request_timeout=settings.ELASTICSEARCH_TIMEOUT_REQUEST,
+                )
+                pit_id = page.get("pit_id", pit_id)
+                hits = page["hits"]["hits"]
+                if not hits:
+                    return
+
+                yield [hit["_source"] for hit in hits]
 
-    def clear_scroll(self, scroll_id):
-        self.client.clear_scroll(scroll_id=scroll_id)
+                if len(hits) < page_size:
+                    return
+                search_after = hits[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(body={"id": pit_id})
@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+
+import grpc
+from django.conf import settings
+from prometheus_client import Histogram
+
+GRPC_CLIENT_LATENCY = Histogram(
+    "connect_grpc_client_latency_seconds",
+    "Latency of outgoing gRPC calls by method and status code.",
+    ["method", "code"],
+)
+
+
+def _status_name(call) -> str:
+    try:
+        code = call.code()
+    except Exception:  # pragma: no cover - call was never started
+        return "UNKNOWN"
+    return code.name if code is not None else "UNKNOWN"
+
+
+class LatencyInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Observes ``GRPC_CLIENT_LATENCY`` for every call made through a channel.
+
+    Unary calls are measured until the response arrives; streaming calls until
+    the stream terminates, so ``List`` RPCs include the time spent consuming
+    them.
+    """
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        started = time.perf_counter()
+        call = continuation(client_call_details, request)
+        GRPC_CLIENT_LATENCY.labels(
+            client_call_details.method, _status_name(call)
+        ).observe(time.perf_counter() - started)
+        return call
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        started = time.perf_counter()
+        call = continuation(client_call_details, request)
+
+        def observe():
+            GRPC_CLIENT_LATENCY.labels(
+                client_call_details.method, _status_name(call)
+            ).observe(time.perf_counter() - started)
+
+        call.add_callback(observe)
+        return call
+
+
+class GRPCChannelPool:
+    """Per-process pool of gRPC channels and stubs shared by the gRPC types.
+
+    gRPC channels must not be used across ``fork`` (Celery prefork, gunicorn),
+    so channels are built lazily on first use and the whole pool is dropped
+    when the pid changes. One channel is kept per ``(endpoint, certificate)``
+    and stubs are cached per channel, so calls reuse the same HTTP/2
+    connection instead of opening one per type instance.
+
+    Certificates are read from disk once and kept in memory; the bytes are
+    safe to inherit across ``fork``, unlike the channels built from them.
+    """
+
+    def __init__(
+        self,
+        keepalive_time_ms: int = None,
+        keepalive_timeout_ms: int = None,
+        keepalive_permit_without_calls: bool = None,
+        max_message_length: int = None,
+    ):
+        self._keepalive_time_ms = keepalive_time_ms
+        self._keepalive_timeout_ms = keepalive_timeout_ms
+        self._keepalive_permit_without_calls = keepalive_permit_without_calls
+        self._max_message_length = max_message_length
+        self._channels = {}
+        self._stubs = {}
+        self._certificates = {}
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _setting(self, value, name: str, default):
+        if value is not None:
+            return value
+        return getattr(settings, name, default)
+
+    @property
+    def options(self) -> list:
+        max_message_length = self._setting(
+            self._max_message_length, "GRPC_MAX_MESSAGE_LENGTH", 16 * 1024 * 1024
+        )
+        return [
+            (
+                "grpc.keepalive_time_ms",
+                self._setting(self._keepalive_time_ms, "GRPC_KEEPALIVE_TIME_MS", 30000),
+            ),
+            (
+                "grpc.keepalive_timeout_ms",
+                self._setting(
+                    self._keepalive_timeout_ms, "GRPC_KEEPALIVE_TIMEOUT_MS", 10000
+                ),
+            ),
+            (
+                "grpc.keepalive_permit_without_calls",
+                int(
+                    self._setting(
+                        self._keepalive_permit_without_calls,
+                        "GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS",
+                        True,
+                    )
+                ),
+            ),
+            ("grpc.max_send_message_length", max_message_length),
+            ("grpc.max_receive_message_length", max_message_length),
+        ]
+
+    def _reset_after_fork(self) -> None:
+        pid = os.getpid()
+        if self._pid != pid:
+            # Inherited channels belong to the parent; never close them here.
+            self._channels = {}
+            self._stubs = {}
+            self._pid = pid
+
+    def _read_certificate(self, certificate: str) -> bytes:
+        if certificate not in self._certificates:
+            with open(certificate, "rb") as f:
+                self._certificates[certificate] = f.read()
+        return self._certificates[certificate]
+
+    def _build_channel(self, endpoint: str, certificate: str = None) -> grpc.Channel:
+        if certificate:
+            credentials = grpc.ssl_channel_credentials(
+                self._read_certificate(certificate)
+            )
+            channel = grpc.secure_channel(endpoint, credentials, options=self.options)
+        else:
+            channel = grpc.insecure_channel(endpoint, options=self.options)
+        return grpc.intercept_channel(channel, LatencyInterceptor())
+
+    def get_channel(self, endpoint: str, certificate: str = None) -> grpc.Channel:
+        key = (endpoint, certificate)
+        with self._lock:
+            self._reset_after_fork()
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._build_channel(endpoint, certificate)
+                self._channels[key] = channel
+            return channel
+
+    def get_stub(self, stub_class, endpoint: str, certificate: str = None):
+        channel = self.get_channel(endpoint, certificate)
+        key = (endpoint, certificate, stub_class)
+        with self._lock:
+            stub = self._stubs.get(key)
+            if stub is None:
+                stub = stub_class(channel)
+                self._stubs[key] = stub
+            return stub
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                for channel in self._channels.values():
+                    channel.close()
+            self._channels = {}
+            self._stubs = {}
+
+
+channel_pool = GRPCChannelPool()
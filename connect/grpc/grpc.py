@@ -14,6 +14,9 @@ class GRPCType(metaclass=ABCMeta):
     def get_channel(self):
         raise NotImplementedError()
 
+    def get_stub(self, stub_class):
+        raise NotImplementedError()
+
     def list_organizations(self, user_email: str):
         raise NotImplementedError()
 
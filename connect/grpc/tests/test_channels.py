@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock, mock_open, patch
+
+from django.test import SimpleTestCase
+
+from connect.grpc.channels import GRPCChannelPool
+
+
+class GRPCChannelPoolTestCase(SimpleTestCase):
+    def build_pool(self):
+        return GRPCChannelPool(
+            keepalive_time_ms=1000,
+            keepalive_timeout_ms=500,
+            keepalive_permit_without_calls=False,
+            max_message_length=1024,
+        )
+
+    def test_channel_is_reused_within_a_process(self):
+        pool = self.build_pool()
+
+        self.assertIs(
+            pool.get_channel("localhost:8002"), pool.get_channel("localhost:8002")
+        )
+        self.assertIsNot(
+            pool.get_channel("localhost:8002"), pool.get_channel("localhost:8003")
+        )
+
+    def test_channel_and_stubs_are_rebuilt_after_fork(self):
+        pool = self.build_pool()
+        stub_class = MagicMock(side_effect=lambda channel: object())
+        channel = pool.get_channel("localhost:8002")
+        stub = pool.get_stub(stub_class, "localhost:8002")
+
+        with patch("connect.grpc.channels.os.getpid", return_value=-1):
+            new_channel = pool.get_channel("localhost:8002")
+            self.assertIsNot(new_channel, channel)
+            self.assertIsNot(pool.get_stub(stub_class, "localhost:8002"), stub)
+
+        stub_class.assert_called_with(new_channel)
+        self.assertEqual(stub_class.call_count, 2)
+
+    def test_stub_is_built_once_per_channel(self):
+        pool = self.build_pool()
+        stub_class = MagicMock()
+
+        pool.get_stub(stub_class, "localhost:8002")
+        pool.get_stub(stub_class, "localhost:8002")
+
+        stub_class.assert_called_once_with(pool.get_channel("localhost:8002"))
+
+    @patch("connect.grpc.channels.grpc.ssl_channel_credentials")
+    @patch("connect.grpc.channels.grpc.secure_channel")
+    def test_certificate_is_read_once(self, mock_secure_channel, mock_credentials):
+        pool = self.build_pool()
+
+        with patch("builtins.open", mock_open(read_data=b"cert")) as mocked_open:
+            pool.get_channel("localhost:8002", "/certs/flows.crt")
+            with patch("connect.grpc.channels.os.getpid", return_value=-1):
+                pool.get_channel("localhost:8002", "/certs/flows.crt")
+
+        mocked_open.assert_called_once_with("/certs/flows.crt", "rb")
+        self.assertEqual(mock_secure_channel.call_count, 2)
+        mock_credentials.assert_called_with(b"cert")
+
+    @patch("connect.grpc.channels.grpc.insecure_channel")
+    def test_channel_options(self, mock_insecure_channel):
+        self.build_pool().get_channel("localhost:8002")
+
+        options = dict(mock_insecure_channel.call_args.kwargs["options"])
+        self.assertEqual(options["grpc.keepalive_time_ms"], 1000)
+        self.assertEqual(options["grpc.keepalive_timeout_ms"], 500)
+        self.assertEqual(options["grpc.keepalive_permit_without_calls"], 0)
+        self.assertEqual(options["grpc.max_receive_message_length"], 1024)
+        self.assertEqual(options["grpc.max_send_message_length"], 1024)
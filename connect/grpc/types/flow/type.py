@@ -1,6 +1,7 @@
 import grpc
 from django.conf import settings
 
+from connect.grpc.channels import channel_pool
 from connect.grpc.grpc import GRPCType
 from weni.protobuf.flows import billing_pb2_grpc, billing_pb2
 from weni.protobuf.flows import channel_pb2_grpc, channel_pb2
@@ -15,15 +16,18 @@ class FlowType(GRPCType):
     slug = "flow"
     permissions = {1: "viewer", 2: "editor", 3: "administrator", 4: "administrator"}
 
-    def __init__(self):
-        self.channel = self.get_channel()
-
     def get_channel(self):
-        if settings.FLOW_CERTIFICATE_GRPC_CRT:
-            with open(settings.FLOW_CERTIFICATE_GRPC_CRT, "rb") as f:
-                credentials = grpc.ssl_channel_credentials(f.read())
-            return grpc.secure_channel(settings.FLOW_GRPC_ENDPOINT, credentials)
-        return grpc.insecure_channel(settings.FLOW_GRPC_ENDPOINT)
+        return channel_pool.get_channel(
+            settings.FLOW_GRPC_ENDPOINT,
+            settings.FLOW_CERTIFICATE_GRPC_CRT,
+        )
+
+    def get_stub(self, stub_class):
+        return channel_pool.get_stub(
+            stub_class,
+            settings.FLOW_GRPC_ENDPOINT,
+            settings.FLOW_CERTIFICATE_GRPC_CRT,
+        )
 
     def create_project(
         self,
@@ -32,7 +36,7 @@ class FlowType(GRPCType):
         project_timezone: str,
     ):
         # Create Organization
-        stub = org_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(org_pb2_grpc.OrgControllerStub)
         response = stub.Create(
             org_pb2.OrgCreateRequest(
                 name=project_name,
@@ -43,14 +47,14 @@ class FlowType(GRPCType):
         return response
 
     def update_project(self, organization_uuid: int, organization_name: str):
-        stub = org_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(org_pb2_grpc.OrgControllerStub)
         response = stub.Update(
             org_pb2.OrgUpdateRequest(uuid=organization_uuid, name=organization_name)
         )
         return response
 
     def delete_project(self, project_uuid: int, user_email: str):
-        stub = org_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(org_pb2_grpc.OrgControllerStub)
         stub.Destroy(
             org_pb2.OrgDestroyRequest(uuid=project_uuid, user_email=user_email)
         )
@@ -60,7 +64,7 @@ class FlowType(GRPCType):
     ):
         permissions = {1: "viewer", 2: "editor", 3: "administrator", 4: "administrator"}
 
-        stub = user_pb2_grpc.UserPermissionControllerStub(self.channel)
+        stub = self.get_stub(user_pb2_grpc.UserPermissionControllerStub)
         response = stub.Update(
             user_pb2.UserPermissionUpdateRequest(
                 org_uuid=organization_uuid,
@@ -73,7 +77,7 @@ class FlowType(GRPCType):
     def get_classifiers(self, project_uuid: str, classifier_type: str, is_active: bool):
         result = []
         try:
-            stub = classifier_pb2_grpc.ClassifierControllerStub(self.channel)
+            stub = self.get_stub(classifier_pb2_grpc.ClassifierControllerStub)
             for classifier in stub.List(
                 classifier_pb2.ClassifierListRequest(
                     org_uuid=project_uuid,
@@ -104,7 +108,7 @@ class FlowType(GRPCType):
         access_token: str,
     ):
         # Create Classifier
-        stub = classifier_pb2_grpc.ClassifierControllerStub(self.channel)
+        stub = self.get_stub(classifier_pb2_grpc.ClassifierControllerStub)
         response = stub.Create(
             classifier_pb2.ClassifierCreateRequest(
                 org=project_uuid,
@@ -117,7 +121,7 @@ class FlowType(GRPCType):
         return response
 
     def delete_classifier(self, classifier_uuid: str, user_email: str):
-        stub = classifier_pb2_grpc.ClassifierControllerStub(self.channel)
+        stub = self.get_stub(classifier_pb2_grpc.ClassifierControllerStub)
         stub.Destroy(
             classifier_pb2.ClassifierDestroyRequest(
                 uuid=classifier_uuid, user_email=user_email
@@ -125,7 +129,7 @@ class FlowType(GRPCType):
         )
 
     def get_classifier(self, classifier_uuid: str):
-        stub = classifier_pb2_grpc.ClassifierControllerStub(self.channel)
+        stub = self.get_stub(classifier_pb2_grpc.ClassifierControllerStub)
         response = stub.Retrieve(
             classifier_pb2.ClassifierRetrieveRequest(uuid=classifier_uuid)
         )
@@ -138,7 +142,7 @@ class FlowType(GRPCType):
         }
 
     def update_language(self, user_email: str, language: str):
-        stub = user_pb2_grpc.UserControllerStub(self.channel)
+        stub = self.get_stub(user_pb2_grpc.UserControllerStub)
         response = stub.Update(
             user_pb2.UpdateUserLang(email=user_email, language=language)
         )
@@ -147,7 +151,7 @@ class FlowType(GRPCType):
     def get_project_flows(self, project_uuid: str, flow_name: str):
         result = []
         try:
-            stub = flow_pb2_grpc.FlowControllerStub(self.channel)
+            stub = self.get_stub(flow_pb2_grpc.FlowControllerStub)
             for flow in stub.List(
                 flow_pb2.FlowListRequest(flow_name=flow_name, org_uuid=project_uuid)
             ):
@@ -165,7 +169,7 @@ class FlowType(GRPCType):
     def get_project_info(self, project_uuid: str):
         result = []
         try:
-            stub = org_pb2_grpc.OrgControllerStub(self.channel)
+            stub = self.get_stub(org_pb2_grpc.OrgControllerStub)
             response = stub.Retrieve(org_pb2.OrgRetrieveRequest(uuid=project_uuid))
             return {
                 "id": response.id,
@@ -182,7 +186,7 @@ class FlowType(GRPCType):
     def get_project_statistic(self, project_uuid: str):
         result = []
         try:
-            stub = statistic_pb2_grpc.OrgStatisticControllerStub(self.channel)
+            stub = self.get_stub(statistic_pb2_grpc.OrgStatisticControllerStub)
             response = stub.Retrieve(
                 statistic_pb2.OrgStatisticRetrieveRequest(org_uuid=project_uuid)
             )
@@ -197,14 +201,14 @@ class FlowType(GRPCType):
         return result
 
     def get_billing_total_statistics(self, project_uuid: str, before: str, after: str):
-        stub = billing_pb2_grpc.BillingControllerStub(self.channel)
+        stub = self.get_stub(billing_pb2_grpc.BillingControllerStub)
         response = stub.Total(
             billing_pb2.BillingRequest(org=project_uuid, before=before, after=after)
         )
         return {"active_contacts": response.active_contacts}
 
     def suspend_or_unsuspend_project(self, project_uuid: str, is_suspended: bool):
-        stub = org_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(org_pb2_grpc.OrgControllerStub)
         response = stub.Update(
             org_pb2.OrgUpdateRequest(
                 uuid=project_uuid,
@@ -217,7 +221,7 @@ class FlowType(GRPCType):
         self, user: str, project_uuid: str, data: str, channeltype_code: str
     ):
         # Create Channel
-        stub = channel_pb2_grpc.ChannelControllerStub(self.channel)
+        stub = self.get_stub(channel_pb2_grpc.ChannelControllerStub)
         response = stub.Create(
             channel_pb2.ChannelCreateRequest(
                 user=user,
@@ -231,7 +235,7 @@ class FlowType(GRPCType):
     def create_wac_channel(
         self, user: str, flow_organization: str, config: str, phone_number_id: str
     ):
-        stub = channel_pb2_grpc.ChannelControllerStub(self.channel)
+        stub = self.get_stub(channel_pb2_grpc.ChannelControllerStub)
         response = stub.CreateWAC(
             channel_pb2.ChannelWACCreateRequest(
                 user=user,
@@ -243,7 +247,7 @@ class FlowType(GRPCType):
         return response
 
     def release_channel(self, channel_uuid: str, user: str):
-        stub = channel_pb2_grpc.ChannelControllerStub(self.channel)
+        stub = self.get_stub(channel_pb2_grpc.ChannelControllerStub)
         response = stub.Destroy(
             channel_pb2.ChannelDestroyRequest(
                 user=user,
@@ -258,7 +262,7 @@ class FlowType(GRPCType):
         channel_type: str = "WA",
         project_uuid: str = None,
     ):
-        stub = channel_pb2_grpc.ChannelControllerStub(self.channel)
+        stub = self.get_stub(channel_pb2_grpc.ChannelControllerStub)
         grpc_response = None
         if project_uuid:
             grpc_response = channel_pb2.ChannelListRequest(
@@ -272,7 +276,7 @@ class FlowType(GRPCType):
         return stub.List(grpc_response)
 
     def get_active_contacts(self, project_uuid, before, after):
-        stub = billing_pb2_grpc.BillingControllerStub(self.channel)
+        stub = self.get_stub(billing_pb2_grpc.BillingControllerStub)
         response = stub.Detailed(
             billing_pb2.BillingRequest(org=project_uuid, before=before, after=after)
         )
@@ -281,7 +285,7 @@ class FlowType(GRPCType):
     def delete_user_permission_project(
         self, project_uuid: str, user_email: str, permission: int
     ):
-        stub = user_pb2_grpc.UserPermissionControllerStub(self.channel)
+        stub = self.get_stub(user_pb2_grpc.UserPermissionControllerStub)
         request = user_pb2.UserPermissionUpdateRequest(
             org_uuid=project_uuid,
             user_email=user_email,
@@ -292,7 +296,7 @@ class FlowType(GRPCType):
         return response
 
     def get_message(self, org_uuid: str, contact_uuid: str, before: str, after: str):
-        stub = billing_pb2_grpc.BillingControllerStub(self.channel)
+        stub = self.get_stub(billing_pb2_grpc.BillingControllerStub)
         request = billing_pb2.MessageDetailRequest(
             org_uuid=org_uuid, contact_uuid=contact_uuid, before=before, after=after
         )
@@ -301,7 +305,7 @@ class FlowType(GRPCType):
         return response
 
     def list_flows(self, flow_organization: str, *args):
-        stub = flow_pb2_grpc.FlowControllerStub(self.channel)
+        stub = self.get_stub(flow_pb2_grpc.FlowControllerStub)
         flows = []
 
         try:
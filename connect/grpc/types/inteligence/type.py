@@ -3,6 +3,7 @@ from typing import Any
 import grpc
 from django.conf import settings
 
+from connect.grpc.channels import channel_pool
 from connect.grpc.grpc import GRPCType
 from weni.protobuf.intelligence import (
     organization_pb2_grpc,
@@ -17,20 +18,23 @@ from weni.protobuf.intelligence import (
 class InteligenceType(GRPCType):
     slug = "inteligence"
 
-    def __init__(self):
-        self.channel = self.get_channel()
-
     def get_channel(self):
-        if settings.INTELIGENCE_CERTIFICATE_GRPC_CRT:
-            with open(settings.INTELIGENCE_CERTIFICATE_GRPC_CRT, "rb") as f:
-                credentials = grpc.ssl_channel_credentials(f.read())
-            return grpc.secure_channel(settings.INTELIGENCE_GRPC_ENDPOINT, credentials)
-        return grpc.insecure_channel(settings.INTELIGENCE_GRPC_ENDPOINT)
+        return channel_pool.get_channel(
+            settings.INTELIGENCE_GRPC_ENDPOINT,
+            settings.INTELIGENCE_CERTIFICATE_GRPC_CRT,
+        )
+
+    def get_stub(self, stub_class):
+        return channel_pool.get_stub(
+            stub_class,
+            settings.INTELIGENCE_GRPC_ENDPOINT,
+            settings.INTELIGENCE_CERTIFICATE_GRPC_CRT,
+        )
 
     def list_organizations(self, user_email: str):
         result = []
         try:
-            stub = organization_pb2_grpc.OrgControllerStub(self.channel)
+            stub = self.get_stub(organization_pb2_grpc.OrgControllerStub)
 
             for org in stub.List(
                 organization_pb2.OrgListRequest(user_email=user_email)
@@ -55,7 +59,7 @@ class InteligenceType(GRPCType):
     def get_user_organization_permission_role(
         self, user_email: str, organization_id: Any
     ):
-        stub = authentication_pb2_grpc.UserPermissionControllerStub(self.channel)
+        stub = self.get_stub(authentication_pb2_grpc.UserPermissionControllerStub)
         response = stub.Retrieve(
             authentication_pb2.UserPermissionRetrieveRequest(
                 org_user_email=user_email, org_id=organization_id
@@ -64,7 +68,7 @@ class InteligenceType(GRPCType):
         return response.role
 
     def create_organization(self, organization_name: str, user_email: str):
-        stub = organization_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(organization_pb2_grpc.OrgControllerStub)
         response = stub.Create(
             organization_pb2.OrgCreateRequest(
                 organization_name=organization_name,
@@ -74,7 +78,7 @@ class InteligenceType(GRPCType):
         return response
 
     def delete_organization(self, organization_id: int, user_email: str):
-        stub = organization_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(organization_pb2_grpc.OrgControllerStub)
         stub.Destroy(
             organization_pb2.OrgDestroyRequest(
                 id=organization_id, user_email=user_email
@@ -82,7 +86,7 @@ class InteligenceType(GRPCType):
         )
 
     def update_organization(self, organization_id: int, organization_name: str):
-        stub = organization_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(organization_pb2_grpc.OrgControllerStub)
         response = stub.Update(
             organization_pb2.OrgUpdateRequest(
                 id=organization_id, name=organization_name
@@ -93,7 +97,7 @@ class InteligenceType(GRPCType):
     def update_user_permission_organization(
         self, organization_id: int, user_email: str, permission: int
     ):
-        stub = authentication_pb2_grpc.UserPermissionControllerStub(self.channel)
+        stub = self.get_stub(authentication_pb2_grpc.UserPermissionControllerStub)
         response = stub.Update(
             authentication_pb2.UserPermissionUpdateRequest(
                 org_id=organization_id,
@@ -106,7 +110,7 @@ class InteligenceType(GRPCType):
     def get_organization_inteligences(self, inteligence_name: str):
         result = []
         try:
-            stub = repository_pb2_grpc.RepositoryControllerStub(self.channel)
+            stub = self.get_stub(repository_pb2_grpc.RepositoryControllerStub)
             for inteligence in stub.List(
                 repository_pb2.RepositoryListRequest(name=inteligence_name)
             ):
@@ -125,7 +129,7 @@ class InteligenceType(GRPCType):
         return result
 
     def update_language(self, user_email: str, language: str):
-        stub = authentication_pb2_grpc.UserLanguageControllerStub(self.channel)
+        stub = self.get_stub(authentication_pb2_grpc.UserLanguageControllerStub)
         response = stub.Update(
             authentication_pb2.UserLanguageUpdateRequest(
                 email=user_email, language=language
@@ -134,14 +138,14 @@ class InteligenceType(GRPCType):
         return response
 
     def get_organization_statistic(self, organization_id: int):
-        stub = organization_pb2_grpc.OrgControllerStub(self.channel)
+        stub = self.get_stub(organization_pb2_grpc.OrgControllerStub)
         response = stub.Retrieve(
             organization_pb2.OrgStatisticRetrieveRequest(org_id=organization_id)
         )
         return {"repositories_count": response.repositories_count}
 
     def get_count_inteligences_project(self, classifiers: list):
-        stub = repository_pb2_grpc.RepositoryControllerStub(self.channel)
+        stub = self.get_stub(repository_pb2_grpc.RepositoryControllerStub)
 
         result = []
 
@@ -1,4 +1,7 @@
+import signal
+import socket
 import time
+
 import amqp
 
 from django.conf import settings
@@ -44,17 +47,45 @@ class PyAMQPConnectionBackend:
     def __init__(self, handle_consumers: callable):
         self._handle_consumers = handle_consumers
         self.rabbitmq_instance = RabbitMQPymqpConnection()
+        self._consumers = []
+        self._stopping = False
+
+    def stop(self, *args) -> None:
+        """Stop consuming after the current event; buffered work is drained."""
+        self._stopping = True
 
     def _drain_events(self, connection: amqp.connection.Connection):
-        while True:
-            connection.drain_events()
+        tick_interval = getattr(settings, "EDA_CONSUMER_TICK_INTERVAL", 0.1)
+        while not self._stopping:
+            try:
+                connection.drain_events(timeout=tick_interval)
+            except socket.timeout:
+                pass
+            # Batching consumers flush by time and ack finished batches here.
+            for consumer in self._consumers:
+                if hasattr(consumer, "tick"):
+                    consumer.tick()
+
+    def _drain_consumers(self) -> None:
+        for consumer in self._consumers:
+            if hasattr(consumer, "drain"):
+                consumer.drain()
+
+    def _reset_consumers(self) -> None:
+        for consumer in self._consumers:
+            if hasattr(consumer, "reset"):
+                consumer.reset()
+        self._consumers = []
 
     def start_consuming(self):
-        while True:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        while not self._stopping:
             try:
                 channel = self.rabbitmq_instance.channel
 
-                self._handle_consumers(channel)
+                self._consumers = self._handle_consumers(channel) or []
 
                 print(self._start_message)
 
@@ -65,12 +96,21 @@ class PyAMQPConnectionBackend:
                 ConnectionRefusedError,
                 OSError,
             ) as error:
+                self._reset_consumers()
                 print(f"[-] Connection error: {error}")
                 print("    [+] Reconnecting in 5 seconds...")
                 time.sleep(5)
                 self.rabbitmq_instance._establish_connection()
             except Exception as error:
                 # TODO: Handle exceptions with RabbitMQ
+                self._reset_consumers()
                 print("error on drain_events:", type(error), error)
                 time.sleep(5)
                 self.rabbitmq_instance._establish_connection()
+
+        print("[+] Stopping. Draining buffered events")
+        self._drain_consumers()
+        try:
+            self.rabbitmq_instance.connection.close()
+        except Exception as error:
+            print(f"[-] Error closing connection: {error}")
@@ -0,0 +1,123 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+import amqp
+from django.conf import settings
+from sentry_sdk import capture_exception
+
+from connect.internals.event_driven.signals import message_started, message_finished
+
+logger = logging.getLogger(__name__)
+
+
+class BatchEDAConsumer(ABC):
+    """Consumer that handles messages in micro-batches.
+
+    Messages are buffered until ``batch_size`` of them arrive or the first one
+    has waited ``batch_window`` seconds, then ``consume_batch`` handles the
+    whole batch. Batches run inline on the connection thread, or on
+    ``workers`` threads, each with its own database connection.
+
+    Acks and rejects always happen on the connection thread (amqp channels
+    are not thread-safe) and in delivery order, so a batch can be acked
+    with a single ``multiple=True`` ack. That requires the consumer to be
+    the only one acking on its channel.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        batch_window: Optional[float] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.batch_size = batch_size or getattr(settings, "EDA_CONSUMER_BATCH_SIZE", 50)
+        self.batch_window = (
+            batch_window
+            if batch_window is not None
+            else getattr(settings, "EDA_CONSUMER_BATCH_WINDOW", 0.5)
+        )
+        if workers is None:
+            workers = getattr(settings, "EDA_CONSUMER_WORKERS", 0)
+        self._executor = ThreadPoolExecutor(max_workers=workers) if workers else None
+        self._buffer: List[amqp.Message] = []
+        self._buffer_started_at = None
+        self._pending = deque()
+
+    def handle(self, message: amqp.Message) -> None:
+        if not self._buffer:
+            self._buffer_started_at = time.monotonic()
+        self._buffer.append(message)
+        if len(self._buffer) >= self.batch_size:
+            self.dispatch()
+
+    def tick(self) -> None:
+        """Dispatch a buffer past its window and settle finished batches."""
+        if (
+            self._buffer
+            and time.monotonic() - self._buffer_started_at >= self.batch_window
+        ):
+            self.dispatch()
+        self.settle()
+
+    def dispatch(self) -> None:
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        if self._executor is not None:
+            future = self._executor.submit(self._process, batch)
+        else:
+            future = Future()
+            try:
+                future.set_result(self._process(batch))
+            except Exception as exception:
+                future.set_exception(exception)
+        self._pending.append((batch, future))
+        self.settle()
+
+    def settle(self, wait: bool = False) -> None:
+        while self._pending and (wait or self._pending[0][1].done()):
+            batch, future = self._pending.popleft()
+            try:
+                rejected = future.result()
+            except Exception as exception:
+                capture_exception(exception)
+                logger.error(f"[{type(self).__name__}] - Batch failed: {exception}")
+                rejected = batch
+            self._acknowledge(batch, rejected)
+
+    def _acknowledge(self, batch: List[amqp.Message], rejected: List) -> None:
+        rejected_tags = {message.delivery_tag for message in rejected}
+        for message in rejected:
+            message.channel.basic_reject(message.delivery_tag, requeue=False)
+        accepted = [
+            message for message in batch if message.delivery_tag not in rejected_tags
+        ]
+        if accepted:
+            # Earlier batches are settled already, so this only acks this one.
+            last = accepted[-1]
+            last.channel.basic_ack(last.delivery_tag, multiple=True)
+
+    def _process(self, batch: List[amqp.Message]) -> List[amqp.Message]:
+        message_started.send(sender=self)
+        try:
+            return self.consume_batch(batch)
+        finally:
+            message_finished.send(sender=self)
+
+    def drain(self) -> None:
+        """Handle what is buffered and wait for every batch to be settled."""
+        self.dispatch()
+        self.settle(wait=True)
+
+    def reset(self) -> None:
+        """Forget unsettled messages; the broker redelivers them."""
+        self._buffer = []
+        self._pending.clear()
+
+    @abstractmethod
+    def consume_batch(self, messages: List[amqp.Message]) -> List[amqp.Message]:
+        """Handle ``messages`` and return the ones to reject."""
@@ -1,31 +1,45 @@
+import logging
+from typing import List
+
 import amqp
 
 from sentry_sdk import capture_exception
-from .rabbitmq_consumer import EDAConsumer
+from .batch import BatchEDAConsumer
 
 from connect.usecases.recent_activities.create import RecentActivityUseCase
 
 from .parsers.json_parser import JSONParser
-from connect.usecases.recent_activities.exceptions import InvalidActionEntityCombination
-
-
-class RecentActivitiesConsumer(EDAConsumer):
-    def consume(self, message: amqp.Message):
-        try:
-            msg_body = JSONParser.parse(message.body)
-            print(f"[RecentActivitiesConsumer] - Consuming a message. Body: {msg_body}")
-            usecase = RecentActivityUseCase()
-            usecase.create_recent_activity(msg_body)
-
-            message.channel.basic_ack(message.delivery_tag)
-            print("[RecentActivitiesConsumer] - Recent activity created.")
-        except InvalidActionEntityCombination as exception:
-            capture_exception(exception)
-            message.channel.basic_reject(message.delivery_tag, requeue=False)
-            print(
-                f"[RecentActivitiesConsumer] - Message rejected due to invalid action/entity combination: {exception}"
-            )
-        except Exception as exception:
-            capture_exception(exception)
-            message.channel.basic_reject(message.delivery_tag, requeue=False)
-            print(f"[RecentActivitiesConsumer] - Message rejected by: {exception}")
+
+logger = logging.getLogger(__name__)
+
+
+class RecentActivitiesConsumer(BatchEDAConsumer):
+    def consume_batch(self, messages: List[amqp.Message]) -> List[amqp.Message]:
+        rejected = []
+        parsed = []
+        for message in messages:
+            try:
+                parsed.append((message, JSONParser.parse(message.body)))
+            except Exception as exception:
+                capture_exception(exception)
+                rejected.append(message)
+                logger.warning(
+                    f"[RecentActivitiesConsumer] - Message rejected by: {exception}"
+                )
+
+        errors = RecentActivityUseCase().create_recent_activities(
+            [msg_body for _, msg_body in parsed]
+        )
+        for (message, _), exception in zip(parsed, errors):
+            if exception is not None:
+                capture_exception(exception)
+                rejected.append(message)
+                logger.warning(
+                    f"[RecentActivitiesConsumer] - Message rejected by: {exception}"
+                )
+
+        logger.info(
+            f"[RecentActivitiesConsumer] - {len(messages) - len(rejected)} "
+            f"recent activities created, {len(rejected)} messages rejected."
+        )
+        return rejected
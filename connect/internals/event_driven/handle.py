@@ -1,11 +1,20 @@
+from typing import List
+
 from amqp.channel import Channel
+from django.conf import settings
 
 from .consumer.recent_activities import RecentActivitiesConsumer
 
 
 # Event driven using rabbitmq handles consumers
-def handle_consumers(channel: Channel) -> None:
-
-    channel.basic_consume(
-        "recent-activity.connect", callback=RecentActivitiesConsumer().handle
+def handle_consumers(channel: Channel) -> List:
+    # Prefetch must cover a full batch, or batches only close by their window.
+    channel.basic_qos(
+        prefetch_size=0,
+        prefetch_count=getattr(settings, "EDA_CONSUMER_PREFETCH_COUNT", 200),
+        a_global=False,
     )
+
+    consumer = RecentActivitiesConsumer()
+    channel.basic_consume("recent-activity.connect", callback=consumer.handle)
+    return [consumer]
@@ -0,0 +1,191 @@
+"""Transactional outbox for EDA messages.
+
+``enqueue`` stores a message in ``OutboxEvent`` instead of publishing it, so
+the message commits (or rolls back) together with the change it describes
+and request handlers never wait on RabbitMQ. ``OutboxRelay`` runs in its own
+process (``manage.py edarelay``) and drains the table in batches over one
+persistent channel with publisher confirms; a row is deleted only after the
+broker confirms it, which gives at-least-once delivery.
+
+Concurrent relays are safe: batches are claimed with ``SKIP LOCKED``. A row
+the broker rejects ``EDA_OUTBOX_MAX_ATTEMPTS`` times (nack, unroutable, or a
+channel error such as a missing exchange) is dead-lettered (marked with
+``dead_lettered_at`` and skipped from then on), so one poison message does
+not block the rest of the outbox. Connection failures are not charged to any
+row: the batch is simply retried once the broker is back.
+"""
+
+import json
+import logging
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+from pika import BasicProperties
+from pika.exceptions import ChannelClosedByBroker, NackError, UnroutableError
+from prometheus_client import Counter, Gauge
+
+from connect.internals.event_driven.connection.rabbitmq import RabbitMQConnection
+from connect.internals.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Publish errors caused by the message itself rather than by the connection.
+MESSAGE_REJECTED_ERRORS = (NackError, UnroutableError, ChannelClosedByBroker)
+
+OUTBOX_PUBLISHED = Counter(
+    "connect_eda_outbox_published_total",
+    "EDA outbox messages confirmed by the broker, by exchange.",
+    ["exchange"],
+)
+OUTBOX_FAILURES = Counter(
+    "connect_eda_outbox_failures_total",
+    "EDA outbox publish attempts that failed, by exchange.",
+    ["exchange"],
+)
+OUTBOX_PENDING = Gauge(
+    "connect_eda_outbox_pending",
+    "EDA outbox messages waiting to be published.",
+)
+OUTBOX_DEAD_LETTERED = Counter(
+    "connect_eda_outbox_dead_lettered_total",
+    "EDA outbox messages given up on after too many failures, by exchange.",
+    ["exchange"],
+)
+OUTBOX_LAG = Gauge(
+    "connect_eda_outbox_lag_seconds",
+    "Age of the oldest EDA outbox message waiting to be published.",
+)
+
+
+def enqueue(body: Dict, exchange: str, routing_key: str = "") -> OutboxEvent:
+    return OutboxEvent.objects.create(
+        exchange=exchange, routing_key=routing_key, body=json.dumps(body)
+    )
+
+
+class OutboxRelay:
+    """Publish ``OutboxEvent`` rows to RabbitMQ in batches."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        connection: Optional[RabbitMQConnection] = None,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        self.batch_size = batch_size or getattr(settings, "EDA_OUTBOX_BATCH_SIZE", 100)
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else getattr(settings, "EDA_OUTBOX_POLL_INTERVAL", 1)
+        )
+        self.max_attempts = max_attempts or getattr(
+            settings, "EDA_OUTBOX_MAX_ATTEMPTS", 10
+        )
+        self._connection = connection
+        self._channel = None
+
+    @property
+    def channel(self):
+        if self._connection is None:
+            self._connection = RabbitMQConnection()
+        self._connection.make_connection()
+        channel = self._connection.channel
+        if channel is not self._channel:
+            # New connections come with a new channel; confirms are per channel.
+            channel.confirm_delivery()
+            self._channel = channel
+        return channel
+
+    def _reset_channel(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._channel = None
+
+    def publish_batch(self) -> int:
+        """Publish one batch; returns the number of confirmed messages.
+
+        The batch stops at the first failure so messages keep their order.
+        A row the broker rejected records the error and is retried on the next
+        batch, until it reaches ``max_attempts`` and is dead-lettered.
+        """
+        try:
+            channel = self.channel
+        except Exception as error:
+            logger.error(f"Failed to open the outbox relay channel: {error}")
+            self._reset_channel()
+            return 0
+
+        with transaction.atomic():
+            events = list(
+                OutboxEvent.objects.select_for_update(skip_locked=True)
+                .filter(dead_lettered_at__isnull=True)
+                .order_by("pk")[: self.batch_size]
+            )
+            if not events:
+                return 0
+
+            published = []
+            for event in events:
+                try:
+                    channel.basic_publish(
+                        exchange=event.exchange,
+                        routing_key=event.routing_key,
+                        body=event.body,
+                        properties=BasicProperties(delivery_mode=2),
+                    )
+                except Exception as error:
+                    OUTBOX_FAILURES.labels(event.exchange).inc()
+                    logger.error(f"Failed to publish outbox event {event.pk}: {error}")
+                    if isinstance(error, MESSAGE_REJECTED_ERRORS):
+                        self._record_failure(event, error)
+                    self._reset_channel()
+                    break
+                published.append(event)
+                OUTBOX_PUBLISHED.labels(event.exchange).inc()
+
+            OutboxEvent.objects.filter(
+                pk__in=[event.pk for event in published]
+            ).delete()
+        return len(published)
+
+    def _record_failure(self, event: OutboxEvent, error: Exception) -> None:
+        attempts = event.attempts + 1
+        dead_lettered_at = None
+        if attempts >= self.max_attempts:
+            dead_lettered_at = timezone.now()
+            OUTBOX_DEAD_LETTERED.labels(event.exchange).inc()
+            logger.error(
+                f"Outbox event {event.pk} to {event.exchange} dead-lettered "
+                f"after {attempts} attempts: {error}"
+            )
+        OutboxEvent.objects.filter(pk=event.pk).update(
+            attempts=attempts,
+            last_error=str(error),
+            dead_lettered_at=dead_lettered_at,
+        )
+
+    def observe_lag(self) -> None:
+        stats = OutboxEvent.objects.filter(dead_lettered_at__isnull=True).aggregate(
+            pending=Count("pk"), oldest=Min("created_at")
+        )
+        oldest = stats["oldest"]
+        OUTBOX_PENDING.set(stats["pending"])
+        OUTBOX_LAG.set(
+            (timezone.now() - oldest).total_seconds() if oldest is not None else 0
+        )
+
+    def run(self) -> None:  # pragma: no cover
+        while True:
+            published = self.publish_batch()
+            self.observe_lag()
+            if published < self.batch_size:
+                # Drain full batches back to back; sleep only when caught up
+                # or after a failure.
+                time.sleep(self.poll_interval)
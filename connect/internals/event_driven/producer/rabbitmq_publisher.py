@@ -1,4 +1,5 @@
 import json
+import logging
 from time import sleep
 
 from django.conf import settings
@@ -9,35 +10,57 @@ from pika.exceptions import StreamLostError
 from typing import Dict
 
 from connect.internals.event_driven.connection.rabbitmq import RabbitMQConnection
+from connect.internals.event_driven.producer import outbox
+
+logger = logging.getLogger(__name__)
 
 
 class RabbitmqPublisher:  # pragma: no cover
+    """Publishes EDA messages.
+
+    With ``EDA_USE_OUTBOX`` the message is stored in the transactional outbox
+    and published later by ``manage.py edarelay``; otherwise it is published
+    right away, giving up after ``EDA_PUBLISH_MAX_RETRIES`` failed attempts.
+    """
+
     def __init__(self) -> None:
         # Tests must never reach a real broker (project convention: EDA
-        # publishers are no-ops under settings.TESTING). Skip the connection so
-        # signal/model side effects don't hit external infrastructure.
-        self.rabbitmq_connection = None if settings.TESTING else RabbitMQConnection()
+        # publishers are no-ops under settings.TESTING). The connection is
+        # only opened when a message is published directly.
+        self._rabbitmq_connection = None
+
+    @property
+    def rabbitmq_connection(self) -> RabbitMQConnection:
+        if self._rabbitmq_connection is None:
+            self._rabbitmq_connection = RabbitMQConnection()
+        return self._rabbitmq_connection
 
     def send_message(self, body: Dict, exchange: str, routing_key: str):
         if settings.TESTING:
             return
 
-        sended = False
-        while not sended:
+        if getattr(settings, "EDA_USE_OUTBOX", False):
+            outbox.enqueue(body, exchange=exchange, routing_key=routing_key)
+            return
+
+        max_retries = getattr(settings, "EDA_PUBLISH_MAX_RETRIES", 3)
+        for attempt in range(max_retries + 1):
             try:
+                if attempt:
+                    self.rabbitmq_connection.make_connection()
                 self.rabbitmq_connection.channel.basic_publish(
                     exchange=exchange,
                     routing_key=routing_key,
                     body=json.dumps(body),
                     properties=BasicProperties(delivery_mode=2),
                 )
-                print(f"Message sent {body}")
-                sended = True
+                return
             except StreamLostError as e:
-                print(f"stream lost error: {e}")
-                self.rabbitmq_connection.make_connection()
+                logger.warning(f"stream lost error: {e}")
             except Exception as err:
-                print(f"error: {err}")
-                self.rabbitmq_connection.make_connection()
-            if not sended:
+                logger.warning(f"error: {err}")
+            if attempt < max_retries:
                 sleep(settings.EDA_WAIT_TIME_RETRY)
+
+        logger.error(f"Failed to publish message to {exchange}: {body}")
+        raise ConnectionError(f"Could not publish message to {exchange}")
@@ -1,6 +1,10 @@
 from django.dispatch import Signal
 from django.db import reset_queries, close_old_connections
 
+from connect.usecases.recent_activities.identity_cache import (
+    report_identity_cache_stats,
+)
+
 
 message_started = Signal()
 message_finished = Signal()
@@ -9,3 +13,4 @@ message_finished = Signal()
 message_started.connect(reset_queries)
 message_started.connect(close_old_connections)
 message_finished.connect(close_old_connections)
+message_finished.connect(report_identity_cache_stats)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from prometheus_client import start_http_server
+
+from connect.internals.event_driven.producer.outbox import OutboxRelay
+
+
+class Command(BaseCommand):
+    help = "Publish the EDA outbox to RabbitMQ"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", dest="batch_size", type=int)
+        parser.add_argument("--poll-interval", dest="poll_interval", type=float)
+        parser.add_argument(
+            "--metrics-port",
+            dest="metrics_port",
+            type=int,
+            help="Expose Prometheus metrics of the relay on this port",
+        )
+
+    def handle(self, *args, **options):
+        if options["metrics_port"]:
+            start_http_server(options["metrics_port"])
+        OutboxRelay(
+            batch_size=options["batch_size"], poll_interval=options["poll_interval"]
+        ).run()
@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "exchange",
+                    models.CharField(max_length=255, verbose_name="exchange"),
+                ),
+                (
+                    "routing_key",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="routing key"
+                    ),
+                ),
+                ("body", models.TextField(verbose_name="body")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="attempts"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox event",
+                "ordering": ["pk"],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("internals", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outboxevent",
+            name="dead_lettered_at",
+            field=models.DateTimeField(
+                blank=True, default=None, null=True, verbose_name="dead-lettered at"
+            ),
+        ),
+    ]
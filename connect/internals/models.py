@@ -0,0 +1,29 @@
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+
+class OutboxEvent(models.Model):
+    """EDA message waiting to be published by the outbox relay.
+
+    Rows are written in the same database transaction as the change they
+    describe and deleted once the broker confirms them (see
+    ``connect.internals.event_driven.producer.outbox``). Rows that keep
+    failing are kept with ``dead_lettered_at`` set and no longer published.
+    """
+
+    class Meta:
+        verbose_name = _("outbox event")
+        ordering = ["pk"]
+
+    exchange = models.CharField(_("exchange"), max_length=255)
+    routing_key = models.CharField(_("routing key"), max_length=255, blank=True)
+    body = models.TextField(_("body"))
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True)
+    dead_lettered_at = models.DateTimeField(
+        _("dead-lettered at"), null=True, blank=True, default=None
+    )
+
+    def __str__(self):
+        return f"{self.exchange}:{self.routing_key} #{self.pk}"
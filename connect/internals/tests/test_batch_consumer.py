@@ -0,0 +1,98 @@
+import threading
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase
+
+from connect.internals.event_driven.consumer.batch import BatchEDAConsumer
+
+
+class RecordingConsumer(BatchEDAConsumer):
+    def __init__(self, reject=(), fail=False, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.reject = set(reject)
+        self.fail = fail
+
+    def consume_batch(self, messages):
+        self.batches.append([message.delivery_tag for message in messages])
+        if self.fail:
+            raise RuntimeError("database is down")
+        return [message for message in messages if message.delivery_tag in self.reject]
+
+
+class BatchEDAConsumerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.channel = MagicMock()
+
+    def message(self, delivery_tag):
+        message = MagicMock(delivery_tag=delivery_tag)
+        message.channel = self.channel
+        return message
+
+    def test_full_batch_is_acked_once_with_multiple(self):
+        consumer = RecordingConsumer(batch_size=3, batch_window=60, workers=0)
+
+        for tag in (1, 2, 3, 4):
+            consumer.handle(self.message(tag))
+
+        self.assertEqual(consumer.batches, [[1, 2, 3]])
+        self.channel.basic_ack.assert_called_once_with(3, multiple=True)
+
+        consumer.drain()
+        self.assertEqual(consumer.batches, [[1, 2, 3], [4]])
+        self.channel.basic_ack.assert_called_with(4, multiple=True)
+
+    def test_window_dispatches_a_partial_batch(self):
+        consumer = RecordingConsumer(batch_size=10, batch_window=0, workers=0)
+
+        consumer.handle(self.message(1))
+        consumer.tick()
+
+        self.assertEqual(consumer.batches, [[1]])
+        self.channel.basic_ack.assert_called_once_with(1, multiple=True)
+
+    def test_rejected_messages_are_rejected_before_the_ack(self):
+        consumer = RecordingConsumer(reject={3}, batch_size=3, workers=0)
+
+        for tag in (1, 2, 3):
+            consumer.handle(self.message(tag))
+
+        self.assertEqual(
+            [call[0] for call in self.channel.method_calls],
+            ["basic_reject", "basic_ack"],
+        )
+        self.channel.basic_reject.assert_called_once_with(3, requeue=False)
+        self.channel.basic_ack.assert_called_once_with(2, multiple=True)
+
+    def test_failed_batch_is_rejected(self):
+        consumer = RecordingConsumer(fail=True, batch_size=2, workers=0)
+
+        consumer.handle(self.message(1))
+        consumer.handle(self.message(2))
+
+        self.assertEqual(self.channel.basic_reject.call_count, 2)
+        self.channel.basic_ack.assert_not_called()
+
+    def test_worker_batches_are_settled_in_delivery_order(self):
+        release = threading.Event()
+
+        class SlowFirstBatch(RecordingConsumer):
+            def consume_batch(self, messages):
+                if messages[0].delivery_tag == 1:
+                    release.wait(5)
+                return super().consume_batch(messages)
+
+        consumer = SlowFirstBatch(batch_size=1, workers=2)
+        consumer.handle(self.message(1))
+        consumer.handle(self.message(2))
+        consumer.tick()
+
+        # The second batch may be done, but acking it would also ack tag 1.
+        self.channel.basic_ack.assert_not_called()
+
+        release.set()
+        consumer.drain()
+        self.assertEqual(
+            [call.args for call in self.channel.basic_ack.call_args_list],
+            [(1,), (2,)],
+        )
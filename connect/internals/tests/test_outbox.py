@@ -0,0 +1,111 @@
+import json
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+from pika.exceptions import ChannelClosedByBroker, NackError, StreamLostError
+
+from connect.internals.event_driven.producer.outbox import OutboxRelay, enqueue
+from connect.internals.models import OutboxEvent
+
+
+class OutboxRelayTestCase(TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.channel = self.connection.channel
+        self.relay = OutboxRelay(batch_size=2, connection=self.connection)
+
+    def published_bodies(self):
+        return [
+            json.loads(call.kwargs["body"])
+            for call in self.channel.basic_publish.call_args_list
+        ]
+
+    def test_enqueue_stores_the_serialized_message(self):
+        event = enqueue({"action": "updated"}, exchange="projects.topic")
+
+        self.assertEqual(event.exchange, "projects.topic")
+        self.assertEqual(event.routing_key, "")
+        self.assertEqual(json.loads(event.body), {"action": "updated"})
+
+    def test_publishes_in_order_and_deletes_confirmed_events(self):
+        for index in range(3):
+            enqueue({"index": index}, exchange="projects.topic", routing_key="key")
+
+        self.assertEqual(self.relay.publish_batch(), 2)
+        self.assertEqual(self.relay.publish_batch(), 1)
+        self.assertEqual(self.relay.publish_batch(), 0)
+
+        self.assertEqual(
+            self.published_bodies(), [{"index": 0}, {"index": 1}, {"index": 2}]
+        )
+        self.assertFalse(OutboxEvent.objects.exists())
+        self.channel.confirm_delivery.assert_called_once_with()
+
+    def test_failure_stops_the_batch_and_keeps_the_event(self):
+        first = enqueue({"index": 0}, exchange="projects.topic")
+        second = enqueue({"index": 1}, exchange="projects.topic")
+        self.channel.basic_publish.side_effect = [None, NackError([])]
+
+        self.assertEqual(self.relay.publish_batch(), 1)
+
+        self.assertFalse(OutboxEvent.objects.filter(pk=first.pk).exists())
+        second.refresh_from_db()
+        self.assertEqual(second.attempts, 1)
+        self.assertEqual(second.last_error, str(NackError([])))
+        self.connection.close.assert_called_once_with()
+
+        self.channel.basic_publish.side_effect = None
+        self.assertEqual(self.relay.publish_batch(), 1)
+        self.assertFalse(OutboxEvent.objects.exists())
+        # The reopened channel has confirms enabled again.
+        self.assertEqual(self.channel.confirm_delivery.call_count, 2)
+
+    def test_event_is_dead_lettered_after_max_attempts(self):
+        relay = OutboxRelay(batch_size=2, connection=self.connection, max_attempts=2)
+        poison = enqueue({"index": 0}, exchange="missing.topic")
+        enqueue({"index": 1}, exchange="projects.topic")
+
+        def publish(exchange, **kwargs):
+            if exchange == "missing.topic":
+                raise ChannelClosedByBroker(
+                    404, "NOT_FOUND - no exchange 'missing.topic'"
+                )
+
+        self.channel.basic_publish.side_effect = publish
+
+        self.assertEqual(relay.publish_batch(), 0)
+        self.assertEqual(relay.publish_batch(), 0)
+        poison.refresh_from_db()
+        self.assertEqual(poison.attempts, 2)
+        self.assertIsNotNone(poison.dead_lettered_at)
+
+        # The rest of the outbox keeps draining past the dead-lettered row.
+        self.assertEqual(relay.publish_batch(), 1)
+        self.assertEqual(relay.publish_batch(), 0)
+        self.assertEqual(list(OutboxEvent.objects.all()), [poison])
+
+    def test_broker_outage_is_not_charged_to_any_event(self):
+        event = enqueue({"index": 0}, exchange="projects.topic")
+        self.connection.make_connection.side_effect = StreamLostError("down")
+
+        for _ in range(3):
+            self.assertEqual(self.relay.publish_batch(), 0)
+
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 0)
+        self.assertIsNone(event.dead_lettered_at)
+        self.channel.basic_publish.assert_not_called()
+
+        self.connection.make_connection.side_effect = None
+        self.assertEqual(self.relay.publish_batch(), 1)
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_connection_lost_while_publishing_keeps_attempts(self):
+        event = enqueue({"index": 0}, exchange="projects.topic")
+        self.channel.basic_publish.side_effect = StreamLostError("reset")
+
+        self.assertEqual(self.relay.publish_batch(), 0)
+
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 0)
+        self.connection.close.assert_called_once_with()
@@ -1,8 +1,11 @@
+import hashlib
 import json
 import logging
+import time
 import jwt
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import translation
 from django_redis import get_redis_connection
 from mozilla_django_oidc.auth import OIDCAuthenticationBackend
@@ -107,13 +110,14 @@ class WeniOIDCAuthenticationBackend(OIDCAuthenticationBackend):
 
 
 class WeniOIDCAuthentication(OIDCAuthentication):
+    SESSION_CACHE_PREFIX = "oidc:session"
+
     def authenticate(self, request):
         instance = super().authenticate(request=request)
         if instance is None:
             return instance
-        identity_provider = jwt.decode(
-            instance[1], options={"verify_signature": False}
-        ).get("identity_provider")
+        claims = jwt.decode(instance[1], options={"verify_signature": False})
+        identity_provider = claims.get("identity_provider")
 
         # Expose the current session's SSO provider so SSO-access enforcement
         # reads the live claim instead of the append-only provider history.
@@ -129,18 +133,60 @@ class WeniOIDCAuthentication(OIDCAuthentication):
         translation.activate(user_language)
 
         user = instance[0]
-        KeycloakCredentialsService().invalidate(user.email)
+        if not self.start_session(claims, instance[1]):
+            # Side effects below already ran for this token.
+            return instance
+
+        try:
+            KeycloakCredentialsService().invalidate(user.email)
 
-        if user.first_login and not user.first_login_token:
-            user.save_first_login_token(instance[1])
+            if user.first_login and not user.first_login_token:
+                user.save_first_login_token(instance[1])
 
-        if identity_provider:
-            user.set_identity_providers(identity_provider=identity_provider)
+            if identity_provider:
+                user.set_identity_providers(identity_provider=identity_provider)
 
-        WeniOIDCAuthentication.verify_login(user, instance[1])
+            WeniOIDCAuthentication.verify_login(user, instance[1])
+        except Exception:
+            # Let the next request with this token retry the side effects.
+            cache.delete(self.session_fingerprint(claims, instance[1]))
+            raise
 
         return instance
 
+    @classmethod
+    def session_fingerprint(cls, claims: dict, token: str) -> str:
+        fingerprint = claims.get("jti") or claims.get("sid")
+        if not fingerprint:
+            fingerprint = hashlib.sha256(token.encode()).hexdigest()
+        return f"{cls.SESSION_CACHE_PREFIX}:{fingerprint}"
+
+    @classmethod
+    def start_session(cls, claims: dict, token: str) -> bool:
+        """Returns True the first time a token is seen, False afterwards.
+
+        The per-session side effects (password cache invalidation, identity
+        provider recording, first-login verification) only depend on the token,
+        so later requests carrying it can skip them. The fingerprint lives until
+        the token expires, capped by OIDC_SESSION_FINGERPRINT_TTL. Cache errors
+        run the side effects, as before.
+        """
+        ttl = settings.OIDC_SESSION_FINGERPRINT_TTL
+        if ttl <= 0:
+            return True
+
+        expires_at = claims.get("exp")
+        if expires_at:
+            ttl = min(ttl, int(expires_at - time.time()))
+            if ttl <= 0:
+                return True
+
+        try:
+            return cache.add(cls.session_fingerprint(claims, token), True, ttl)
+        except Exception as error:
+            LOGGER.warning(f"Failed to record OIDC session fingerprint: {error}")
+            return True
+
     @staticmethod
     def verify_login(user: User, request_token: str):
         """Compares the first login token with the token sent in the request to check if is the same session"""
@@ -28,7 +28,7 @@ from connect.usecases.authorizations.get_project_authorization import (
 class ProjectUserPermissionsServiceTestCase(TestCase):
     @patch("connect.authentication.signals.RabbitmqPublisher")
     @patch("connect.common.signals.RabbitmqPublisher")
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(
         self,
@@ -422,6 +422,9 @@ OIDC_CACHE_TOKEN = env.bool(
 OIDC_CACHE_TTL = env.int(
     "OIDC_CACHE_TTL", default=600
 )  # Time-to-live for cached user tokens (default: 600 seconds).
+# Upper bound for remembering that a token's per-session side effects already
+# ran; 0 runs them on every request.
+OIDC_SESSION_FINGERPRINT_TTL = env.int("OIDC_SESSION_FINGERPRINT_TTL", default=3600)
 
 # Swagger
 
@@ -446,6 +449,30 @@ CELERY_TASK_SERIALIZER = "json"
 
 SYNC_CONTACTS_SCHEDULE = env.str("SYNC_CONTACTS_SCHEDULE")
 
+# check_organization_free_plan: concurrent Flows requests, rows per
+# bulk_update and how long (seconds) a run holds its overlap guard.
+FREE_PLAN_CHECK_WORKERS = env.int("FREE_PLAN_CHECK_WORKERS", default=8)
+FREE_PLAN_CHECK_BATCH_SIZE = env.int("FREE_PLAN_CHECK_BATCH_SIZE", default=500)
+FREE_PLAN_CHECK_LOCK_TTL = env.int("FREE_PLAN_CHECK_LOCK_TTL", default=1800)
+
+# sync_total_contact_count: projects per chunk task and concurrent Flows
+# requests inside each chunk.
+SYNC_CONTACT_COUNT_CHUNK_SIZE = env.int("SYNC_CONTACT_COUNT_CHUNK_SIZE", default=500)
+SYNC_CONTACT_COUNT_WORKERS = env.int("SYNC_CONTACT_COUNT_WORKERS", default=8)
+# An unfinished run is resumed only while younger than this (seconds) and
+# while none of its chunks failed this many times; otherwise it is closed as
+# failed and a new run starts.
+SYNC_CONTACT_COUNT_RUN_MAX_AGE = env.int(
+    "SYNC_CONTACT_COUNT_RUN_MAX_AGE", default=36 * 60 * 60
+)
+SYNC_CONTACT_COUNT_MAX_CHUNK_ATTEMPTS = env.int(
+    "SYNC_CONTACT_COUNT_MAX_CHUNK_ATTEMPTS", default=3
+)
+
+# Window (seconds) in which repeated requests to (un)suspend an organization's
+# projects with the same state are dropped.
+SUSPEND_PROJECTS_DEDUP_TTL = env.int("SUSPEND_PROJECTS_DEDUP_TTL", default=60)
+
 
 # Cache
 
@@ -525,6 +552,45 @@ INTEGRATIONS_CERTIFICATE_GRPC_CRT = env.str("INTEGRATIONS_CERTIFICATE_GRPC_CRT")
 # Internal communication
 USE_FLOW_REST = env.bool("USE_FLOW_REST")
 
+# The client_credentials token used by the internal REST clients is reused
+# until this many seconds before it expires. When INTERNAL_TOKEN_SHARED_CACHE
+# is on, the token is also shared between workers through the default cache.
+INTERNAL_TOKEN_EXPIRY_MARGIN = env.int("INTERNAL_TOKEN_EXPIRY_MARGIN", default=30)
+INTERNAL_TOKEN_SHARED_CACHE = env.bool("INTERNAL_TOKEN_SHARED_CACHE", default=True)
+
+# Pooled session used by the internal REST clients (Flows, Chats, ...).
+# Timeouts are in seconds; retries only apply to idempotent verbs.
+INTERNAL_HTTP_POOL_CONNECTIONS = env.int("INTERNAL_HTTP_POOL_CONNECTIONS", default=10)
+INTERNAL_HTTP_POOL_MAXSIZE = env.int("INTERNAL_HTTP_POOL_MAXSIZE", default=20)
+INTERNAL_HTTP_MAX_RETRIES = env.int("INTERNAL_HTTP_MAX_RETRIES", default=3)
+INTERNAL_HTTP_BACKOFF_FACTOR = env.float("INTERNAL_HTTP_BACKOFF_FACTOR", default=0.5)
+INTERNAL_HTTP_CONNECT_TIMEOUT = env.float("INTERNAL_HTTP_CONNECT_TIMEOUT", default=5)
+INTERNAL_HTTP_READ_TIMEOUT = env.float("INTERNAL_HTTP_READ_TIMEOUT", default=120)
+
+# Channels shared by the gRPC types (Flows, Intelligence, Integrations).
+# Keepalive values are in milliseconds; message length is in bytes.
+GRPC_KEEPALIVE_TIME_MS = env.int("GRPC_KEEPALIVE_TIME_MS", default=30000)
+GRPC_KEEPALIVE_TIMEOUT_MS = env.int("GRPC_KEEPALIVE_TIMEOUT_MS", default=10000)
+GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS = env.bool(
+    "GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS", default=True
+)
+GRPC_MAX_MESSAGE_LENGTH = env.int("GRPC_MAX_MESSAGE_LENGTH", default=16 * 1024 * 1024)
+
+# Server side of `manage.py grpc`. Unset means no limit on concurrent RPCs.
+GRPC_SERVER_MAXIMUM_CONCURRENT_RPCS = env.int(
+    "GRPC_SERVER_MAXIMUM_CONCURRENT_RPCS", default=None
+)
+
+# Project search queries Flows and Intelligence concurrently and gives up on a
+# backend after PROJECT_SEARCH_TIMEOUT seconds; complete results are cached.
+PROJECT_SEARCH_TIMEOUT = env.float("PROJECT_SEARCH_TIMEOUT", default=5)
+PROJECT_SEARCH_CACHE_TTL = env.int("PROJECT_SEARCH_CACHE_TTL", default=30)
+
+# Seconds a flow_organization -> project/organization mapping stays cached.
+FLOW_ORGANIZATION_MAPPING_CACHE_TTL = env.int(
+    "FLOW_ORGANIZATION_MAPPING_CACHE_TTL", default=300
+)
+
 # Flow Marketing Weni
 
 SEND_REQUEST_FLOW = env.bool("SEND_REQUEST_FLOW")
@@ -570,6 +636,12 @@ PLAN_TRIAL_LIMIT = env.int("PLAN_TRIAL_LIMIT")
 # internal `plan-status` endpoint. Cache entries are also invalidated proactively
 # via signals whenever a BillingPlan or Organization.is_suspended changes.
 PLAN_STATUS_CACHE_TTL = env.int("PLAN_STATUS_CACHE_TTL")
+# In-process L1 in front of the plan status cache: seconds an entry is served
+# without asking Redis, and how many entries each process keeps (0 disables).
+PLAN_STATUS_L1_TTL = env.int("PLAN_STATUS_L1_TTL", default=5)
+PLAN_STATUS_L1_MAXSIZE = env.int("PLAN_STATUS_L1_MAXSIZE", default=10000)
+# Maximum number of projects accepted by the bulk `plan-status` endpoint.
+PLAN_STATUS_BULK_MAX_PROJECTS = env.int("PLAN_STATUS_BULK_MAX_PROJECTS", default=1000)
 
 SESSION_TOKEN_MIN_DURATION = env.int("SESSION_TOKEN_MIN_DURATION")
 SESSION_TOKEN_MAX_DURATION = env.int("SESSION_TOKEN_MAX_DURATION")
@@ -611,6 +683,7 @@ ELASTICSEARCH_TIMEOUT_REQUEST = env.int("ELASTICSEARCH_TIMEOUT_REQUEST")
 
 SCROLL_SIZE = env.str("SCROLL_SIZE")
 SCROLL_KEEP_ALIVE = env.int("SCROLL_KEEP_ALIVE")
+ELASTIC_PIT_KEEP_ALIVE = env.str("ELASTIC_PIT_KEEP_ALIVE", default="1m")
 
 FLOWS_REST_ENDPOINT = env.str("FLOWS_REST_ENDPOINT")
 
@@ -635,6 +708,29 @@ if USE_EDA:
     EDA_BROKER_PASSWORD = env.str("EDA_BROKER_PASSWORD", default="guest")
     EDA_VIRTUAL_HOST = env.str("EDA_VIRTUAL_HOST", default="/")
     EDA_WAIT_TIME_RETRY = env.int("EDA_WAIT_TIME_RETRY", default=5)
+    EDA_PUBLISH_MAX_RETRIES = env.int("EDA_PUBLISH_MAX_RETRIES", default=3)
+
+    # Store EDA messages in the outbox table and let `manage.py edarelay`
+    # publish them, instead of publishing inside the request.
+    EDA_USE_OUTBOX = env.bool("EDA_USE_OUTBOX", default=False)
+    EDA_OUTBOX_BATCH_SIZE = env.int("EDA_OUTBOX_BATCH_SIZE", default=100)
+    EDA_OUTBOX_POLL_INTERVAL = env.float("EDA_OUTBOX_POLL_INTERVAL", default=1)
+    # Failed publishes of a message before it is dead-lettered and skipped.
+    EDA_OUTBOX_MAX_ATTEMPTS = env.int("EDA_OUTBOX_MAX_ATTEMPTS", default=10)
+
+    # `manage.py edaconsume` handles messages in batches of up to
+    # EDA_CONSUMER_BATCH_SIZE, or whatever arrived within
+    # EDA_CONSUMER_BATCH_WINDOW seconds, on EDA_CONSUMER_WORKERS threads
+    # (0 runs batches on the connection thread).
+    EDA_CONSUMER_PREFETCH_COUNT = env.int("EDA_CONSUMER_PREFETCH_COUNT", default=200)
+    EDA_CONSUMER_BATCH_SIZE = env.int("EDA_CONSUMER_BATCH_SIZE", default=50)
+    EDA_CONSUMER_BATCH_WINDOW = env.float("EDA_CONSUMER_BATCH_WINDOW", default=0.5)
+    EDA_CONSUMER_WORKERS = env.int("EDA_CONSUMER_WORKERS", default=0)
+    EDA_CONSUMER_TICK_INTERVAL = env.float("EDA_CONSUMER_TICK_INTERVAL", default=0.1)
+    # Users and projects named by events are remembered per consumer process
+    # for EDA_IDENTITY_CACHE_TTL seconds (0 disables the cache).
+    EDA_IDENTITY_CACHE_TTL = env.int("EDA_IDENTITY_CACHE_TTL", default=60)
+    EDA_IDENTITY_CACHE_MAXSIZE = env.int("EDA_IDENTITY_CACHE_MAXSIZE", default=5000)
 
 USE_PROJECT_MIGRATION_PUBLISHER = env.bool(
     "USE_PROJECT_MIGRATION_PUBLISHER", default=False
@@ -657,6 +753,17 @@ if USE_EDA or USE_PROJECT_MIGRATION_PUBLISHER:
 
 NEW_ATTENDANCE_DATE = env.str("NEW_ATTENDANCE_DATE", default="2023-09-30")
 
+# Read active contacts and legacy attendances from the ContactDailyRollup
+# table instead of counting raw Contact rows. Invoices always count exactly.
+USE_CONTACT_DAILY_ROLLUP = env.bool("USE_CONTACT_DAILY_ROLLUP", default=False)
+
+# Organization active-contact reports are cached for this many seconds; async
+# report jobs (and their results) are kept for ACTIVE_CONTACTS_REPORT_JOB_TTL.
+ACTIVE_CONTACTS_REPORT_CACHE_TTL = env.int(
+    "ACTIVE_CONTACTS_REPORT_CACHE_TTL", default=600
+)
+ACTIVE_CONTACTS_REPORT_JOB_TTL = env.int("ACTIVE_CONTACTS_REPORT_JOB_TTL", default=3600)
+
 
 ALLOW_CRM_ACCESS = env.bool("ALLOW_CRM_ACCESS", default=True)
 
@@ -680,6 +787,8 @@ RATE_LIMIT_BLOCK_TIME = env.int("RATE_LIMIT_BLOCK_TIME")
 
 PROJECTS_API_TOKEN = env.str("PROJECTS_API_TOKEN", default="")
 PROJECTS_PAGE_SIZE = env.int("PROJECTS_PAGE_SIZE", default=100)
+# Rows fetched per server-side cursor round trip by `?stream=true`.
+PROJECTS_STREAM_CHUNK_SIZE = env.int("PROJECTS_STREAM_CHUNK_SIZE", default=2000)
 
 # Temporary nexus settings
 NEXUS_AB1_ORGANIZATIONS = env.list("NEXUS_AB1_ORGANIZATIONS", default=[])
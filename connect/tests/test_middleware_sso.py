@@ -51,6 +51,78 @@ class WeniOIDCAuthenticationPasswordCacheTestCase(TestCase):
         self.assertEqual(self.keycloak_client.has_password_credential.call_count, 2)
 
 
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "middleware-session-tests",
+        }
+    }
+)
+@patch.object(WeniOIDCAuthentication, "verify_login")
+@patch("connect.middleware.KeycloakCredentialsService")
+@patch("mozilla_django_oidc.contrib.drf.OIDCAuthentication.authenticate")
+class WeniOIDCAuthenticationSessionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user, _ = create_user_and_token("oidc_session_user")
+
+    def authenticate(self, claims):
+        with patch("connect.middleware.jwt.decode", return_value=claims):
+            return WeniOIDCAuthentication().authenticate(self.factory.get("/"))
+
+    def test_side_effects_run_once_per_token(
+        self, mock_super_authenticate, mock_credentials, mock_verify
+    ):
+        mock_super_authenticate.return_value = (self.user, "access-token")
+        claims = {"jti": "token-1", "identity_provider": "google"}
+
+        self.authenticate(claims)
+        self.authenticate(claims)
+
+        mock_credentials.return_value.invalidate.assert_called_once_with(
+            self.user.email
+        )
+        mock_verify.assert_called_once()
+        self.assertEqual(self.user.identity_provider.count(), 1)
+
+    def test_new_token_runs_side_effects_again(
+        self, mock_super_authenticate, mock_credentials, mock_verify
+    ):
+        mock_super_authenticate.return_value = (self.user, "access-token")
+
+        self.authenticate({"jti": "token-1"})
+        self.authenticate({"jti": "token-2"})
+
+        self.assertEqual(mock_credentials.return_value.invalidate.call_count, 2)
+        self.assertEqual(mock_verify.call_count, 2)
+
+    def test_session_identity_provider_is_exposed_on_every_request(
+        self, mock_super_authenticate, _mock_credentials, _mock_verify
+    ):
+        mock_super_authenticate.return_value = (self.user, "access-token")
+        claims = {"jti": "token-1", "identity_provider": "google"}
+        self.authenticate(claims)
+
+        request = self.factory.get("/")
+        with patch("connect.middleware.jwt.decode", return_value=claims):
+            WeniOIDCAuthentication().authenticate(request)
+
+        self.assertEqual(request.session_identity_provider, "google")
+
+    @override_settings(OIDC_SESSION_FINGERPRINT_TTL=0)
+    def test_fingerprint_can_be_disabled(
+        self, mock_super_authenticate, mock_credentials, _mock_verify
+    ):
+        mock_super_authenticate.return_value = (self.user, "access-token")
+
+        self.authenticate({"jti": "token-1"})
+        self.authenticate({"jti": "token-1"})
+
+        self.assertEqual(mock_credentials.return_value.invalidate.call_count, 2)
+
+
 @override_settings(JWT_PUBLIC_KEY="")
 class WeniAuthenticationTestCase(TestCase):
     def setUp(self):
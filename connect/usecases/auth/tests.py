@@ -24,7 +24,7 @@ class GenerateSessionTokenUseCaseTestCase(TestCase):
     @patch(
         "connect.internals.event_driven.producer.rabbitmq_publisher.RabbitmqPublisher.send_message"
     )
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     def setUp(self, mock_get_gateway, mock_permission, mock_publisher):
         mock_get_gateway.return_value = StripeMockGateway()
@@ -0,0 +1,171 @@
+"""Active-contact report for every project of an organization.
+
+Counts are computed for all of the organization's projects together, with a
+single grouped query per counting method (see
+``connect.billing.utils.count_contacts_by_project``), instead of one query per
+project, or one per project per day for attendance plans. Reports are cached
+per ``(organization, after, before)``.
+
+Very large organizations can request the report asynchronously: a job id is
+returned right away, a Celery task builds the report, and the caller polls
+the job until it is done.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, Optional
+
+import pendulum
+from celery import current_app
+from django.conf import settings
+from django.core.cache import cache
+
+from connect.billing.models import BILLING_TIMEZONE
+from connect.billing.utils import count_contacts_by_project
+from connect.common.models import Organization
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_KEY_TEMPLATE = (
+    "organization:{organization_uuid}:active-contacts:{after}:{before}"
+)
+JOB_CACHE_KEY_TEMPLATE = "organization:active-contacts-job:{job_id}"
+
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def build_report_cache_key(organization_uuid, after: str, before: str) -> str:
+    return REPORT_CACHE_KEY_TEMPLATE.format(
+        organization_uuid=str(organization_uuid), after=after, before=before
+    )
+
+
+def build_job_cache_key(job_id: str) -> str:
+    return JOB_CACHE_KEY_TEMPLATE.format(job_id=job_id)
+
+
+def build_running_job_cache_key(organization_uuid, after: str, before: str) -> str:
+    return f"{build_report_cache_key(organization_uuid, after, before)}:job"
+
+
+class ActiveContactsReportUseCase:
+    """Build, cache and schedule organization active-contact reports."""
+
+    def __init__(
+        self,
+        cache_backend=None,
+        ttl: Optional[int] = None,
+        job_ttl: Optional[int] = None,
+    ) -> None:
+        self._cache = cache_backend or cache
+        self._ttl = (
+            ttl
+            if ttl is not None
+            else getattr(settings, "ACTIVE_CONTACTS_REPORT_CACHE_TTL", 600)
+        )
+        self._job_ttl = (
+            job_ttl
+            if job_ttl is not None
+            else getattr(settings, "ACTIVE_CONTACTS_REPORT_JOB_TTL", 3600)
+        )
+
+    @staticmethod
+    def _period(before, after) -> tuple:
+        tz = pendulum.timezone(BILLING_TIMEZONE)
+        return (
+            str(pendulum.parse(str(after)).in_timezone(tz)),
+            str(pendulum.parse(str(before)).in_timezone(tz)),
+        )
+
+    def execute(self, organization: Organization, before, after) -> Dict[str, Any]:
+        after, before = self._period(before, after)
+        cache_key = build_report_cache_key(organization.uuid, after, before)
+
+        report = self._cache.get(cache_key)
+        if report is None:
+            report = self._build_report(organization, after, before)
+            self._cache.set(cache_key, report, self._ttl)
+        return report
+
+    def _build_report(
+        self, organization: Organization, after: str, before: str
+    ) -> Dict[str, Any]:
+        projects = list(
+            organization.project.values("pk", "uuid", "name", "flow_organization")
+        )
+        counts = count_contacts_by_project(
+            [project["pk"] for project in projects],
+            after,
+            before,
+            counting_method=organization.organization_billing.plan_method,
+        )
+        return {
+            "projects": [
+                {
+                    "uuid": str(project["uuid"]),
+                    "name": project["name"],
+                    "flow_organization": (
+                        str(project["flow_organization"])
+                        if project["flow_organization"]
+                        else None
+                    ),
+                    "active_contacts": counts.get(project["pk"], 0),
+                }
+                for project in projects
+            ]
+        }
+
+    def start_job(self, organization: Organization, before, after) -> str:
+        """Schedule the report and return the id of the job to poll.
+
+        Requests for a report that is still being built share its job.
+        """
+        after, before = self._period(before, after)
+        pointer_key = build_running_job_cache_key(organization.uuid, after, before)
+        job_id = str(uuid.uuid4())
+
+        if not self._cache.add(pointer_key, job_id, self._job_ttl):
+            running = self._cache.get(pointer_key)
+            if running and self.get_job(running, organization.uuid) is not None:
+                return running
+            self._cache.set(pointer_key, job_id, self._job_ttl)
+
+        self._cache.set(
+            build_job_cache_key(job_id),
+            {"status": JOB_PENDING, "organization_uuid": str(organization.uuid)},
+            self._job_ttl,
+        )
+        current_app.send_task(
+            "generate_active_contacts_report",
+            args=[job_id, str(organization.uuid), before, after],
+        )
+        return job_id
+
+    def run_job(self, job_id: str, organization_uuid: str, before, after) -> None:
+        after, before = self._period(before, after)
+        pointer_key = build_running_job_cache_key(organization_uuid, after, before)
+        job = {"status": JOB_FAILED, "organization_uuid": str(organization_uuid)}
+        try:
+            organization = Organization.objects.select_related(
+                "organization_billing"
+            ).get(uuid=organization_uuid)
+            report = self.execute(organization, before, after)
+            job.update(status=JOB_DONE, result=report)
+        except Exception:
+            logger.exception("active contacts report failed", extra={"job_id": job_id})
+            raise
+        finally:
+            self._cache.set(build_job_cache_key(job_id), job, self._job_ttl)
+            # Later requests start a new job, or read the cached report.
+            self._cache.delete(pointer_key)
+
+    def get_job(self, job_id: str, organization_uuid) -> Optional[Dict[str, Any]]:
+        """Return ``{"status": ..., "result": ...}`` of one of the organization's
+        jobs, or None if unknown or started for another organization.
+        """
+        job = self._cache.get(build_job_cache_key(job_id))
+        if job is None or job.get("organization_uuid") != str(organization_uuid):
+            return None
+        return job
@@ -131,6 +131,27 @@ class EvaluateOrganizationSSOAccessUseCase:
 
         return OrganizationSSOAccessResult.compliant()
 
+    def evaluate_many(
+        self, queryset: QuerySet, user, session_identity_provider: Optional[str]
+    ) -> Dict[int, OrganizationSSOAccessResult]:
+        """Evaluate every SSO-enforcing organization in ``queryset`` at once.
+
+        Configs are fetched with the organizations in a single query and the
+        credential lookup is shared through the per-email memo, so a page costs
+        the same number of queries and Keycloak calls as one organization.
+        Organizations without an enabled policy are left out of the result,
+        which callers read as compliant.
+        """
+        enforcing = queryset.filter(sso_config__is_enabled=True).select_related(
+            "sso_config"
+        )
+        return {
+            organization.pk: self.evaluate(
+                organization, user, session_identity_provider
+            )
+            for organization in enforcing
+        }
+
     def _get_password_block_reason(
         self, email: str
     ) -> Optional[OrganizationSSOAccessDisabledReason]:
@@ -168,17 +189,15 @@ class ExcludeNonCompliantOrganizationProjectsUseCase:
         if not organization_pks:
             return queryset
 
-        enforcing_orgs = Organization.objects.filter(
-            pk__in=organization_pks,
-            sso_config__is_enabled=True,
-        ).select_related("sso_config")
-
+        results = self.evaluate_usecase.evaluate_many(
+            Organization.objects.filter(pk__in=organization_pks),
+            user,
+            session_identity_provider,
+        )
         blocked_pks = [
-            organization.pk
-            for organization in enforcing_orgs
-            if not self.evaluate_usecase.execute(
-                organization, user, session_identity_provider
-            )
+            organization_pk
+            for organization_pk, result in results.items()
+            if not result.is_compliant
         ]
         if not blocked_pks:
             return queryset
@@ -203,15 +222,23 @@ class BuildOrganizationSSOAccessMapUseCase:
     def execute(
         self, queryset: QuerySet, user, session_identity_provider: Optional[str]
     ) -> Dict[int, OrganizationSSOAccessResult]:
-        enforcing = queryset.filter(sso_config__is_enabled=True).select_related(
-            "sso_config"
+        return self.evaluate_usecase.evaluate_many(
+            queryset, user, session_identity_provider
         )
-        return {
-            organization.pk: self.evaluate_usecase.evaluate(
-                organization, user, session_identity_provider
-            )
-            for organization in enforcing
-        }
+
+
+def get_request_sso_access_usecase(request) -> EvaluateOrganizationSSOAccessUseCase:
+    """Return the evaluator shared by everything handling ``request``.
+
+    Permission checks and serializer context builders reuse it, so the user's
+    Keycloak password-credential state is resolved at most once per request.
+    """
+    underlying = getattr(request, "_request", request)
+    usecase = getattr(underlying, "_sso_access_usecase", None)
+    if usecase is None:
+        usecase = EvaluateOrganizationSSOAccessUseCase()
+        underlying._sso_access_usecase = usecase
+    return usecase
 
 
 def enrich_serializer_context_with_sso_access(view, context: dict) -> dict:
@@ -228,7 +255,9 @@ def enrich_serializer_context_with_sso_access(view, context: dict) -> dict:
     else:
         queryset = view.get_queryset()
 
-    context["sso_access_results"] = BuildOrganizationSSOAccessMapUseCase().execute(
+    context["sso_access_results"] = BuildOrganizationSSOAccessMapUseCase(
+        evaluate_usecase=get_request_sso_access_usecase(view.request)
+    ).execute(
         queryset,
         view.request.user,
         getattr(view.request, "session_identity_provider", None),
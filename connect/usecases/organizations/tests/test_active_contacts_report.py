@@ -0,0 +1,122 @@
+import uuid
+from unittest.mock import patch
+
+import pendulum
+from django.core.cache import cache
+from django.test import TestCase
+
+from connect.billing.models import Contact
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization
+from connect.usecases.organizations.active_contacts_report import (
+    JOB_DONE,
+    ActiveContactsReportUseCase,
+)
+
+
+class ActiveContactsReportUseCaseTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization = Organization.objects.create(
+            name="Report organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        billing = self.organization.organization_billing
+        billing.plan_method = BillingPlan.ACTIVE_CONTACTS
+        billing.save(update_fields=["plan_method"])
+        self.projects = [
+            self.organization.project.create(
+                name=f"Report project {index}",
+                timezone="America/Sao_Paulo",
+                flow_organization=uuid.uuid4(),
+            )
+            for index in range(5)
+        ]
+        seen_on = pendulum.parse("2023-03-10T12:00:00+00:00")
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    contact_flow_uuid=uuid.uuid4(),
+                    last_seen_on=seen_on,
+                    project=project,
+                )
+                for index, project in enumerate(self.projects)
+                for _ in range(index)
+            ]
+        )
+        self.before = pendulum.parse("2023-03-31").end_of("day")
+        self.after = pendulum.parse("2023-03-01").start_of("day")
+        cache.clear()
+        self.use_case = ActiveContactsReportUseCase()
+
+    def tearDown(self):
+        cache.clear()
+
+    def expected_counts(self):
+        return {str(project.uuid): index for index, project in enumerate(self.projects)}
+
+    def test_report_counts_every_project_with_constant_queries(self):
+        # Projects, then one grouped count, whatever the number of projects.
+        with self.assertNumQueries(2):
+            report = self.use_case.execute(
+                self.organization, before=self.before, after=self.after
+            )
+
+        self.assertEqual(
+            {
+                project["uuid"]: project["active_contacts"]
+                for project in report["projects"]
+            },
+            self.expected_counts(),
+        )
+
+    def test_report_is_cached_per_period(self):
+        report = self.use_case.execute(
+            self.organization, before=self.before, after=self.after
+        )
+
+        with self.assertNumQueries(0):
+            cached = self.use_case.execute(
+                self.organization, before=self.before, after=self.after
+            )
+        self.assertEqual(cached, report)
+
+        other_period = self.use_case.execute(
+            self.organization,
+            before=self.before,
+            after=pendulum.parse("2023-03-20").start_of("day"),
+        )
+        self.assertEqual(
+            sum(project["active_contacts"] for project in other_period["projects"]),
+            0,
+        )
+
+    def test_async_job_returns_report_when_done(self):
+        job_id = self.use_case.start_job(
+            self.organization, before=self.before, after=self.after
+        )
+
+        job = self.use_case.get_job(job_id, self.organization.uuid)
+        self.assertEqual(job["status"], JOB_DONE)
+        self.assertEqual(
+            {
+                project["uuid"]: project["active_contacts"]
+                for project in job["result"]["projects"]
+            },
+            self.expected_counts(),
+        )
+
+    def test_unknown_job(self):
+        self.assertIsNone(
+            self.use_case.get_job(str(uuid.uuid4()), self.organization.uuid)
+        )
+
+    def test_job_is_not_found_for_another_organization(self):
+        job_id = self.use_case.start_job(
+            self.organization, before=self.before, after=self.after
+        )
+
+        self.assertIsNone(self.use_case.get_job(job_id, uuid.uuid4()))
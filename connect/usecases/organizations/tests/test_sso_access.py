@@ -18,6 +18,7 @@ from connect.usecases.organizations.sso_access import (
     ExcludeNonCompliantOrganizationProjectsUseCase,
     OrganizationSSOAccessDisabledReason,
     enrich_serializer_context_with_sso_access,
+    get_request_sso_access_usecase,
     is_sso_internal_bypass_email,
     resolve_sso_provider,
 )
@@ -274,6 +275,26 @@ class BuildOrganizationSSOAccessMapUseCaseTestCase(TestCase):
         self.build_map(None)
         self.assertEqual(self.credentials_service.calls, [])
 
+    def test_evaluates_a_page_in_one_query_and_one_credential_lookup(self):
+        for index in range(5):
+            organization = create_organization(f"Enforcing Org {index}")
+            OrganizationSSOConfig.objects.create(
+                organization=organization, is_enabled=True
+            )
+        credentials_service = FakeCredentialsService(has_password=False)
+        usecase = EvaluateOrganizationSSOAccessUseCase(
+            credentials_service=credentials_service
+        )
+
+        with self.assertNumQueries(1):
+            results = usecase.evaluate_many(
+                Organization.objects.all(), self.user, "google"
+            )
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result.is_compliant for result in results.values()))
+        self.assertEqual(len(credentials_service.calls), 1)
+
 
 @override_settings(USE_EDA_PERMISSIONS=False)
 class ExcludeNonCompliantOrganizationProjectsUseCaseTestCase(TestCase):
@@ -361,3 +382,11 @@ class EnrichSerializerContextWithSSOAccessTestCase(TestCase):
             result.disabled_reason,
             OrganizationSSOAccessDisabledReason.SSO_SESSION_REQUIRED.value,
         )
+
+    def test_reuses_the_request_evaluator(self):
+        request = type("Request", (), {"user": self.user})()
+
+        self.assertIs(
+            get_request_sso_access_usecase(request),
+            get_request_sso_access_usecase(request),
+        )
@@ -5,13 +5,22 @@ that need to know, with high frequency, whether a project is on trial. The
 result is cached in Redis to avoid hitting the database on every request and
 proactively invalidated by signals whenever the underlying BillingPlan or
 Organization changes.
+
+A small in-process LRU (L1) sits in front of Redis for a few seconds, so
+sweeps that ask for the same projects repeatedly skip the network round trip.
+Invalidation drops both layers in the current process; other processes may
+serve an L1 entry until its short TTL expires.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
 
 from django.conf import settings
 from django.core.cache import cache
+from prometheus_client import Counter
 
 from connect.common.models import BillingPlan, Project
 from connect.usecases.project.exceptions import ProjectNotFoundError
@@ -20,6 +29,58 @@ logger = logging.getLogger(__name__)
 
 CACHE_KEY_TEMPLATE = "project:plan-status:{project_uuid}"
 
+PLAN_STATUS_LOOKUPS = Counter(
+    "connect_plan_status_lookups_total",
+    "Project plan-status lookups by the layer that answered (l1, cache, db).",
+    ["layer"],
+)
+
+
+class LocalLRUCache:
+    """Thread-safe, size-bounded in-process cache with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalLRUCache(
+    maxsize=getattr(settings, "PLAN_STATUS_L1_MAXSIZE", 10000),
+    ttl=getattr(settings, "PLAN_STATUS_L1_TTL", 5),
+)
+
 
 def build_cache_key(project_uuid: str) -> str:
     """Return the canonical cache key for a project's plan status."""
@@ -44,82 +105,138 @@ def _empty_payload(project_uuid, organization_uuid=None) -> Dict[str, Any]:
 class GetProjectPlanStatusUseCase:
     """Return the billing plan status payload for a given project."""
 
-    def __init__(self, cache_backend=None, ttl: Optional[int] = None) -> None:
+    def __init__(
+        self, cache_backend=None, ttl: Optional[int] = None, l1_cache=None
+    ) -> None:
         self._cache = cache_backend or cache
         self._ttl = ttl if ttl is not None else getattr(
             settings, "PLAN_STATUS_CACHE_TTL", 900
         )
+        self._l1 = l1_cache or local_cache
 
     def execute(self, project_uuid: str) -> Dict[str, Any]:
         cache_key = build_cache_key(project_uuid)
 
+        local = self._l1.get(cache_key)
+        if local is not None:
+            PLAN_STATUS_LOOKUPS.labels(layer="l1").inc()
+            return local
+
         cached = self._cache.get(cache_key)
         if cached is not None:
+            PLAN_STATUS_LOOKUPS.labels(layer="cache").inc()
             logger.debug(
                 "plan-status cache hit", extra={"project_uuid": str(project_uuid)}
             )
+            self._l1.set(cache_key, cached)
             return cached
 
+        PLAN_STATUS_LOOKUPS.labels(layer="db").inc()
         payload = self._build_payload(project_uuid)
         self._cache.set(cache_key, payload, self._ttl)
+        self._l1.set(cache_key, payload)
         logger.debug(
             "plan-status cache miss; payload cached",
             extra={"project_uuid": str(project_uuid), "ttl": self._ttl},
         )
         return payload
 
+    def execute_many(self, project_uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return ``{project_uuid: payload}`` for every existing project.
+
+        L1 is checked first, then Redis with a single ``get_many``; the rest is
+        resolved with one grouped query and written back with ``set_many``.
+        Unknown projects are left out of the result.
+        """
+        keys = {
+            str(project_uuid): build_cache_key(project_uuid)
+            for project_uuid in project_uuids
+        }
+        payloads = {}
+
+        for project_uuid, cache_key in keys.items():
+            local = self._l1.get(cache_key)
+            if local is not None:
+                payloads[project_uuid] = local
+        PLAN_STATUS_LOOKUPS.labels(layer="l1").inc(len(payloads))
+
+        pending = [
+            cache_key
+            for project_uuid, cache_key in keys.items()
+            if project_uuid not in payloads
+        ]
+        cached = self._cache.get_many(pending) if pending else {}
+        for project_uuid, cache_key in keys.items():
+            if cache_key in cached:
+                payloads[project_uuid] = cached[cache_key]
+                self._l1.set(cache_key, cached[cache_key])
+        PLAN_STATUS_LOOKUPS.labels(layer="cache").inc(len(cached))
+
+        missing = [uuid for uuid in keys if uuid not in payloads]
+        if missing:
+            PLAN_STATUS_LOOKUPS.labels(layer="db").inc(len(missing))
+            built = self._build_payloads(missing)
+            self._cache.set_many(
+                {keys[uuid]: payload for uuid, payload in built.items()}, self._ttl
+            )
+            for project_uuid, payload in built.items():
+                self._l1.set(keys[project_uuid], payload)
+            payloads.update(built)
+
+        return payloads
+
     def _build_payload(self, project_uuid: str) -> Dict[str, Any]:
-        # Fetch only the raw columns we need with a single SQL query.
+        payload = self._build_payloads([project_uuid])
+        if not payload:
+            raise ProjectNotFoundError()
+        return next(iter(payload.values()))
+
+    def _build_payloads(self, project_uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+        # Fetch only the raw columns we need, for every project in one query.
         # `.values()` skips Project/Organization/BillingPlan model instantiation
         # (and their signals/FieldTracker overhead), which keeps cache misses
-        # cheap on this hot path.
-        row = (
-            BillingPlan.objects.filter(
-                organization__project__uuid=project_uuid
-            )
-            .values(
-                "plan",
-                "is_active",
-                "organization__uuid",
-                "organization__is_suspended",
-            )
-            .first()
+        # cheap on this hot path. The LEFT JOIN leaves the BillingPlan columns
+        # null when the organization has no plan.
+        rows = Project.objects.filter(uuid__in=project_uuids).values(
+            "uuid",
+            "organization__uuid",
+            "organization__is_suspended",
+            "organization__organization_billing",
+            "organization__organization_billing__plan",
+            "organization__organization_billing__is_active",
         )
 
-        if row is None:
-            # No BillingPlan attached: confirm the project itself exists so we
-            # can return a 404 instead of a misleading "no plan" payload.
-            project = (
-                Project.objects.filter(uuid=project_uuid)
-                .values("organization__uuid")
-                .first()
-            )
-            if project is None:
-                raise ProjectNotFoundError()
-            return _empty_payload(
-                project_uuid=project_uuid,
-                organization_uuid=project["organization__uuid"],
-            )
-
-        plan = row["plan"]
-        is_active = bool(row["is_active"])
-        is_suspended = bool(row["organization__is_suspended"])
-        is_trial = plan == BillingPlan.PLAN_TRIAL
-
-        return {
-            "project_uuid": str(project_uuid),
-            "organization_uuid": str(row["organization__uuid"]),
-            "plan": plan,
-            "is_trial": is_trial,
-            "is_trial_active": is_trial and is_active and not is_suspended,
-            "is_active": is_active,
-            "is_suspended": is_suspended,
-        }
+        payloads = {}
+        for row in rows:
+            project_uuid = str(row["uuid"])
+            if row["organization__organization_billing"] is None:
+                payloads[project_uuid] = _empty_payload(
+                    project_uuid=project_uuid,
+                    organization_uuid=row["organization__uuid"],
+                )
+                continue
+
+            plan = row["organization__organization_billing__plan"]
+            is_active = bool(row["organization__organization_billing__is_active"])
+            is_suspended = bool(row["organization__is_suspended"])
+            is_trial = plan == BillingPlan.PLAN_TRIAL
+            payloads[project_uuid] = {
+                "project_uuid": project_uuid,
+                "organization_uuid": str(row["organization__uuid"]),
+                "plan": plan,
+                "is_trial": is_trial,
+                "is_trial_active": is_trial and is_active and not is_suspended,
+                "is_active": is_active,
+                "is_suspended": is_suspended,
+            }
+        return payloads
 
 
 def invalidate_project_plan_status(project_uuid) -> None:
     """Drop the cached plan status for a single project."""
-    cache.delete(build_cache_key(project_uuid))
+    cache_key = build_cache_key(project_uuid)
+    local_cache.delete_many([cache_key])
+    cache.delete(cache_key)
 
 
 def invalidate_organization_plan_status(organization) -> None:
@@ -129,6 +246,6 @@ def invalidate_organization_plan_status(organization) -> None:
     )
     if not project_uuids:
         return
-    cache.delete_many(
-        [build_cache_key(project_uuid) for project_uuid in project_uuids]
-    )
+    cache_keys = [build_cache_key(project_uuid) for project_uuid in project_uuids]
+    local_cache.delete_many(cache_keys)
+    cache.delete_many(cache_keys)
@@ -0,0 +1,168 @@
+"""Use case for mapping Flows organizations back to Connect projects.
+
+The gRPC services receive a ``flow_organization`` (or a project uuid) on every
+call and need the matching project and organization. The mappings rarely
+change, so they are resolved in bulk with a single query and kept in the
+cache for a short TTL. Signals drop them when a project or organization is
+saved or deleted.
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from connect.common.models import Project
+from connect.usecases.project.exceptions import ProjectNotFoundError
+
+FLOW_ORGANIZATION_KEY_TEMPLATE = "project:flow-organization:{flow_organization}"
+PROJECT_KEY_TEMPLATE = "project:flow-mapping:{project_uuid}"
+
+MAPPING_FIELDS = (
+    "uuid",
+    "flow_organization",
+    "organization__uuid",
+    "organization__name",
+    "organization__description",
+    "organization__inteligence_organization",
+    "organization__extra_integration",
+    "organization__is_suspended",
+)
+
+LOOKUPS = {
+    "flow_organization": "flow_organization__in",
+    "project_uuid": "uuid__in",
+}
+
+
+def normalize_uuid(value) -> Optional[str]:
+    """Return the canonical string of a uuid, or None if it is not one."""
+    try:
+        return str(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def build_flow_organization_key(flow_organization) -> str:
+    return FLOW_ORGANIZATION_KEY_TEMPLATE.format(
+        flow_organization=str(flow_organization)
+    )
+
+
+def build_project_key(project_uuid) -> str:
+    return PROJECT_KEY_TEMPLATE.format(project_uuid=str(project_uuid))
+
+
+def _build_mapping(row: Dict[str, Any]) -> Dict[str, Any]:
+    flow_organization = row["flow_organization"]
+    return {
+        "project_uuid": str(row["uuid"]),
+        "flow_organization": str(flow_organization) if flow_organization else None,
+        "organization": {
+            "uuid": str(row["organization__uuid"]),
+            "name": row["organization__name"],
+            "description": row["organization__description"],
+            "inteligence_organization": row["organization__inteligence_organization"],
+            "extra_integration": row["organization__extra_integration"],
+            "is_suspended": row["organization__is_suspended"],
+        },
+    }
+
+
+class ResolveFlowOrganizationsUseCase:
+    """Resolve ``flow_organization``/project uuid to project and organization."""
+
+    def __init__(self, cache_backend=None, ttl: Optional[int] = None) -> None:
+        self._cache = cache_backend or cache
+        self._ttl = (
+            ttl
+            if ttl is not None
+            else getattr(settings, "FLOW_ORGANIZATION_MAPPING_CACHE_TTL", 300)
+        )
+
+    def execute(self, flow_organization) -> Dict[str, Any]:
+        mapping = self.execute_many([flow_organization]).get(
+            normalize_uuid(flow_organization)
+        )
+        if mapping is None:
+            raise ProjectNotFoundError()
+        return mapping
+
+    def execute_for_project(self, project_uuid) -> Dict[str, Any]:
+        mapping = self.execute_many_for_projects([project_uuid]).get(
+            normalize_uuid(project_uuid)
+        )
+        if mapping is None:
+            raise ProjectNotFoundError()
+        return mapping
+
+    def execute_many(self, flow_organizations: Iterable) -> Dict[str, Dict[str, Any]]:
+        """Return ``{flow_organization: mapping}`` keyed by canonical uuid.
+
+        Unknown values, and values that are not uuids, are left out.
+        """
+        return self._resolve(
+            flow_organizations, build_flow_organization_key, "flow_organization"
+        )
+
+    def execute_many_for_projects(
+        self, project_uuids: Iterable
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return ``{project_uuid: mapping}`` keyed by canonical uuid.
+
+        Unknown projects, and values that are not uuids, are left out.
+        """
+        return self._resolve(project_uuids, build_project_key, "project_uuid")
+
+    def _resolve(self, values: Iterable, build_key, mapping_field: str) -> dict:
+        normalized = {normalize_uuid(value) for value in values}
+        keys = {value: build_key(value) for value in normalized if value is not None}
+        if not keys:
+            return {}
+
+        cached = self._cache.get_many(list(keys.values()))
+        mappings = {
+            value: cached[cache_key]
+            for value, cache_key in keys.items()
+            if cache_key in cached
+        }
+
+        missing = [value for value in keys if value not in mappings]
+        if missing:
+            lookup = LOOKUPS[mapping_field]
+            rows = Project.objects.filter(**{lookup: missing}).values(*MAPPING_FIELDS)
+            built = {}
+            for row in rows:
+                mapping = _build_mapping(row)
+                # Cache under both keys so either kind of lookup hits next time.
+                if mapping["flow_organization"]:
+                    flow_key = build_flow_organization_key(mapping["flow_organization"])
+                    built[flow_key] = mapping
+                built[build_project_key(mapping["project_uuid"])] = mapping
+                mappings[mapping[mapping_field]] = mapping
+            if built:
+                self._cache.set_many(built, self._ttl)
+
+        return mappings
+
+
+def invalidate_project_flow_mapping(project) -> None:
+    """Drop the cached mappings of a single project."""
+    cache_keys = [build_project_key(project.uuid)]
+    if project.flow_organization:
+        cache_keys.append(build_flow_organization_key(project.flow_organization))
+    cache.delete_many(cache_keys)
+
+
+def invalidate_organization_flow_mappings(organization) -> None:
+    """Drop the cached mappings of every project of an organization."""
+    cache_keys = []
+    for project_uuid, flow_organization in organization.project.values_list(
+        "uuid", "flow_organization"
+    ):
+        cache_keys.append(build_project_key(project_uuid))
+        if flow_organization:
+            cache_keys.append(build_flow_organization_key(flow_organization))
+    if cache_keys:
+        cache.delete_many(cache_keys)
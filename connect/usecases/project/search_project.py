@@ -0,0 +1,110 @@
+"""Use case for searching a project's flows and intelligences.
+
+The Flows and Intelligence modules are queried concurrently under a shared
+deadline, so the request takes as long as the slowest backend (capped at the
+deadline) instead of the sum of both. A backend that fails or misses the
+deadline contributes ``None`` and the other result is still returned.
+
+Complete results are cached per ``(project, text)`` for a short TTL, so the
+keystrokes of a typeahead do not hit both modules every time. Partial
+results are not cached, and the next request retries the missing backend.
+"""
+
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from connect.api.v1.internal.flows.flows_rest_client import FlowsRESTClient
+from connect.api.v1.internal.intelligence.intelligence_rest_client import (
+    IntelligenceRESTClient,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_TEMPLATE = "project:search:{project_uuid}:{text_hash}"
+
+
+def build_cache_key(project_uuid, text: str) -> str:
+    text_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return CACHE_KEY_TEMPLATE.format(
+        project_uuid=str(project_uuid), text_hash=text_hash
+    )
+
+
+class SearchProjectUseCase:
+    """Search flows and intelligences of a project concurrently."""
+
+    def __init__(
+        self,
+        flows_client=None,
+        intelligence_client=None,
+        cache_backend=None,
+        ttl: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self._flows_client = flows_client or FlowsRESTClient()
+        self._intelligence_client = intelligence_client or IntelligenceRESTClient()
+        self._cache = cache_backend or cache
+        self._ttl = (
+            ttl
+            if ttl is not None
+            else getattr(settings, "PROJECT_SEARCH_CACHE_TTL", 30)
+        )
+        self._timeout = (
+            timeout
+            if timeout is not None
+            else getattr(settings, "PROJECT_SEARCH_TIMEOUT", 5)
+        )
+
+    def execute(self, project, text: str) -> Dict[str, Any]:
+        text = text or ""
+        cache_key = build_cache_key(project.uuid, text)
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return result
+
+        deadline = time.monotonic() + self._timeout
+        searches = {
+            "flow": (
+                self._flows_client.get_project_flows,
+                dict(project_uuid=project.uuid, flow_name=text),
+            ),
+            "intelligence": (
+                self._intelligence_client.get_organization_intelligences,
+                dict(
+                    intelligence_name=text,
+                    organization_id=project.organization.inteligence_organization,
+                ),
+            ),
+        }
+
+        executor = ThreadPoolExecutor(max_workers=len(searches))
+        try:
+            futures = {
+                executor.submit(search, timeout=self._timeout, **kwargs): name
+                for name, (search, kwargs) in searches.items()
+            }
+            done, _ = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        finally:
+            # Never block on a late backend; its HTTP timeout ends the thread.
+            executor.shutdown(wait=False)
+
+        result = {}
+        for future, name in futures.items():
+            result[name] = None
+            if future not in done:
+                logger.warning(f"Project search in {name} timed out: {project.uuid}")
+                continue
+            try:
+                result[name] = future.result()
+            except Exception as error:
+                logger.error(f"Project search in {name} failed: {error}")
+
+        if all(value is not None for value in result.values()):
+            self._cache.set(cache_key, result, self._ttl)
+        return result
@@ -16,7 +16,7 @@ from connect.usecases.project.get_project_detail import GetProjectDetailUseCase
 
 
 class GetProjectDetailUseCaseTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
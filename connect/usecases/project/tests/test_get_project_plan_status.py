@@ -18,12 +18,13 @@ from connect.usecases.project.get_project_plan_status import (
     build_cache_key,
     invalidate_organization_plan_status,
     invalidate_project_plan_status,
+    local_cache,
 )
 
 
 @override_settings(PLAN_STATUS_CACHE_TTL=60)
 class GetProjectPlanStatusUseCaseTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -56,6 +57,7 @@ class GetProjectPlanStatusUseCaseTestCase(TestCase):
         )
 
         cache.clear()
+        local_cache.clear()
         self.use_case = GetProjectPlanStatusUseCase()
 
     def tearDown(self):
@@ -145,3 +147,46 @@ class GetProjectPlanStatusUseCaseTestCase(TestCase):
         self.org.save(update_fields=["is_suspended"])
 
         self.assertIsNone(cache.get(build_cache_key(self.project.uuid)))
+
+    def test_execute_many_matches_execute(self):
+        unknown = str(uuid.uuid4())
+
+        with self.assertNumQueries(1):
+            payloads = self.use_case.execute_many([str(self.project.uuid), unknown])
+
+        self.assertNotIn(unknown, payloads)
+        local_cache.clear()
+        cache.clear()
+        self.assertEqual(
+            payloads[str(self.project.uuid)],
+            self.use_case.execute(project_uuid=str(self.project.uuid)),
+        )
+
+    def test_execute_many_fills_and_reads_the_cache(self):
+        self.use_case.execute_many([str(self.project.uuid)])
+        self.assertIsNotNone(cache.get(build_cache_key(self.project.uuid)))
+        local_cache.clear()
+
+        with self.assertNumQueries(0):
+            payloads = self.use_case.execute_many([str(self.project.uuid)])
+
+        self.assertEqual(
+            payloads[str(self.project.uuid)]["plan"], BillingPlan.PLAN_TRIAL
+        )
+
+    def test_local_cache_answers_before_redis(self):
+        self.use_case.execute(project_uuid=str(self.project.uuid))
+
+        with patch.object(cache, "get") as cache_get:
+            self.use_case.execute(project_uuid=str(self.project.uuid))
+
+        cache_get.assert_not_called()
+
+    def test_invalidation_drops_the_local_cache(self):
+        self.use_case.execute(project_uuid=str(self.project.uuid))
+
+        self.org.is_suspended = True
+        self.org.save(update_fields=["is_suspended"])
+
+        result = self.use_case.execute(project_uuid=str(self.project.uuid))
+        self.assertTrue(result["is_suspended"])
@@ -20,7 +20,7 @@ from connect.usecases.project.list_authorized_projects import (
 
 @override_settings(USE_EDA_PERMISSIONS=False)
 class ListAuthorizedProjectsUseCaseTestCase(TestCase):
-    @patch("connect.common.signals.update_user_permission_project")
+    @patch("connect.common.signals.update_project_permissions")
     @patch("connect.billing.get_gateway")
     @patch(
         "connect.api.v1.internal.flows.flows_rest_client.FlowsRESTClient.update_user_permission_project"
@@ -0,0 +1,102 @@
+import uuid
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project
+from connect.usecases.project.exceptions import ProjectNotFoundError
+from connect.usecases.project.resolve_flow_organizations import (
+    ResolveFlowOrganizationsUseCase,
+)
+
+
+class ResolveFlowOrganizationsUseCaseTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        self.organization = Organization.objects.create(
+            name="Mapping Org",
+            description="Org for flow mapping tests",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.projects = [
+            Project.objects.create(
+                name=f"Mapping Project {index}",
+                flow_organization=uuid.uuid4(),
+                organization=self.organization,
+            )
+            for index in range(3)
+        ]
+        cache.clear()
+        self.use_case = ResolveFlowOrganizationsUseCase()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_execute_many_resolves_in_one_query_then_from_cache(self):
+        flow_organizations = [
+            str(project.flow_organization) for project in self.projects
+        ]
+
+        with self.assertNumQueries(1):
+            mappings = self.use_case.execute_many(flow_organizations + ["missing"])
+        with self.assertNumQueries(0):
+            cached = self.use_case.execute_many(flow_organizations)
+
+        self.assertEqual(set(mappings), set(flow_organizations))
+        self.assertEqual(cached, mappings)
+        mapping = mappings[flow_organizations[0]]
+        self.assertEqual(mapping["project_uuid"], str(self.projects[0].uuid))
+        self.assertEqual(mapping["organization"]["uuid"], str(self.organization.uuid))
+        self.assertEqual(mapping["organization"]["name"], "Mapping Org")
+
+    def test_project_lookup_shares_the_cached_mapping(self):
+        project = self.projects[0]
+        self.use_case.execute(project.flow_organization)
+
+        with self.assertNumQueries(0):
+            mapping = self.use_case.execute_for_project(project.uuid)
+
+        self.assertEqual(mapping["flow_organization"], str(project.flow_organization))
+
+    def test_lookups_accept_any_uuid_spelling(self):
+        project = self.projects[0]
+        upper = str(project.flow_organization).upper()
+
+        mapping = self.use_case.execute(upper)
+        mappings = self.use_case.execute_many([upper, "not-a-uuid"])
+
+        self.assertEqual(mapping["project_uuid"], str(project.uuid))
+        self.assertEqual(list(mappings), [str(project.flow_organization)])
+
+    def test_invalid_uuid_raises_not_found(self):
+        with self.assertNumQueries(0):
+            with self.assertRaises(ProjectNotFoundError):
+                self.use_case.execute("missing")
+
+    def test_unknown_flow_organization_raises(self):
+        with self.assertRaises(ProjectNotFoundError):
+            self.use_case.execute(uuid.uuid4())
+
+    def test_organization_change_invalidates_mapping(self):
+        project = self.projects[0]
+        self.use_case.execute(project.flow_organization)
+
+        self.organization.name = "Renamed Org"
+        self.organization.save(update_fields=["name"])
+
+        mapping = self.use_case.execute(project.flow_organization)
+        self.assertEqual(mapping["organization"]["name"], "Renamed Org")
+
+    def test_project_delete_invalidates_mapping(self):
+        project = self.projects[0]
+        self.use_case.execute(project.flow_organization)
+
+        project.delete()
+
+        with self.assertRaises(ProjectNotFoundError):
+            self.use_case.execute(project.flow_organization)
@@ -0,0 +1,89 @@
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project
+from connect.usecases.project.search_project import SearchProjectUseCase
+
+FLOWS_RESULT = {"count": 1, "next": None, "previous": None, "results": []}
+INTELLIGENCE_RESULT = {"count": 0, "next": None, "previous": None, "results": []}
+
+
+class SearchProjectUseCaseTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        organization = Organization.objects.create(
+            name="Search Org",
+            description="Org for project search tests",
+            inteligence_organization=7,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.project = Project.objects.create(
+            name="Search Project",
+            flow_organization=uuid.uuid4(),
+            organization=organization,
+        )
+        self.flows_client = MagicMock()
+        self.flows_client.get_project_flows.return_value = FLOWS_RESULT
+        self.intelligence_client = MagicMock()
+        self.intelligence_client.get_organization_intelligences.return_value = (
+            INTELLIGENCE_RESULT
+        )
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def build_use_case(self, **kwargs):
+        return SearchProjectUseCase(
+            flows_client=self.flows_client,
+            intelligence_client=self.intelligence_client,
+            **kwargs,
+        )
+
+    def test_searches_both_backends_and_caches_the_result(self):
+        use_case = self.build_use_case(timeout=2)
+
+        result = use_case.execute(self.project, "welcome")
+        cached = use_case.execute(self.project, "welcome")
+
+        self.assertEqual(
+            result, {"flow": FLOWS_RESULT, "intelligence": INTELLIGENCE_RESULT}
+        )
+        self.assertEqual(cached, result)
+        self.flows_client.get_project_flows.assert_called_once_with(
+            project_uuid=self.project.uuid, flow_name="welcome", timeout=2
+        )
+        self.intelligence_client.get_organization_intelligences.assert_called_once_with(
+            intelligence_name="welcome", organization_id=7, timeout=2
+        )
+
+    def test_returns_partial_result_when_a_backend_misses_the_deadline(self):
+        release = threading.Event()
+        self.intelligence_client.get_organization_intelligences.side_effect = (
+            lambda **kwargs: release.wait(5)
+        )
+        use_case = self.build_use_case(timeout=0.2)
+
+        try:
+            result = use_case.execute(self.project, "slow")
+        finally:
+            release.set()
+
+        self.assertEqual(result, {"flow": FLOWS_RESULT, "intelligence": None})
+        # Partial results are not cached, so the next keystroke retries.
+        use_case.execute(self.project, "slow")
+        self.assertEqual(self.flows_client.get_project_flows.call_count, 2)
+
+    def test_returns_partial_result_when_a_backend_fails(self):
+        self.flows_client.get_project_flows.side_effect = ConnectionError("down")
+
+        result = self.build_use_case().execute(self.project, "error")
+
+        self.assertEqual(result, {"flow": None, "intelligence": INTELLIGENCE_RESULT})
@@ -1,12 +1,82 @@
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+
 from connect.authentication.models import User
+from connect.common.counters import ProjectCounters
 from connect.common.models import RecentActivity
 from connect.usecases.recent_activities.exceptions import InvalidActionEntityCombination
+from connect.usecases.recent_activities.identity_cache import identity_cache
 
 
 class RecentActivityUseCase:
-    def create_recent_activity(self, msg_body) -> RecentActivity:
-        user = User.objects.get(email=msg_body.get("user"))
+    def create_recent_activity(self, msg_body, counters=None) -> RecentActivity:
+        user = self._get_user(msg_body.get("user"))
+        self._validate(msg_body)
+
+        new_activity = RecentActivity.create_recent_activities(
+            msg_body, user, counters=counters
+        )
+        return new_activity
+
+    def create_recent_activities(self, msg_bodies: List) -> List[Optional[Exception]]:
+        """Record a batch of events with one set of writes.
+
+        Users and projects come from the identity cache, which queries only
+        what it misses. The activities of every valid event are saved with a
+        single ``bulk_create`` and counter flush in one transaction. If that
+        write fails (e.g. a project deleted while still cached), each event
+        is written again in its own transaction, so only the events that
+        fail on their own are reported. Returns, for each event, the
+        exception that made it invalid or None; invalid events write nothing.
+        """
+        users = identity_cache.get_users(
+            msg_body.get("user") for msg_body in msg_bodies
+        )
+        built = []
+        errors = []
+        for msg_body in msg_bodies:
+            try:
+                user = users.get(msg_body.get("user"))
+                if user is None:
+                    raise User.DoesNotExist("User matching query does not exist.")
+                self._validate(msg_body)
+                counters = ProjectCounters()
+                activities = RecentActivity.build_recent_activities(
+                    msg_body, user, counters, identity_cache=identity_cache
+                )
+                built.append((len(errors), activities, counters))
+                errors.append(None)
+            except Exception as exception:
+                errors.append(exception)
 
+        try:
+            self._save([(activities, counters) for _, activities, counters in built])
+        except Exception:
+            for index, activities, counters in built:
+                try:
+                    self._save([(activities, counters)])
+                except Exception as exception:
+                    errors[index] = exception
+        return errors
+
+    def _save(self, events: List[Tuple[List[RecentActivity], ProjectCounters]]):
+        counters = ProjectCounters()
+        recent_activities = []
+        for event_activities, event_counters in events:
+            recent_activities.extend(event_activities)
+            counters.merge(event_counters)
+        with transaction.atomic():
+            RecentActivity.objects.bulk_create(recent_activities)
+            counters.flush()
+
+    def _get_user(self, email) -> User:
+        user = identity_cache.get_users([email]).get(email)
+        if user is None:
+            raise User.DoesNotExist("User matching query does not exist.")
+        return user
+
+    def _validate(self, msg_body) -> None:
         action = msg_body.get("action")
         entity = msg_body.get("entity")
 
@@ -15,8 +85,5 @@ class RecentActivityUseCase:
                 f"Invalid combination of action '{action}' and entity '{entity}'"
             )
 
-        new_activity = RecentActivity.create_recent_activities(msg_body, user)
-        return new_activity
-
     def _is_valid_action_entity_combination(self, action, entity):
         return entity in RecentActivity.ACTIONS.get(action, [])
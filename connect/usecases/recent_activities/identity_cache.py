@@ -0,0 +1,110 @@
+"""Per-process cache of the users and projects named by EDA events.
+
+Recent-activity bursts come from a small set of users and projects, so the
+consumer keeps ``email -> User`` and ``flow_organization -> Project`` in a
+bounded in-process LRU. Saves and deletes in the same process drop entries
+through signals; changes made by other processes (the API) are picked up
+once the short TTL expires. Misses are never cached.
+
+Lookups are counted per kind and result, and the hit ratio is published
+when the consumer finishes a message (``message_finished``).
+"""
+
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from prometheus_client import Counter, Gauge
+
+from connect.authentication.models import User
+from connect.common.models import Project
+from connect.usecases.project.get_project_plan_status import LocalLRUCache
+
+IDENTITY_CACHE_LOOKUPS = Counter(
+    "connect_eda_identity_cache_lookups_total",
+    "EDA consumer identity lookups by kind (user, project) and result.",
+    ["kind", "result"],
+)
+IDENTITY_CACHE_HIT_RATIO = Gauge(
+    "connect_eda_identity_cache_hit_ratio",
+    "Share of EDA consumer identity lookups answered by the cache.",
+    ["kind"],
+)
+
+USER = "user"
+PROJECT = "project"
+
+
+class IdentityCache:
+    """Resolve event users and projects, remembering them for a short TTL."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._users = LocalLRUCache(maxsize=maxsize, ttl=ttl)
+        self._projects = LocalLRUCache(maxsize=maxsize, ttl=ttl)
+        self._stats = {USER: [0, 0], PROJECT: [0, 0]}
+
+    def _count(self, kind: str, hits: int, misses: int) -> None:
+        self._stats[kind][0] += hits
+        self._stats[kind][1] += misses
+        if hits:
+            IDENTITY_CACHE_LOOKUPS.labels(kind, "hit").inc(hits)
+        if misses:
+            IDENTITY_CACHE_LOOKUPS.labels(kind, "miss").inc(misses)
+
+    def get_users(self, emails: Iterable[str]) -> Dict[str, User]:
+        """Return ``{email: user}``; unknown emails are left out."""
+        users = {}
+        missing = []
+        for email in set(emails):
+            user = self._users.get(email)
+            if user is None:
+                missing.append(email)
+            else:
+                users[email] = user
+        self._count(USER, len(users), len(missing))
+
+        if missing:
+            for user in User.objects.filter(email__in=missing):
+                self._users.set(user.email, user)
+                users[user.email] = user
+        return users
+
+    def get_project_by_flow_organization(self, flow_organization) -> Optional[Project]:
+        key = str(flow_organization)
+        project = self._projects.get(key)
+        self._count(PROJECT, int(project is not None), int(project is None))
+
+        if project is None:
+            project = Project.objects.filter(
+                flow_organization=flow_organization
+            ).first()
+            if project is not None:
+                self._projects.set(key, project)
+        return project
+
+    def invalidate_user(self, user) -> None:
+        self._users.delete_many([user.email])
+
+    def invalidate_project(self, project) -> None:
+        if project.flow_organization:
+            self._projects.delete_many([str(project.flow_organization)])
+
+    def hit_ratio(self, kind: str) -> float:
+        hits, misses = self._stats[kind]
+        total = hits + misses
+        return hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._projects.clear()
+        self._stats = {USER: [0, 0], PROJECT: [0, 0]}
+
+
+identity_cache = IdentityCache(
+    maxsize=getattr(settings, "EDA_IDENTITY_CACHE_MAXSIZE", 5000),
+    ttl=getattr(settings, "EDA_IDENTITY_CACHE_TTL", 60),
+)
+
+
+def report_identity_cache_stats(sender=None, **kwargs) -> None:
+    for kind in (USER, PROJECT):
+        IDENTITY_CACHE_HIT_RATIO.labels(kind).set(identity_cache.hit_ratio(kind))
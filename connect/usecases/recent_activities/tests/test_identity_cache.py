@@ -0,0 +1,81 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from connect.api.v1.tests.utils import create_user_and_token
+from connect.common.mocks import StripeMockGateway
+from connect.common.models import BillingPlan, Organization, Project
+from connect.usecases.recent_activities.identity_cache import (
+    PROJECT,
+    USER,
+    identity_cache,
+)
+
+
+class IdentityCacheTestCase(TestCase):
+    @patch("connect.billing.get_gateway")
+    def setUp(self, mock_get_gateway):
+        mock_get_gateway.return_value = StripeMockGateway()
+        identity_cache.clear()
+        self.user, _ = create_user_and_token("identity")
+        organization = Organization.objects.create(
+            name="Identity organization",
+            inteligence_organization=1,
+            organization_billing__cycle=BillingPlan.BILLING_CYCLE_MONTHLY,
+            organization_billing__plan=BillingPlan.PLAN_ENTERPRISE,
+        )
+        self.project = Project.objects.create(
+            name="Identity project",
+            flow_organization=uuid.uuid4(),
+            organization=organization,
+        )
+        identity_cache.clear()
+
+    def tearDown(self):
+        identity_cache.clear()
+
+    def test_users_are_queried_once(self):
+        with self.assertNumQueries(1):
+            users = identity_cache.get_users([self.user.email, "nobody@user.com"])
+        with self.assertNumQueries(0):
+            cached = identity_cache.get_users([self.user.email])
+
+        self.assertEqual(users, {self.user.email: self.user})
+        self.assertEqual(cached, {self.user.email: self.user})
+        self.assertEqual(identity_cache.hit_ratio(USER), 1 / 3)
+
+    def test_misses_are_not_cached(self):
+        identity_cache.get_users(["nobody@user.com"])
+
+        with self.assertNumQueries(1):
+            identity_cache.get_users(["nobody@user.com"])
+
+    def test_projects_are_queried_once(self):
+        flow_organization = self.project.flow_organization
+
+        with self.assertNumQueries(1):
+            project = identity_cache.get_project_by_flow_organization(flow_organization)
+        with self.assertNumQueries(0):
+            cached = identity_cache.get_project_by_flow_organization(
+                str(flow_organization)
+            )
+
+        self.assertEqual(project, self.project)
+        self.assertEqual(cached, self.project)
+        self.assertEqual(identity_cache.hit_ratio(PROJECT), 0.5)
+
+    def test_saves_invalidate_entries(self):
+        identity_cache.get_users([self.user.email])
+        identity_cache.get_project_by_flow_organization(self.project.flow_organization)
+
+        self.user.save()
+        self.project.save()
+
+        with self.assertNumQueries(2):
+            users = identity_cache.get_users([self.user.email])
+            project = identity_cache.get_project_by_flow_organization(
+                self.project.flow_organization
+            )
+        self.assertEqual(users, {self.user.email: self.user})
+        self.assertEqual(project, self.project)
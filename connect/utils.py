@@ -5,6 +5,7 @@ import requests
 from django.http import JsonResponse
 from django_redis import get_redis_connection
 
+from connect.billing.models import BILLING_TIMEZONE
 from connect.common.models import Project
 
 
@@ -44,11 +45,11 @@ def es_convert_datetime(before: str, after: str):
     return before, after
 
 
-def count_contacts(project: Project, before: str, after: str):
-    tz = pendulum.timezone("America/Maceio")
+def count_contacts(project: Project, before: str, after: str, exact: bool = False):
+    tz = pendulum.timezone(BILLING_TIMEZONE)
     after = pendulum.parse(after).in_timezone(tz)
     before = pendulum.parse(before).in_timezone(tz)
-    return project.get_contacts(before, after)
+    return project.get_contacts(before, after, exact=exact)
 
 
 def check_module_permission(claims, user):